@@ -2,6 +2,7 @@
 ASGI config for kingdomdeath project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+HTTP requests go to Django and WebSocket connections to the live session channel.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/4.2/howto/deployment/asgi/
@@ -13,4 +14,14 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'kingdomdeath.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+# Imported once Django is set up, as it uses the models
+from kingdomdeathapi.websocket import session_channel  # pylint: disable=wrong-import-position
+
+
+async def application(scope, receive, send):
+    if scope['type'] == 'websocket':
+        await session_channel(scope, receive, send)
+    else:
+        await django_application(scope, receive, send)
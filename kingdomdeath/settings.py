@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.2/ref/settings/
 """
 
+import multiprocessing
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -50,8 +51,43 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    'DEFAULT_RENDERER_CLASSES': (
+        'kingdomdeathapi.renderers.FastJSONRenderer',
+        'kingdomdeathapi.renderers.MessagePackRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        'kingdomdeathapi.parsers.FastJSONParser',
+        'kingdomdeathapi.parsers.MessagePackParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ),
 }
 
+# Serve the resource, survivor and settlement inventory lists from values() rows
+# instead of model serializers. The output is identical either way.
+FAST_SERIALIZATION = True
+
+# Responses smaller than this many bytes are not compressed
+COMPRESSION_MIN_SIZE = 1024
+
+# Worker processes for showdown simulations, one per CPU when None, and the fewest
+# showdowns worth sending to a worker. Smaller simulations run in the request.
+SIMULATION_WORKERS = None
+SIMULATION_CHUNK_SIZE = 2000
+# How the workers are started. Forking a server with threads running can copy locks that are held,
+# so they start from a fork server, or a fresh interpreter where there is none.
+SIMULATION_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+# Futures per chunk of a settlement projection, which share the simulation workers,
+# and the number of projection jobs remembered before the oldest are forgotten
+PROJECTION_CHUNK_SIZE = 500
+MAX_PROJECTION_JOBS = 100
+
+# Changes kept in each settlement's change log. Older ones are pruned as new ones are recorded,
+# and clients holding a version older than that have to fetch the settlement again.
+MAX_SETTLEMENT_CHANGES = 1000
+
 CORS_ORIGIN_WHITELIST = (
     'http://localhost:3000',
     'http://127.0.0.1:3000'
@@ -59,6 +95,7 @@ CORS_ORIGIN_WHITELIST = (
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'kingdomdeathapi.middleware.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -20,7 +20,9 @@ from django.conf import settings
 from django.conf.urls.static import static
 from rest_framework import routers
 from kingdomdeathapi.views import (
-    login_user, register_user, PlayerView, SettlementView, ResourceView, MilestoneTypeView, MilestoneView, AbilityView, DisorderView, EventView, FightingArtView, WeaponProficiencyView, SurvivorView, SettlementInventoryView, SettlementEventView, SessionView)
+    login_user, register_user, batch_requests, PlayerView, SettlementView, ResourceView, MilestoneTypeView, MilestoneView, AbilityView, DisorderView, EventView, FightingArtView, WeaponProficiencyView, SurvivorView, SettlementInventoryView, SettlementEventView, SessionView, CatalogView, SearchView, AutocompleteView, ProficiencyLevelView,
+    resource_list, resource_detail, settlement_list, settlement_detail, survivor_list, survivor_detail, simulate_showdown, projection_detail,
+    ability_list, disorder_list, fighting_art_list, weapon_proficiency_list, event_list)
 
 router = routers.DefaultRouter(trailing_slash=False)
 router.register(r'players', PlayerView, 'player')
@@ -37,10 +39,29 @@ router.register(r'survivors', SurvivorView, 'survivor')
 router.register(r'settlement_inventories', SettlementInventoryView, 'settlement_inventory')
 router.register(r'settlement_events', SettlementEventView, 'settlement_event')
 router.register(r'sessions', SessionView, 'session')
+router.register(r'catalog', CatalogView, 'catalog')
+router.register(r'search', SearchView, 'search')
+router.register(r'autocomplete', AutocompleteView, 'autocomplete')
+router.register(r'proficiency_levels', ProficiencyLevelView, 'proficiency_level')
 
 urlpatterns = [
     path('register', register_user),
     path('login', login_user),
+    path('batch', batch_requests),
+    path('simulations/showdown', simulate_showdown),
+    path('projections/<str:job_id>', projection_detail),
+    # Async variants of the busiest reads, for ASGI deployments
+    path('async/resources', resource_list),
+    path('async/resources/<int:pk>', resource_detail),
+    path('async/settlements', settlement_list),
+    path('async/settlements/<int:pk>', settlement_detail),
+    path('async/survivors', survivor_list),
+    path('async/survivors/<int:pk>', survivor_detail),
+    path('async/abilities', ability_list),
+    path('async/disorders', disorder_list),
+    path('async/fighting_arts', fighting_art_list),
+    path('async/weapon_proficiencies', weapon_proficiency_list),
+    path('async/events', event_list),
     path('admin/', admin.site.urls),
     path('', include(router.urls))
 ]
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class KingdomdeathapiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'kingdomdeathapi'
+
+    def ready(self):
+        # Connect the signal receivers
+        from kingdomdeathapi import signals  # pylint: disable=unused-import,import-outside-toplevel
@@ -0,0 +1,90 @@
+import random
+import time
+from contextlib import contextmanager
+from django.core.management import call_command
+from django.db import connection
+from kingdomdeathapi.models import (
+    Player, Resource, ResourceType, Survivor, Settlement, SettlementInventory, WeaponProficiency, FightingArt,
+    Disorder, Ability)
+
+CATALOG_FIXTURES = ['users', 'tokens', 'players', 'expansion_types', 'monsters', 'settlements', 'resource_types',
+                    'resources', 'events', 'milestone_types', 'weapon_proficiencies', 'fighting_arts', 'disorders',
+                    'abilities', 'impairments', 'campaign']
+
+
+@contextmanager
+def benchmark_database():
+    """
+    Summary:
+        Run a benchmark against a throwaway test database so the configured one is never touched.
+    """
+    old_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+    try:
+        call_command('loaddata', *CATALOG_FIXTURES, verbosity=0)
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+def seed(survivors=0, resources=0, inventories=0, seed_value=0):
+    """
+    Summary:
+        Add synthetic survivors, resources and inventory rows on top of the catalog fixtures.
+
+    Args:
+        survivors (int): Number of survivors to create, each with a few proficiencies, arts, disorders and abilities.
+        resources (int): Number of extra resources to create, each with one or two types.
+        inventories (int): Number of settlement inventory rows to create.
+        seed_value (int): Seed for the random generator so runs are comparable.
+    """
+    rng = random.Random(seed_value)
+    players = list(Player.objects.all())
+    type_ids = list(ResourceType.objects.values_list('id', flat=True))
+
+    created = Resource.objects.bulk_create(
+        Resource(name=f'Resource {i}', consumable=rng.random() < 0.2, monster=rng.random() < 0.5,
+                 flavor_text='Benchmark flavor text.', effect='Benchmark effect.')
+        for i in range(resources))
+    Resource.type.through.objects.bulk_create(
+        Resource.type.through(resource_id=resource.id, resourcetype_id=type_id)
+        for resource in created for type_id in rng.sample(type_ids, rng.randint(1, 2)))
+
+    stats = ('survival', 'insanity', 'hunt_experience', 'movement', 'accuracy', 'strength', 'evasion', 'speed',
+             'luck', 'understanding', 'courage', 'head_armor', 'arm_armor', 'body_armor', 'waist_armor', 'leg_armor')
+    created = Survivor.objects.bulk_create(
+        Survivor(user=rng.choice(players), name=f'Survivor {i}', gender=rng.choice(('male', 'female')),
+                 **{stat: rng.randint(0, 5) for stat in stats})
+        for i in range(survivors))
+    for model, relation in ((WeaponProficiency, Survivor.weapon_proficiency), (FightingArt, Survivor.fighting_art),
+                            (Disorder, Survivor.disorder), (Ability, Survivor.ability)):
+        ids = list(model.objects.values_list('id', flat=True))
+        through = relation.through
+        column = f'{model._meta.model_name}_id'
+        through.objects.bulk_create(
+            through(survivor_id=survivor.id, **{column: related_id})
+            for survivor in created for related_id in rng.sample(ids, rng.randint(0, 3)))
+
+    settlement_ids = list(Settlement.objects.values_list('id', flat=True))
+    resource_ids = list(Resource.objects.values_list('id', flat=True))
+    SettlementInventory.objects.bulk_create(
+        SettlementInventory(settlement_id=rng.choice(settlement_ids), resource_id=rng.choice(resource_ids),
+                            amount=rng.randint(1, 5))
+        for _ in range(inventories))
+
+
+def timed(function, repeat):
+    """
+    Summary:
+        Time a function over several runs.
+
+    Returns:
+        float: The best run time in milliseconds.
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
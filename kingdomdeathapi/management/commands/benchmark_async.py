@@ -0,0 +1,96 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand
+from rest_framework.authtoken.models import Token
+from ._benchmark import benchmark_database, seed
+
+
+class Command(BaseCommand):
+    help = 'Compare concurrent read throughput of the WSGI deployment on a thread pool and the ASGI deployment'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=200, help='Synthetic survivors to add')
+        parser.add_argument('--requests', type=int, default=400, help='Requests per measurement')
+        parser.add_argument('--concurrency', type=int, default=16, help='Requests in flight at once')
+
+    def handle(self, *args, **options):
+        total = options['requests']
+        concurrency = options['concurrency']
+
+        with benchmark_database():
+            seed(survivors=options['rows'])
+            token = Token.objects.first().key
+
+            runs = (
+                ('wsgi threads', '/survivors', lambda path: self.wsgi(token, path, total, concurrency)),
+                ('asgi', '/survivors', lambda path: self.asgi(token, path, total, concurrency)),
+                ('asgi', '/async/survivors', lambda path: self.asgi(token, path, total, concurrency)),
+                ('wsgi threads', '/settlements/2', lambda path: self.wsgi(token, path, total, concurrency)),
+                ('asgi', '/settlements/2', lambda path: self.asgi(token, path, total, concurrency)),
+                ('asgi', '/async/settlements/2', lambda path: self.asgi(token, path, total, concurrency)),
+            )
+
+            self.stdout.write(f"{'server':<14}{'path':<24}{'requests/s':>12}{'errors':>8}")
+            for server, path, run in runs:
+                start = time.perf_counter()
+                statuses = run(path)
+                elapsed = time.perf_counter() - start
+                errors = sum(1 for code in statuses if code != 200)
+                self.stdout.write(f"{server:<14}{path:<24}{total / elapsed:>12.0f}{errors:>8}")
+
+    @staticmethod
+    def wsgi(token, path, total, concurrency):
+        handler = WSGIHandler()
+
+        def get(_):
+            environ = {
+                'REQUEST_METHOD': 'GET', 'PATH_INFO': path, 'QUERY_STRING': '', 'SERVER_NAME': 'localhost',
+                'SERVER_PORT': '80', 'HTTP_HOST': 'localhost', 'HTTP_AUTHORIZATION': f'Token {token}',
+                'wsgi.input': BytesIO(), 'wsgi.url_scheme': 'http',
+            }
+            started = []
+            b''.join(handler(environ, lambda status, headers, exc_info=None: started.append(status)))
+            return int(started[0].split()[0])
+
+        with ThreadPoolExecutor(concurrency) as pool:
+            return list(pool.map(get, range(total)))
+
+    @staticmethod
+    def asgi(token, path, total, concurrency):
+        handler = ASGIHandler()
+
+        async def get(slots):
+            async with slots:
+                scope = {
+                    'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': 'GET',
+                    'scheme': 'http', 'path': path, 'raw_path': path.encode(), 'query_string': b'',
+                    'headers': [(b'host', b'localhost'), (b'authorization', f'Token {token}'.encode())],
+                    'server': ('localhost', 80), 'client': ('127.0.0.1', 50000),
+                }
+                body_sent = asyncio.Event()
+                disconnected = asyncio.Event()
+                messages = []
+
+                async def receive():
+                    if not body_sent.is_set():
+                        body_sent.set()
+                        return {'type': 'http.request', 'body': b'', 'more_body': False}
+                    # The client stays connected until the handler finishes
+                    await disconnected.wait()
+                    return {'type': 'http.disconnect'}
+
+                async def send(message):
+                    messages.append(message)
+
+                await handler(scope, receive, send)
+                return messages[0]['status']
+
+        async def run():
+            slots = asyncio.Semaphore(concurrency)
+            return await asyncio.gather(*(get(slots) for _ in range(total)))
+
+        return asyncio.run(run())
@@ -0,0 +1,41 @@
+from io import BytesIO
+from django.core.management.base import BaseCommand
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from kingdomdeathapi.models import Resource, Survivor
+from kingdomdeathapi.parsers import FastJSONParser, MessagePackParser
+from kingdomdeathapi.renderers import FastJSONRenderer, MessagePackRenderer
+from kingdomdeathapi.views.resource import ResourceFlatSerializer
+from kingdomdeathapi.views.survivor import SurvivorFlatSerializer
+from ._benchmark import benchmark_database, seed, timed
+
+
+class Command(BaseCommand):
+    help = 'Compare payload size and encode/decode time of JSON and MessagePack for survivor and resource lists'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=1000, help='Synthetic rows to add per table')
+        parser.add_argument('--repeat', type=int, default=20, help='Runs per measurement, the best is reported')
+
+    def handle(self, *args, **options):
+        repeat = options['repeat']
+        formats = (
+            ('json (drf)', JSONRenderer(), JSONParser()),
+            ('json (orjson)', FastJSONRenderer(), FastJSONParser()),
+            ('msgpack', MessagePackRenderer(), MessagePackParser()),
+        )
+
+        with benchmark_database():
+            seed(survivors=options['rows'], resources=options['rows'])
+            payloads = (
+                ('survivors', SurvivorFlatSerializer(Survivor.objects.all()).data),
+                ('resources', ResourceFlatSerializer(Resource.objects.all()).data),
+            )
+
+        self.stdout.write(f"{'list':<12}{'format':<16}{'bytes':>10}{'encode ms':>12}{'decode ms':>12}")
+        for name, data in payloads:
+            for label, renderer, parser in formats:
+                body = renderer.render(data)
+                encode_ms = timed(lambda: renderer.render(data), repeat)
+                decode_ms = timed(lambda: parser.parse(BytesIO(body)), repeat)
+                self.stdout.write(f"{name:<12}{label:<16}{len(body):>10}{encode_ms:>12.2f}{decode_ms:>12.2f}")
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+from rest_framework.renderers import JSONRenderer
+from kingdomdeathapi.models import Resource, Survivor, SettlementInventory
+from kingdomdeathapi.views.resource import ResourceSerializer, ResourceFlatSerializer
+from kingdomdeathapi.views.survivor import SurvivorSerializer, SurvivorFlatSerializer
+from kingdomdeathapi.views.settlement_inventory import SettlementInventorySerializer, SettlementInventoryFlatSerializer
+from ._benchmark import benchmark_database, seed, timed
+
+
+class Command(BaseCommand):
+    help = 'Compare the model serializers with the flat serializers on the hot list endpoints'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=1000, help='Synthetic rows to add per table')
+        parser.add_argument('--repeat', type=int, default=5, help='Runs per measurement, the best is reported')
+
+    def handle(self, *args, **options):
+        rows = options['rows']
+        repeat = options['repeat']
+        renderer = JSONRenderer()
+
+        with benchmark_database():
+            seed(survivors=rows, resources=rows, inventories=rows)
+
+            cases = (
+                ('resources', ResourceSerializer, ResourceFlatSerializer,
+                 Resource.objects.select_related('monster_origin', 'expansion').prefetch_related('type')),
+                ('survivors', SurvivorSerializer, SurvivorFlatSerializer,
+                 Survivor.objects.select_related('user__user').prefetch_related(
+                     'weapon_proficiency', 'fighting_art', 'disorder', 'ability').order_by('id')),
+                ('settlement_inventories', SettlementInventorySerializer, SettlementInventoryFlatSerializer,
+                 SettlementInventory.objects.select_related('resource').prefetch_related('resource__type').order_by('id')),
+            )
+
+            self.stdout.write(f"{'endpoint':<24}{'rows':>8}{'model ms':>12}{'flat ms':>12}{'speedup':>10}")
+            for name, serializer, flat_serializer, queryset in cases:
+                model_ms = timed(lambda: renderer.render(serializer(queryset.all(), many=True).data), repeat)
+                flat_ms = timed(lambda: renderer.render(flat_serializer(queryset.all()).data), repeat)
+                self.stdout.write(
+                    f"{name:<24}{queryset.count():>8}{model_ms:>12.1f}{flat_ms:>12.1f}{model_ms / flat_ms:>9.1f}x")
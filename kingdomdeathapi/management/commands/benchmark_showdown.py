@@ -0,0 +1,32 @@
+import time
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+from kingdomdeathapi.models import Monster, Survivor
+from kingdomdeathapi.utils import SURVIVOR_FIELDS, monster_profile, simulate_showdowns
+from ._benchmark import benchmark_database, seed
+
+
+class Command(BaseCommand):
+    help = 'Measure simulated showdowns per second in one process and across the worker pool'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=100000, help='Showdowns per measurement')
+        parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4], help='Worker counts to measure')
+
+    def handle(self, *args, **options):
+        runs = options['runs']
+        with benchmark_database():
+            seed(survivors=4)
+            party = list(Survivor.objects.order_by('-id').values(*SURVIVOR_FIELDS)[:4])
+            monster = Monster.objects.get(name='White Lion')
+        profile = monster_profile(monster)
+
+        self.stdout.write(f"{'workers':<10}{'showdowns/s':>14}{'win rate':>10}")
+        for workers in options['workers']:
+            with override_settings(SIMULATION_WORKERS=workers):
+                # Warm the pool up so starting processes is not measured
+                simulate_showdowns(party, profile, runs, seed=0)
+                start = time.perf_counter()
+                result = simulate_showdowns(party, profile, runs, seed=1)
+                elapsed = time.perf_counter() - start
+            self.stdout.write(f"{workers:<10}{runs / elapsed:>14.0f}{result['win_rate']:>10.3f}")
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand, CommandError
+from kingdomdeathapi.utils import check_resource_totals
+
+
+class Command(BaseCommand):
+    help = "Check the settlements' resource type totals against their inventories"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--settlement', type=int, nargs='+', help='Settlements to check, all of them by default')
+
+    def handle(self, *args, **options):
+        mismatches = check_resource_totals(options['settlement'])
+        for settlement, resource_type, expected, actual in mismatches:
+            self.stdout.write(f'Settlement {settlement}, resource type {resource_type}: expected {expected}, found {actual}')
+        if mismatches:
+            raise CommandError(f'{len(mismatches)} resource type totals are out of step, run rebuild_resource_totals to fix them')
+        self.stdout.write('Resource type totals are in step with the inventories')
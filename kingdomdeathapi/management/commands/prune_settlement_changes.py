@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from kingdomdeathapi.utils import prune_changes
+
+
+class Command(BaseCommand):
+    help = "Drop changes older than the last MAX_SETTLEMENT_CHANGES of each settlement's change log"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--settlement', type=int, nargs='+', help='Settlements to prune, all of them by default')
+
+    def handle(self, *args, **options):
+        dropped = prune_changes(options['settlement'])
+        self.stdout.write(f'Dropped {dropped} settlement changes')
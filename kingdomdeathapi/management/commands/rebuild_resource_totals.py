@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from kingdomdeathapi.utils import rebuild_resource_totals
+
+
+class Command(BaseCommand):
+    help = "Rebuild the settlements' resource type totals from their inventories"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--settlement', type=int, nargs='+', help='Settlements to rebuild, all of them by default')
+
+    def handle(self, *args, **options):
+        written = rebuild_resource_totals(options['settlement'])
+        self.stdout.write(f'Wrote {written} resource type totals')
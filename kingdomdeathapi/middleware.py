@@ -0,0 +1,152 @@
+import gzip
+import hashlib
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.http import urlencode
+from kingdomdeathapi.utils import catalog_version, filter_registry, is_catalog_path
+from kingdomdeathapi.views.resource import PLAIN_PARAMS
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Summary:
+        Compresses responses with brotli or gzip, whichever the client prefers.
+        Responses smaller than COMPRESSION_MIN_SIZE are sent as they are.
+
+        Catalog responses only change with the catalog version, so they are compressed once
+        at the highest level and the compressed body is reused from the cache until the
+        catalog changes. They are cached by path and the parameters the catalog endpoints read,
+        in a fixed order; a query with any other parameter is compressed but not cached.
+
+        Responses tied to cookies are not compressed at all. BREACH recovers a secret from the
+        size of compressed responses to requests a victim's browser is made to send with input
+        an attacker chooses. Browsers attach cookies to those requests, but never the
+        Authorization header the API's tokens travel in, so the admin's session and CSRF
+        tokens are the secrets left to protect.
+    """
+
+    def process_request(self, request):
+        # Taken before the view runs so a catalog write during the request can only make the cached body newer.
+        # The version is read once per request, so the view's own reads of it cost no further query.
+        if request.method == 'GET' and is_catalog_path(request.path):
+            request.catalog_version = catalog_version()
+
+    def process_response(self, request, response):
+        if response.streaming or response.has_header('Content-Encoding') or self.uses_cookies(request, response):
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        if len(response.content) < settings.COMPRESSION_MIN_SIZE:
+            return response
+
+        encoding = negotiate_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        if encoding is None:
+            return response
+
+        query = self.cache_query(request) if hasattr(request, 'catalog_version') else None
+        if request.method == 'GET' and response.status_code == 200 and is_catalog_path(request.path) and query is not None:
+            content = self.cached_compress(request, response, encoding, query)
+        else:
+            content = compress(response.content, encoding, best=False)
+
+        if len(content) >= len(response.content):
+            return response
+
+        response.content = content
+        response['Content-Length'] = str(len(content))
+        response['Content-Encoding'] = encoding
+
+        # The compressed body is no longer byte for byte what a strong ETag promised
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
+        return response
+
+    @staticmethod
+    def uses_cookies(request, response):
+        return bool(response.cookies) or settings.SESSION_COOKIE_NAME in request.COOKIES \
+            or settings.CSRF_COOKIE_NAME in request.COOKIES
+
+    @staticmethod
+    def cache_query(request):
+        # The query string with its parameters in order, or None if it has any the catalog endpoints do not read
+        if request.GET:
+            registry = filter_registry()
+            known = PLAIN_PARAMS | {f'{slug}_exp' for slug in registry.expansions} \
+                | set(registry.resource_types) | set(registry.monsters)
+            if not set(request.GET) <= known:
+                return None
+        return urlencode(sorted(request.GET.lists()), doseq=True)
+
+    @staticmethod
+    def cached_compress(request, response, encoding, query):
+        path = '/' + request.path.strip('/')
+        key = f"kingdomdeathapi:compressed:{request.catalog_version}:{encoding}:{response.get('Content-Type')}:{path}?{query}"
+        digest = hashlib.sha1(response.content).digest()
+
+        cached = cache.get(key)
+        if cached is not None and cached[0] == digest:
+            return cached[1]
+
+        content = compress(response.content, encoding, best=True)
+        cache.set(key, (digest, content), timeout=None)
+        return content
+
+
+def negotiate_encoding(accept_encoding):
+    """
+    Summary:
+        Pick the content encoding to use from an Accept-Encoding header.
+
+    Args:
+        accept_encoding (str): The Accept-Encoding header, e.g. "gzip, br;q=0.9".
+
+    Returns:
+        str: "br" or "gzip", or None if the client accepts neither.
+    """
+    available = ('br', 'gzip') if brotli is not None else ('gzip',)
+    weights = {}
+    for part in accept_encoding.split(','):
+        name, _, params = part.strip().partition(';')
+        weight = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[name.strip().lower()] = weight
+
+    best = None
+    for name in available:
+        weight = weights.get(name, weights.get('*', 0.0))
+        # Earlier entries win ties, so brotli is preferred when it is available
+        if weight > 0 and (best is None or weight > best[1]):
+            best = (name, weight)
+    return best[0] if best else None
+
+
+def compress(content, encoding, best):
+    """
+    Summary:
+        Compress a response body.
+
+    Args:
+        content (bytes): The body to compress.
+        encoding (str): "br" or "gzip".
+        best (bool): Use the slowest, smallest setting, for bodies that are compressed once and reused.
+
+    Returns:
+        bytes: The compressed body.
+    """
+    if encoding == 'br':
+        return brotli.compress(content, quality=11 if best else 5)
+    return gzip.compress(content, compresslevel=9 if best else 6, mtime=0)
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.6 on 2026-10-19 16:28
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kingdomdeathapi', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='resource',
+            name='vermin',
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.6 on 2026-10-19 16:47
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kingdomdeathapi', '0002_remove_resource_vermin'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='settlement',
+            name='version',
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.CreateModel(
+            name='SettlementChange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveBigIntegerField()),
+                ('model', models.CharField(max_length=50)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('op', models.CharField(max_length=10)),
+                ('settlement', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='changes', to='kingdomdeathapi.settlement')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('settlement', 'version'), name='unique_settlement_change_version')],
+            },
+        ),
+    ]
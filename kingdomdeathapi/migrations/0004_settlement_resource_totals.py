@@ -0,0 +1,39 @@
+# Generated by Django 4.2.6 on 2026-10-19 21:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Sum
+
+
+def build_totals(apps, schema_editor):
+    SettlementInventory = apps.get_model('kingdomdeathapi', 'SettlementInventory')
+    SettlementResourceTotal = apps.get_model('kingdomdeathapi', 'SettlementResourceTotal')
+    rows = SettlementInventory.objects.filter(resource__type__isnull=False) \
+        .values('settlement_id', 'resource__type').annotate(total=Sum('amount')).order_by()
+    SettlementResourceTotal.objects.bulk_create([
+        SettlementResourceTotal(settlement_id=row['settlement_id'], resource_type_id=row['resource__type'], total=row['total'])
+        for row in rows if row['total']
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kingdomdeathapi', '0003_settlement_version_changes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SettlementResourceTotal',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total', models.IntegerField(default=0)),
+                ('resource_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='settlement_totals', to='kingdomdeathapi.resourcetype')),
+                ('settlement', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='resource_totals', to='kingdomdeathapi.settlement')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('settlement', 'resource_type'), name='unique_settlement_resource_total')],
+            },
+        ),
+        migrations.RunPython(build_totals, migrations.RunPython.noop),
+    ]
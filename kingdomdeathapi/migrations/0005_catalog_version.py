@@ -0,0 +1,27 @@
+# Generated by Django 4.2.6 on 2026-10-19 22:05
+
+import time
+from django.db import migrations, models
+
+
+def create_version(apps, schema_editor):
+    CatalogVersion = apps.get_model('kingdomdeathapi', 'CatalogVersion')
+    CatalogVersion.objects.get_or_create(pk=1, defaults={'version': time.time_ns() // 1000})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kingdomdeathapi', '0004_settlement_resource_totals'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CatalogVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveBigIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(create_version, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.6 on 2026-10-19 23:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kingdomdeathapi', '0005_catalog_version'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='settlement',
+            name='version',
+            field=models.PositiveBigIntegerField(default=0, editable=False),
+        ),
+    ]
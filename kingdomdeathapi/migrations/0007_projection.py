@@ -0,0 +1,29 @@
+# Generated by Django 4.2.6 on 2026-10-19 23:40
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kingdomdeathapi', '0006_settlement_version_not_editable'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Projection',
+            fields=[
+                ('id', models.CharField(max_length=32, primary_key=True, serialize=False)),
+                ('status', models.CharField(default='running', max_length=10)),
+                ('progress', models.FloatField(default=0)),
+                ('message', models.TextField(blank=True, default='')),
+                ('result', models.JSONField(null=True)),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('owner', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='projections', to=settings.AUTH_USER_MODEL)),
+                ('settlement', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='projections', to='kingdomdeathapi.settlement')),
+            ],
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 4.2.6 on 2026-10-19 23:40
+
+from django.db import migrations
+
+# The searchable models in the order of their kind index, and the fields joined as the card body
+SEARCH_KINDS = (
+    ('Ability', ('effect',)),
+    ('Disorder', ('flavor_text', 'effect')),
+    ('FightingArt', ('effect',)),
+    ('WeaponProficiency', ('specialist_effect', 'master_effect')),
+    ('Resource', ('effect', 'flavor_text')),
+    ('Impairment', ('effect',)),
+)
+
+
+def has_fts5(connection):
+    if connection.vendor != 'sqlite':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute('PRAGMA compile_options')
+        return 'ENABLE_FTS5' in {option for option, in cursor.fetchall()}
+
+
+def create_search_index(apps, schema_editor):
+    # Without FTS5 there is no search, rather than a migration that cannot run
+    if not has_fts5(schema_editor.connection):
+        return
+    schema_editor.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS kingdomdeathapi_search USING fts5(name, body, tokenize='porter unicode61')")
+
+    rows = []
+    for index, (model_name, fields) in enumerate(SEARCH_KINDS):
+        model = apps.get_model('kingdomdeathapi', model_name)
+        for pk, name, *texts in model.objects.values_list('pk', 'name', *fields):
+            rows.append((pk * len(SEARCH_KINDS) + index, name, '\n'.join(text for text in texts if text)))
+    with schema_editor.connection.cursor() as cursor:
+        cursor.executemany("INSERT INTO kingdomdeathapi_search (rowid, name, body) VALUES (%s, %s, %s)", rows)
+
+
+def drop_search_index(apps, schema_editor):
+    if has_fts5(schema_editor.connection):
+        schema_editor.execute("DROP TABLE IF EXISTS kingdomdeathapi_search")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kingdomdeathapi', '0007_projection'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -17,4 +17,8 @@ from .expansion_type import ExpansionType
 from .impairment import Impairment
 from .campaign import Campaign
 from .proficiency_level import ProficiencyLevel
-from .monster import Monster
\ No newline at end of file
+from .monster import Monster
+from .settlement_change import SettlementChange
+from .settlement_resource_total import SettlementResourceTotal
+from .catalog_version import CatalogVersion
+from .projection import Projection
@@ -0,0 +1,5 @@
+from django.db import models
+
+class CatalogVersion(models.Model):
+    # A single row holding the catalog version, so every worker process sees the same one
+    version = models.PositiveBigIntegerField(default=0)
@@ -0,0 +1,13 @@
+from django.conf import settings
+from django.db import models
+
+class Projection(models.Model):
+    # A settlement projection, kept in the database so any worker process can report on it
+    id = models.CharField(max_length=32, primary_key=True)
+    owner = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="projections")
+    settlement = models.ForeignKey("Settlement", on_delete=models.CASCADE, related_name="projections")
+    status = models.CharField(max_length=10, default="running")
+    progress = models.FloatField(default=0)
+    message = models.TextField(blank=True, default="")
+    result = models.JSONField(null=True)
+    created = models.DateTimeField(auto_now_add=True)
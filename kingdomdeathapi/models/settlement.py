@@ -4,4 +4,15 @@ class Settlement(models.Model):
     name = models.CharField(max_length=50)
     survival_limit = models.IntegerField()
     population = models.IntegerField()
-    game_master = models.ForeignKey("Player", on_delete=models.CASCADE, related_name="settlements")
\ No newline at end of file
+    game_master = models.ForeignKey("Player", on_delete=models.CASCADE, related_name="settlements")
+    # Only ever moved on by the change log, see utils.changes.record_changes
+    version = models.PositiveBigIntegerField(default=0, editable=False)
+
+    def save(self, *args, **kwargs):
+        # A loaded copy may hold an old version, so saving an existing settlement never writes it back
+        if not self._state.adding:
+            fields = kwargs.get('update_fields')
+            if fields is None:
+                fields = [field.name for field in self._meta.concrete_fields if not field.primary_key]
+            kwargs['update_fields'] = [field for field in fields if field != 'version']
+        super().save(*args, **kwargs)
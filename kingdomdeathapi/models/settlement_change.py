@@ -0,0 +1,14 @@
+from django.db import models
+
+class SettlementChange(models.Model):
+    # Changes are recorded while a deleted settlement's rows cascade, so the settlement may be gone when they are written
+    settlement = models.ForeignKey("Settlement", on_delete=models.DO_NOTHING, db_constraint=False, related_name="changes")
+    version = models.PositiveBigIntegerField()
+    model = models.CharField(max_length=50)
+    object_id = models.PositiveBigIntegerField()
+    op = models.CharField(max_length=10)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["settlement", "version"], name="unique_settlement_change_version"),
+        ]
@@ -1,6 +1,11 @@
-from django.db import models
+from django.db import models, transaction
 
 class SettlementInventory(models.Model):
     settlement = models.ForeignKey("Settlement", on_delete=models.CASCADE, related_name="inventory")
     resource = models.ForeignKey("Resource", on_delete=models.CASCADE, related_name="inventory")
-    amount = models.IntegerField()
\ No newline at end of file
+    amount = models.IntegerField()
+
+    def save(self, *args, **kwargs):
+        # The resource type totals are adjusted by the save signals, which this keeps in the same transaction
+        with transaction.atomic():
+            super().save(*args, **kwargs)
@@ -0,0 +1,12 @@
+from django.db import models
+
+class SettlementResourceTotal(models.Model):
+    # The amount of a settlement's inventory of each resource type, kept in step with SettlementInventory
+    settlement = models.ForeignKey("Settlement", on_delete=models.CASCADE, related_name="resource_totals")
+    resource_type = models.ForeignKey("ResourceType", on_delete=models.CASCADE, related_name="settlement_totals")
+    total = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["settlement", "resource_type"], name="unique_settlement_resource_total"),
+        ]
@@ -0,0 +1,59 @@
+import msgpack
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_encoder = JSONEncoder()
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    Summary:
+        Renders JSON with orjson, producing the same document as DRF's JSONRenderer in compact form.
+        Falls back to DRF's renderer when orjson is not installed, indented output is requested,
+        or orjson cannot encode the data, such as integers wider than 64 bits.
+
+        The bytes differ from DRF's for some floats: exponents are written without a sign or
+        zero padding (1e16 rather than 1e+16), and NaN and infinity render as null where DRF
+        refuses to render them.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if data is None:
+            return b''
+
+        try:
+            # Datetimes go through DRF's encoder so they keep its formatting
+            ret = orjson.dumps(data, default=_encoder.default,
+                               option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Escape the line and paragraph separators like DRF does, they are valid JSON but not valid javascript
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    Summary:
+        Renders responses as MessagePack, selected with `Accept: application/msgpack`.
+        Values are converted with DRF's JSON encoder so the payload has the same structure as the JSON one.
+    """
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return msgpack.packb(data, default=_encoder.default, use_bin_type=True)
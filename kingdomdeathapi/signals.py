@@ -0,0 +1,121 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+from kingdomdeathapi.models import Resource, Session, Settlement, SettlementChange, SettlementInventory, Survivor
+from kingdomdeathapi.utils import (
+    CATALOG_MODELS, LIVE_MODELS, SEARCH_MODELS, adjust_resource_totals, bump_catalog_version, index_instance,
+    publish_change, rebuild_resource_totals, record_change, search_available, unindex_instance)
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def catalog_changed(sender, **kwargs):
+    '''Moves to a new catalog version whenever a catalog table is written, including fixture loads'''
+    if sender in CATALOG_MODELS:
+        bump_catalog_version()
+
+
+@receiver(m2m_changed, sender=Resource.type.through)
+def resource_types_changed(sender, action, **kwargs):
+    '''Moves to a new catalog version when a resource's types change'''
+    if action.startswith('post_'):
+        bump_catalog_version()
+
+
+@receiver(post_save)
+def search_index_saved(sender, instance, **kwargs):
+    '''Keeps the search row of a catalog card in step with the card, including fixture loads'''
+    if sender in SEARCH_MODELS and search_available():
+        index_instance(instance)
+
+
+@receiver(post_delete)
+def search_index_deleted(sender, instance, **kwargs):
+    '''Removes the search row of a deleted catalog card'''
+    if sender in SEARCH_MODELS and search_available():
+        unindex_instance(instance)
+
+
+@receiver(post_save)
+def settlement_data_saved(sender, instance, raw=False, **kwargs):
+    '''Records a write to settlement data in the change log and pushes it to live sessions'''
+    if sender in LIVE_MODELS and not raw:
+        record_change(instance, 'save')
+        publish_change(instance, 'save')
+
+
+@receiver(post_delete)
+def settlement_data_deleted(sender, instance, **kwargs):
+    '''Records a deletion of settlement data in the change log and pushes it to live sessions'''
+    if sender is Settlement:
+        # Changes recorded while the settlement's rows cascaded go with it
+        SettlementChange.objects.filter(settlement_id=instance.pk).delete()
+    elif sender in LIVE_MODELS:
+        record_change(instance, 'delete')
+    if sender in LIVE_MODELS:
+        publish_change(instance, 'delete')
+
+
+@receiver(m2m_changed, sender=Session.players.through)
+@receiver(m2m_changed, sender=Survivor.weapon_proficiency.through)
+@receiver(m2m_changed, sender=Survivor.fighting_art.through)
+@receiver(m2m_changed, sender=Survivor.disorder.through)
+@receiver(m2m_changed, sender=Survivor.ability.through)
+def settlement_data_relations_changed(sender, instance, action, reverse, **kwargs):
+    '''Records and pushes a change when a session's players or a survivor's cards change'''
+    if action.startswith('post_') and not reverse:
+        record_change(instance, 'save')
+        publish_change(instance, 'save')
+
+
+@receiver(pre_save, sender=SettlementInventory)
+def resource_totals_saving(sender, instance, **kwargs):
+    '''Remembers what an inventory row held before it is saved, to take it off the resource type totals'''
+    instance._previous_holding = SettlementInventory.objects.filter(pk=instance.pk) \
+        .values_list('settlement_id', 'resource_id', 'amount').first() if instance.pk else None
+
+
+@receiver(post_save, sender=SettlementInventory)
+def resource_totals_saved(sender, instance, **kwargs):
+    '''Moves the resource type totals on by what a saved inventory row changed, including fixture loads'''
+    deltas = {(instance.settlement_id, instance.resource_id): instance.amount}
+    previous = getattr(instance, '_previous_holding', None)
+    if previous is not None:
+        key = previous[:2]
+        deltas[key] = deltas.get(key, 0) - previous[2]
+    adjust_resource_totals(deltas)
+
+
+@receiver(post_delete, sender=SettlementInventory)
+def resource_totals_deleted(sender, instance, **kwargs):
+    '''Takes a deleted inventory row off the resource type totals'''
+    adjust_resource_totals({(instance.settlement_id, instance.resource_id): -instance.amount})
+
+
+@receiver(pre_delete, sender=Resource)
+def resource_totals_resource_deleting(sender, instance, **kwargs):
+    '''Remembers the settlements holding a resource before it is deleted, as its types cascade away first'''
+    instance._holding_settlements = sorted(set(
+        SettlementInventory.objects.filter(resource=instance).values_list('settlement_id', flat=True)))
+
+
+@receiver(post_delete, sender=Resource)
+def resource_totals_resource_deleted(sender, instance, **kwargs):
+    '''Rebuilds the resource type totals of the settlements that held a deleted resource'''
+    settlements = getattr(instance, '_holding_settlements', None)
+    if settlements:
+        rebuild_resource_totals(settlements)
+
+
+@receiver(m2m_changed, sender=Resource.type.through)
+def resource_totals_retyped(sender, instance, action, reverse, pk_set, **kwargs):
+    '''Rebuilds the resource type totals of the settlements holding a resource whose types changed'''
+    if not action.startswith('post_'):
+        return
+    resources = pk_set if reverse else [instance.pk]
+    if reverse and action == 'post_clear':
+        # The resources cleared of a type are not known any more, so every total is rebuilt
+        rebuild_resource_totals()
+        return
+    settlements = set(SettlementInventory.objects.filter(resource__in=resources).values_list('settlement_id', flat=True))
+    if settlements:
+        rebuild_resource_totals(sorted(settlements))
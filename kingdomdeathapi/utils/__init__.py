@@ -0,0 +1,20 @@
+from .includes import IncludeError, parse_includes, plan_includes, serialize_includes
+from .ids import parse_ids, select_ids, ids_response
+from .flat import FlatSerializer, One, Many
+from .catalog import CATALOG_MODELS, catalog_version, bump_catalog_version, is_catalog_path
+from .search import SEARCH_KINDS, SEARCH_MODELS, search, search_available, ensure_search_index, rebuild_search_index, index_instance, unindex_instance
+from .autocomplete import AUTOCOMPLETE_KINDS, AutocompleteIndex, autocomplete_index
+from .resource_index import ResourceIndex
+from .filters import FilterError, FilterRegistry, filter_registry, slugify_name, flag_filters, expansion_filters, monster_filters, apply_filters
+from .broker import LIVE_MODELS, RESYNC, Broker, Subscription, broker, change_topics, publish_change
+from .changes import record_changes, change_settlements, record_change, record_bulk_changes, prune_changes
+from .showdown import MONSTER_KINDS, MONSTER_PROFILES, SURVIVOR_FIELDS, monster_profile, simulate_showdowns, simulate_chunk
+from .roster import ROSTER_FIELDS, INSANITY_THRESHOLD, settlement_roster, roster_columns
+from .party import DIVERSITY_BONUS, survivor_score, best_parties
+from .projection import DEFAULT_STRATEGY, MILESTONE_RULES, submit_projection, projection_status, project_chunk
+from .event_deck import AliasTable, event_deck
+from .inventory import InventoryError, add_to_inventory
+from .turn import TURN_SECTIONS, SURVIVOR_TURN_FIELDS, TurnError, validate_turn, apply_turn
+from .progression import MAX_HUNT_EXPERIENCE, MAX_PROFICIENCY_LEVEL, WOUND_FIELDS, ProgressError, validate_progress, apply_progress
+from .stats import SURVIVOR_ATTRIBUTES, settlement_stats
+from .resource_totals import adjust_resource_totals, expected_resource_totals, rebuild_resource_totals, check_resource_totals
@@ -0,0 +1,186 @@
+import re
+from bisect import bisect_left
+from collections import Counter
+from kingdomdeathapi.models import Ability, Disorder, Event, FightingArt, Impairment, Monster, Resource, WeaponProficiency
+from .catalog import catalog_version
+
+AUTOCOMPLETE_KINDS = {
+    'ability': Ability,
+    'disorder': Disorder,
+    'event': Event,
+    'fighting_art': FightingArt,
+    'impairment': Impairment,
+    'monster': Monster,
+    'resource': Resource,
+    'weapon_proficiency': WeaponProficiency,
+}
+
+
+class AutocompleteIndex:
+    """
+    Summary:
+        An in-memory index of catalog names for prefix and typo tolerant lookups.
+
+        Every word of every name is kept in a sorted list, so words starting with a typed
+        prefix are one binary search away. Words are also indexed by their character bigrams,
+        which finds the few candidates worth an edit distance check when the input has a typo.
+        Typos are only looked for when exact prefixes do not fill the limit.
+    """
+
+    def __init__(self, entries):
+        """
+        Args:
+            entries (list): (kind, id, name) tuples to index.
+        """
+        self.entries = entries
+        self.words = []
+        bigrams = {}
+        for entry_index, (kind, pk, name) in enumerate(entries):
+            for position, word in enumerate(_words(name)):
+                for gram in _bigrams(word):
+                    bigrams.setdefault(gram, []).append(len(self.words))
+                self.words.append((word, entry_index, position))
+
+        self.order = sorted(range(len(self.words)), key=lambda word_index: self.words[word_index][0])
+        self.keys = [self.words[word_index][0] for word_index in self.order]
+        self.bigrams = bigrams
+
+    def lookup(self, text, kind=None, limit=10, max_distance=None):
+        """
+        Summary:
+            Find names matching typed text. Every typed word has to match the start of a word
+            in the name, within a small edit distance that grows with the length of the typed word.
+
+        Args:
+            text (str): The typed text, e.g. "lion cl".
+            kind (str): Only return names of this kind. All kinds when None.
+            limit (int): The maximum number of results.
+            max_distance (int): Cap on the edit distance allowed per word. Defaults to 0 for words
+                shorter than 3 characters, 1 up to 5 characters and 2 beyond that.
+
+        Returns:
+            list: A dictionary per match with its kind, id, name and total edit distance, best matches first.
+        """
+        tokens = _words(text)
+        if not tokens:
+            return []
+
+        # Typo matches always rank after exact ones, so they are only looked for when exact ones do not fill the limit
+        results = self._rank(tokens, kind, 0)
+        if len(results) < limit and max_distance != 0:
+            results = self._rank(tokens, kind, max_distance)
+
+        return [{'kind': entry_kind, 'id': pk, 'name': name, 'distance': rank[0]}
+                for rank, entry_kind, pk, name in results[:limit]]
+
+    def _rank(self, tokens, kind, max_distance):
+        # Every entry matching all the tokens, best first
+        scores = None
+        for token in tokens:
+            allowed = _allowed_distance(token)
+            if max_distance is not None:
+                allowed = min(allowed, max_distance)
+            matches = self._match(token, allowed)
+            if scores is None:
+                scores = matches
+            else:
+                scores = {entry_index: (scores[entry_index][0] + distance, scores[entry_index][1])
+                          for entry_index, (distance, position) in matches.items() if entry_index in scores}
+
+        results = []
+        for entry_index, (distance, position) in scores.items():
+            entry_kind, pk, name = self.entries[entry_index]
+            if kind is None or entry_kind == kind:
+                results.append(((distance, position, len(name), name), entry_kind, pk, name))
+        results.sort()
+        return results
+
+    def _match(self, token, allowed):
+        # Best (distance, word position) per entry with a word starting with the token
+        matches = {}
+
+        start = bisect_left(self.keys, token)
+        end = bisect_left(self.keys, token + '\uffff', start)
+        for word_index in self.order[start:end]:
+            _keep(matches, self.words[word_index], 0)
+
+        if allowed:
+            grams = _bigrams(token)
+            shared = Counter()
+            for gram in grams:
+                shared.update(self.bigrams.get(gram, ()))
+            # An edit breaks at most two of the token's bigrams, so words sharing fewer than this are too far off
+            needed = len(grams) - 2 * allowed
+            for word_index, count in shared.items():
+                if count < needed:
+                    continue
+                word = self.words[word_index]
+                if word[1] in matches and matches[word[1]][0] == 0:
+                    continue
+                distance = _prefix_distance(token, word[0], allowed)
+                if distance is not None:
+                    _keep(matches, word, distance)
+        return matches
+
+
+_index = (None, None)
+
+
+def autocomplete_index():
+    """
+    Summary:
+        Get the autocomplete index for the current catalog version, rebuilding it when the catalog has changed.
+
+    Returns:
+        AutocompleteIndex: The index of every autocomplete kind.
+    """
+    global _index  # pylint: disable=global-statement
+    version = catalog_version()
+    if _index[0] != version:
+        entries = []
+        for kind, model in AUTOCOMPLETE_KINDS.items():
+            entries.extend((kind, pk, name) for pk, name in model.objects.values_list('pk', 'name'))
+        _index = (version, AutocompleteIndex(entries))
+    return _index[1]
+
+
+def _words(text):
+    return re.findall(r'\w+', text.lower().replace("'", ''))
+
+
+def _bigrams(word):
+    # The leading marker gives the first letter a bigram of its own
+    padded = f'^{word}'
+    return {padded[i:i + 2] for i in range(len(padded) - 1)}
+
+
+def _allowed_distance(token):
+    if len(token) < 3:
+        return 0
+    if len(token) < 6:
+        return 1
+    return 2
+
+
+def _keep(matches, word, distance):
+    word_text, entry_index, position = word
+    if entry_index not in matches or (distance, position) < matches[entry_index]:
+        matches[entry_index] = (distance, position)
+
+
+def _prefix_distance(token, word, limit):
+    """
+    Summary:
+        The smallest Levenshtein distance between the token and any prefix of the word,
+        or None when it is over the limit.
+    """
+    previous = list(range(len(word) + 1))
+    for i, char in enumerate(token, 1):
+        current = [i]
+        for j, word_char in enumerate(word, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char != word_char)))
+        if min(current) > limit:
+            return None
+        previous = current
+    distance = min(previous)
+    return distance if distance <= limit else None
@@ -0,0 +1,178 @@
+import asyncio
+import threading
+from django.db import transaction
+from kingdomdeathapi.models import Milestone, Session, Settlement, SettlementEvent, SettlementInventory, Survivor
+
+# Models whose changes are pushed to live sessions, with the name used in change events
+LIVE_MODELS = {
+    Milestone: 'milestone',
+    Session: 'session',
+    Settlement: 'settlement',
+    SettlementEvent: 'settlement_event',
+    SettlementInventory: 'settlement_inventory',
+    Survivor: 'survivor',
+}
+
+# Sent in place of changes a slow subscriber missed, telling the client to refetch
+RESYNC = {'op': 'resync'}
+
+
+class Subscription:
+    """
+    Summary:
+        A subscriber's queue of change events, bound to the event loop it was created on.
+        Events are delivered thread safely, so they can be published from synchronous views.
+    """
+
+    def __init__(self, topics, max_queued):
+        self.topics = set(topics)
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(max_queued)
+        self.overflowed = False
+
+    def deliver(self, message):
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+    async def get(self):
+        """
+        Summary:
+            Wait for the next change event.
+
+        Returns:
+            dict: The event, or RESYNC when events were dropped because the subscriber fell behind.
+        """
+        if self.overflowed:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.overflowed = False
+            return RESYNC
+        return await self.queue.get()
+
+
+class Broker:
+    """
+    Summary:
+        An in-process publish/subscribe broker. Subscribers listen on topics such as "settlement:2",
+        and publishing to a topic hands the message to every subscriber listening on it.
+    """
+
+    def __init__(self, max_queued=100):
+        self.max_queued = max_queued
+        self._topics = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, topics):
+        """
+        Summary:
+            Start listening on topics. Must be called from the subscriber's event loop.
+
+        Args:
+            topics (iterable): The topics to listen on.
+
+        Returns:
+            Subscription: The subscription to read events from.
+        """
+        subscription = Subscription(topics, self.max_queued)
+        with self._lock:
+            for topic in subscription.topics:
+                self._topics.setdefault(topic, set()).add(subscription)
+        return subscription
+
+    def update(self, subscription, topics):
+        """
+        Summary:
+            Change the topics a subscription listens on.
+        """
+        self.unsubscribe(subscription)
+        subscription.topics = set(topics)
+        with self._lock:
+            for topic in subscription.topics:
+                self._topics.setdefault(topic, set()).add(subscription)
+
+    def unsubscribe(self, subscription):
+        """
+        Summary:
+            Stop listening on every topic of a subscription.
+        """
+        with self._lock:
+            for topic in subscription.topics:
+                subscribers = self._topics.get(topic, set())
+                subscribers.discard(subscription)
+                if not subscribers:
+                    self._topics.pop(topic, None)
+
+    def has_subscribers(self, topic):
+        """
+        Summary:
+            Check whether anybody listens on a topic, so publishers can skip building messages nobody reads.
+        """
+        return topic in self._topics
+
+    def publish(self, topic, message):
+        """
+        Summary:
+            Hand a message to every subscriber of a topic. Safe to call from any thread.
+
+        Returns:
+            int: The number of subscribers the message was handed to.
+        """
+        with self._lock:
+            subscribers = tuple(self._topics.get(topic, ()))
+        delivered = 0
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.deliver, message)
+                delivered += 1
+            except RuntimeError:
+                # The subscriber's event loop has closed
+                self.unsubscribe(subscription)
+        return delivered
+
+
+broker = Broker()
+
+
+def change_topics(instance):
+    """
+    Summary:
+        The topics a change to a live model is published on. Settlement data goes to the settlement's
+        topic, survivors to their player's topic and sessions to their own topic.
+
+    Args:
+        instance (Model): The changed instance.
+
+    Returns:
+        list: The topics.
+    """
+    if isinstance(instance, Settlement):
+        return [f'settlement:{instance.pk}']
+    if isinstance(instance, Session):
+        return [f'session:{instance.pk}']
+    if isinstance(instance, Survivor):
+        return [f'player:{instance.user_id}']
+    return [f'settlement:{instance.settlement_id}']
+
+
+def publish_change(instance, op):
+    """
+    Summary:
+        Publish a compact {model, id, op} event for a change to a live model once the write commits.
+        Nothing is done when no one is listening.
+
+    Args:
+        instance (Model): The changed instance.
+        op (str): "save" or "delete".
+    """
+    topics = [topic for topic in change_topics(instance) if broker.has_subscribers(topic)]
+    if not topics:
+        return
+
+    message = {'model': LIVE_MODELS[type(instance)], 'id': instance.pk, 'op': op}
+
+    def publish():
+        for topic in topics:
+            broker.publish(topic, message)
+    transaction.on_commit(publish)
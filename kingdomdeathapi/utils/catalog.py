@@ -0,0 +1,84 @@
+import time
+from contextvars import ContextVar
+from django.core.signals import request_finished, request_started
+from django.db.models import F
+from django.db.models.functions import Greatest
+from kingdomdeathapi.models import (
+    Ability, Campaign, CatalogVersion, Disorder, Event, ExpansionType, FightingArt, Impairment, MilestoneType, Monster,
+    Resource, ResourceType, WeaponProficiency)
+
+# Reference tables shared by every settlement. Any write to them bumps the catalog version.
+CATALOG_MODELS = (Ability, Campaign, Disorder, Event, ExpansionType, FightingArt, Impairment, MilestoneType, Monster,
+                  Resource, ResourceType, WeaponProficiency)
+
+# First path segment of the endpoints that only serve catalog data
+CATALOG_ENDPOINTS = {'abilities', 'catalog', 'disorders', 'events', 'fighting_arts', 'milestone_types', 'resources',
+                     'weapon_proficiencies'}
+
+# The version read during the current request, so a request reads it once. None outside requests.
+_request_version = ContextVar('catalog_version', default=None)
+
+
+def catalog_version():
+    """
+    Summary:
+        Get the current catalog version. Anything derived from catalog tables can be cached against it.
+        The version lives in the database, so every worker process sees a bump as soon as it is committed.
+        It is read once per request and on every call outside requests.
+
+    Returns:
+        int: The catalog version.
+    """
+    memo = _request_version.get()
+    if memo is not None and 'version' in memo:
+        return memo['version']
+
+    version = CatalogVersion.objects.filter(pk=1).values_list('version', flat=True).first()
+    if version is None:
+        version = CatalogVersion.objects.get_or_create(pk=1, defaults={'version': _clock()})[0].version
+    if memo is not None:
+        memo['version'] = version
+    return version
+
+
+def bump_catalog_version():
+    """
+    Summary:
+        Move to a new catalog version, invalidating everything cached against the old one.
+    """
+    # Never less than the clock, so a version lost to a rolled back transaction is not handed out again
+    if not CatalogVersion.objects.filter(pk=1).update(version=Greatest(F('version') + 1, _clock())):
+        CatalogVersion.objects.get_or_create(pk=1, defaults={'version': _clock()})
+    memo = _request_version.get()
+    if memo is not None:
+        memo.pop('version', None)
+
+
+def _clock():
+    return time.time_ns() // 1000
+
+
+def _start_request(**kwargs):
+    _request_version.set({})
+
+
+def _finish_request(**kwargs):
+    _request_version.set(None)
+
+
+request_started.connect(_start_request, dispatch_uid='kingdomdeathapi.catalog_version.start')
+request_finished.connect(_finish_request, dispatch_uid='kingdomdeathapi.catalog_version.finish')
+
+
+def is_catalog_path(path):
+    """
+    Summary:
+        Check whether a request path is served purely from catalog tables.
+
+    Args:
+        path (str): The request path, e.g. "/resources/3".
+
+    Returns:
+        bool: True for catalog endpoints.
+    """
+    return path.strip('/').split('/')[0] in CATALOG_ENDPOINTS
@@ -0,0 +1,124 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from kingdomdeathapi.models import Session, Settlement, SettlementChange, Survivor
+from .broker import LIVE_MODELS
+
+# The change log is pruned each time a settlement's version passes a multiple of this
+PRUNE_EVERY = 100
+
+
+def record_changes(settlement_id, changes):
+    """
+    Summary:
+        Append changes to a settlement's change log, moving the settlement on one version per change.
+        The version is bumped with a single UPDATE, which also serializes concurrent writers on the settlement row.
+
+    Args:
+        settlement_id (int): The settlement that changed.
+        changes (iterable): (model, object_id, op) tuples, e.g. ("settlement_inventory", 7, "save").
+
+    Returns:
+        int: The settlement's new version, or None if nothing was recorded.
+    """
+    changes = list(changes)
+    if not changes:
+        return None
+
+    with transaction.atomic():
+        if not Settlement.objects.filter(pk=settlement_id).update(version=F('version') + len(changes)):
+            return None
+        version = Settlement.objects.filter(pk=settlement_id).values_list('version', flat=True).get()
+        first = version - len(changes) + 1
+        SettlementChange.objects.bulk_create([
+            SettlementChange(settlement_id=settlement_id, version=first + offset, model=model, object_id=object_id, op=op)
+            for offset, (model, object_id, op) in enumerate(changes)
+        ])
+        if version // PRUNE_EVERY != (first - 1) // PRUNE_EVERY:
+            prune_changes([settlement_id])
+    return version
+
+
+def prune_changes(settlement_ids=None):
+    """
+    Summary:
+        Drop changes older than the last MAX_SETTLEMENT_CHANGES of each settlement's change log.
+
+    Args:
+        settlement_ids (list): The settlements to prune, or None for all of them.
+
+    Returns:
+        int: The number of changes dropped.
+    """
+    settlements = Settlement.objects.all()
+    if settlement_ids is not None:
+        settlements = settlements.filter(pk__in=settlement_ids)
+    dropped = 0
+    for settlement_id, version in settlements.filter(version__gt=settings.MAX_SETTLEMENT_CHANGES).values_list('pk', 'version'):
+        dropped += SettlementChange.objects.filter(
+            settlement_id=settlement_id, version__lte=version - settings.MAX_SETTLEMENT_CHANGES).delete()[0]
+    return dropped
+
+
+def change_settlements(instance):
+    """
+    Summary:
+        The settlements whose change log a write to a live model belongs in. A survivor belongs to every
+        settlement its player hosts or plays a session in, or is the game master of.
+
+    Args:
+        instance (Model): The changed instance.
+
+    Returns:
+        list: The settlement ids.
+    """
+    if isinstance(instance, Settlement):
+        return [instance.pk]
+    if isinstance(instance, Survivor):
+        in_session = Session.objects.filter(Q(host_id=instance.user_id) | Q(players=instance.user_id)).values('settlement_id')
+        return list(Settlement.objects.filter(Q(pk__in=in_session) | Q(game_master_id=instance.user_id))
+                    .order_by('pk').values_list('pk', flat=True))
+    return [instance.settlement_id]
+
+
+def record_change(instance, op):
+    """
+    Summary:
+        Record a write to a live model in the change log of every settlement it belongs to.
+
+    Args:
+        instance (Model): The changed instance.
+        op (str): "save" or "delete".
+    """
+    change = (LIVE_MODELS[type(instance)], instance.pk, op)
+    for settlement_id in change_settlements(instance):
+        version = record_changes(settlement_id, [change])
+        if isinstance(instance, Settlement) and version is not None:
+            # Keep the saved instance in step, so a later full save does not write an old version back
+            instance.version = version
+
+
+def record_bulk_changes(instances, op):
+    """
+    Summary:
+        Record writes to many instances of live models, such as a bulk update, with one record_changes
+        call per settlement. The settlements of a player's survivors are looked up once per player.
+
+    Args:
+        instances (iterable): The changed instances.
+        op (str): "save" or "delete".
+
+    Returns:
+        dict: The new version of every settlement a change was recorded in, by settlement id.
+    """
+    changes, players = {}, {}
+    for instance in instances:
+        if isinstance(instance, Survivor):
+            if instance.user_id not in players:
+                players[instance.user_id] = change_settlements(instance)
+            settlement_ids = players[instance.user_id]
+        else:
+            settlement_ids = change_settlements(instance)
+        for settlement_id in settlement_ids:
+            changes.setdefault(settlement_id, []).append((LIVE_MODELS[type(instance)], instance.pk, op))
+    return {settlement_id: record_changes(settlement_id, rows) for settlement_id, rows in changes.items()}
@@ -0,0 +1,131 @@
+import math
+from collections import OrderedDict
+from kingdomdeathapi.models import Event, SettlementEvent
+from .catalog import catalog_version
+from .filters import apply_filters
+
+# Decks kept built, least recently used first
+MAX_DECKS = 128
+
+_decks = OrderedDict()
+
+
+class AliasTable:
+    """
+    Summary:
+        Weighted random choice in constant time per draw, with Vose's alias method. Every slot holds
+        an item, the chance of keeping it, and the item to take instead, so a draw is one random number.
+        Weights must be finite, as an infinite or NaN weight leaves no sensible chance for the others.
+    """
+
+    def __init__(self, items, weights):
+        weights = list(weights)
+        if not all(math.isfinite(weight) for weight in weights):
+            raise ValueError('weights must be finite numbers')
+        pairs = [(item, weight) for item, weight in zip(items, weights) if weight > 0]
+        self.items = [item for item, _ in pairs]
+        count = len(pairs)
+        # Weights relative to the largest, so that large weights cannot overflow the total
+        top = max((weight for _, weight in pairs), default=1)
+        total = sum(weight / top for _, weight in pairs)
+        scaled = [weight / top * count / total for _, weight in pairs] if count else []
+        self.prob = [1.0] * count
+        self.alias = list(range(count))
+
+        small = [index for index, value in enumerate(scaled) if value < 1]
+        large = [index for index, value in enumerate(scaled) if value >= 1]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.prob[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] -= 1 - scaled[less]
+            (small if scaled[more] < 1 else large).append(more)
+        # Whatever is left is 1 up to rounding errors, and keeps its own slot
+
+    def __len__(self):
+        return len(self.items)
+
+    def sample(self, count, rng):
+        """
+        Summary:
+            Draw items with replacement.
+
+        Args:
+            count (int): The number of draws.
+            rng (Random): The random number generator.
+
+        Returns:
+            list: The items drawn.
+        """
+        items, prob, alias, slots, draw = self.items, self.prob, self.alias, len(self.items), rng.random
+        drawn = []
+        for _ in range(count):
+            # The whole part picks the slot and the fraction whether to keep it
+            roll = draw() * slots
+            slot = int(roll)
+            drawn.append(items[slot] if roll - slot < prob[slot] else items[alias[slot]])
+        return drawn
+
+    def sample_unique(self, count, rng, weights):
+        """
+        Summary:
+            Draw different items, as from a deck. Repeats are drawn again, which keeps every draw weighted
+            among the items left, and the table is rebuilt without the drawn items once repeats get common.
+
+        Args:
+            count (int): The number of draws, at most the number of items.
+            rng (Random): The random number generator.
+            weights (dict): The weight of every item, to rebuild the table with.
+
+        Returns:
+            list: The items drawn.
+        """
+        drawn = {}
+        table = self
+        misses = 0
+        while len(drawn) < min(count, len(self)):
+            item = table.sample(1, rng)[0]
+            if item not in drawn:
+                drawn[item] = True
+                continue
+            misses += 1
+            if misses > count:
+                left = [item for item in self.items if item not in drawn]
+                table = AliasTable(left, [weights[item] for item in left])
+                misses = 0
+        return list(drawn)
+
+
+def event_deck(settlement_id, version, filters, weights, repeat=False):
+    """
+    Summary:
+        Get the alias table of the events a settlement can draw, building it only when the catalog,
+        the settlement's history, the filters or the weights have changed since it was last built.
+
+    Args:
+        settlement_id (int): The settlement drawing.
+        version (int): The settlement's version, which moves on whenever its events change.
+        filters (list): (column, value, include) filters on events, for apply_filters.
+        weights (dict): Weights of events other than 1. A weight of 0 leaves an event out.
+        repeat (bool): Whether events already in the settlement's timeline can be drawn again.
+
+    Returns:
+        tuple: The AliasTable of event ids and the weight of every event in it.
+    """
+    # The history only matters when drawn events are left out
+    key = (catalog_version(), settlement_id, None if repeat else version, tuple(filters),
+           tuple(sorted(weights.items())), repeat)
+    if key in _decks:
+        _decks.move_to_end(key)
+        return _decks[key]
+
+    events = apply_filters(Event.objects.all(), filters)
+    if not repeat:
+        events = events.exclude(pk__in=SettlementEvent.objects.filter(settlement_id=settlement_id).values('event_id'))
+    ids = list(events.order_by('pk').values_list('pk', flat=True))
+    deck_weights = {pk: weights.get(pk, 1.0) for pk in ids}
+
+    _decks[key] = (AliasTable(ids, [deck_weights[pk] for pk in ids]), deck_weights)
+    while len(_decks) > MAX_DECKS:
+        _decks.popitem(last=False)
+    return _decks[key]
@@ -0,0 +1,178 @@
+import re
+from kingdomdeathapi.models import ExpansionType, Monster, ResourceType
+from .catalog import catalog_version
+
+
+class FilterError(ValueError):
+    """A filter query parameter names something that does not exist."""
+
+
+class FilterRegistry:
+    """
+    Summary:
+        The filterable expansions, resource types and monsters, each keyed by the slug of its name,
+        e.g. "Gambler's Chest" is "gamblers_chest". Query parameters are looked up here instead of in
+        hardcoded id maps, so new rows are filterable without a code change.
+    """
+
+    def __init__(self, expansions, resource_types, monsters):
+        """
+        Args:
+            expansions (dict): Expansion slugs mapped to ids.
+            resource_types (dict): Resource type slugs mapped to ids.
+            monsters (dict): Monster slugs mapped to ids.
+        """
+        self.expansions = expansions
+        self.resource_types = resource_types
+        self.monsters = monsters
+
+
+_registry = (None, None)
+
+
+def filter_registry():
+    """
+    Summary:
+        Get the filter registry for the current catalog version, rebuilding it when the catalog has changed.
+
+    Returns:
+        FilterRegistry: The registry.
+    """
+    global _registry  # pylint: disable=global-statement
+    version = catalog_version()
+    if _registry[0] != version:
+        _registry = (version, FilterRegistry(
+            _slugs(ExpansionType), _slugs(ResourceType), _slugs(Monster)))
+    return _registry[1]
+
+
+def slugify_name(name):
+    """
+    Summary:
+        Turn a name into its query parameter slug, e.g. "Gambler's Chest" into "gamblers_chest".
+    """
+    return re.sub(r'[^a-z0-9]+', '_', name.lower().replace("'", '').replace(',', '')).strip('_')
+
+
+def flag_filters(query_params, slugs, suffix=''):
+    """
+    Summary:
+        Compile boolean flag parameters such as ?gorm_exp=true&sunstalker_exp=false into the ids to include and exclude.
+
+    Args:
+        query_params (QueryDict): The request's query parameters.
+        slugs (dict): Flag slugs mapped to ids.
+        suffix (str): Appended to each slug to form its parameter name, e.g. "_exp".
+
+    Returns:
+        tuple: The set of ids that must match, or None when there is no include flag, and the set of ids that must not.
+    """
+    include, exclude = None, set()
+    for slug, pk in slugs.items():
+        value = query_params.get(slug + suffix)
+        if value is None:
+            continue
+        if value == 'true':
+            include = {pk} if include is None else include & {pk}
+        else:
+            exclude.add(pk)
+    return include, exclude
+
+
+def expansion_filters(query_params):
+    """
+    Summary:
+        Translate the expansion query parameters shared by the catalog lists into filters.
+        ?<slug>_exp=true/false include or exclude one expansion, ?expansion=true/false keep cards
+        with or without an expansion, and ?expansion=gorm,sunstalker keeps cards from any of the listed ones.
+
+    Args:
+        query_params (QueryDict): The request's query parameters.
+
+    Returns:
+        list: (column, value, include) filters for apply_filters.
+
+    Raises:
+        FilterError: If ?expansion= lists an unknown expansion.
+    """
+    filters = []
+    value = query_params.get('expansion')
+    if value in ('true', 'false'):
+        # expansion=true keeps cards that have an expansion, i.e. excludes a null expansion
+        filters.append(('expansion', None, value == 'false'))
+
+    # Plain lists never need the registry, so they do not pay for building it
+    if not value and not any(param.endswith('_exp') for param in query_params):
+        return filters
+
+    registry = filter_registry()
+    include, exclude = flag_filters(query_params, registry.expansions, '_exp')
+    if value and value not in ('true', 'false'):
+        listed = set(_lookup(registry.expansions, value.split(','), 'expansion'))
+        include = listed if include is None else include & listed
+
+    return filters + _compiled('expansion', include, exclude)
+
+
+def monster_filters(query_params):
+    """
+    Summary:
+        Translate ?<monster slug>=true/false parameters, e.g. ?white_lion=true, into filters on monster_origin.
+
+    Args:
+        query_params (QueryDict): The request's query parameters.
+
+    Returns:
+        list: (column, value, include) filters for apply_filters.
+    """
+    include, exclude = flag_filters(query_params, filter_registry().monsters)
+    return _compiled('monster_origin', include, exclude)
+
+
+def apply_filters(queryset, filters):
+    """
+    Summary:
+        Apply (column, value, include) filters to a queryset. A value of None stands for a null relation
+        and a tuple for any of its values, compiled to a single IN clause.
+
+    Args:
+        queryset (QuerySet): The queryset to filter.
+        filters (list): The filters to apply.
+
+    Returns:
+        QuerySet: The filtered queryset.
+    """
+    for column, value, include in filters:
+        if value is None:
+            lookup = {f'{column}__isnull': True}
+        elif isinstance(value, tuple):
+            lookup = {f'{column}__in': value}
+        else:
+            lookup = {column: value}
+        queryset = queryset.filter(**lookup) if include else queryset.exclude(**lookup)
+    return queryset
+
+
+def _slugs(model):
+    return {slugify_name(name): pk for pk, name in model.objects.order_by('pk').values_list('pk', 'name')}
+
+
+def _lookup(slugs, values, kind):
+    ids = []
+    for value in filter(None, (value.strip() for value in values)):
+        if value.isdigit():
+            ids.append(int(value))
+        elif value in slugs:
+            ids.append(slugs[value])
+        else:
+            raise FilterError(f'Unknown {kind}: {value}')
+    return ids
+
+
+def _compiled(column, include, exclude):
+    filters = []
+    if include is not None:
+        filters.append((column, tuple(sorted(include)), True))
+    if exclude:
+        filters.append((column, tuple(sorted(exclude)), False))
+    return filters
@@ -0,0 +1,66 @@
+from rest_framework import status
+from rest_framework.response import Response
+
+
+def parse_ids(value):
+    """
+    Summary:
+        Parse an `ids` query parameter into a list of unique primary keys.
+
+    Args:
+        value (str): Comma separated primary keys, e.g. "1,5,9".
+
+    Returns:
+        list: The primary keys in request order with duplicates removed.
+
+    Raises:
+        ValueError: If any of the values is not an integer.
+    """
+    ids = [int(pk) for pk in value.split(",") if pk.strip()]
+    return list(dict.fromkeys(ids))
+
+
+def select_ids(queryset, value):
+    """
+    Summary:
+        Fetch the rows named in an `ids` query parameter with a single pk__in query.
+        Any select_related or prefetch_related already on the queryset is applied to the batch.
+
+    Args:
+        queryset (QuerySet): The filtered queryset to select from.
+        value (str): Comma separated primary keys, e.g. "1,5,9".
+
+    Returns:
+        tuple: The objects in request order and the list of ids that were not found.
+
+    Raises:
+        ValueError: If any of the values is not an integer.
+    """
+    ids = parse_ids(value)
+    found = queryset.in_bulk(ids)
+    objects = [found[pk] for pk in ids if pk in found]
+    missing = [pk for pk in ids if pk not in found]
+    return objects, missing
+
+
+def ids_response(queryset, value, serializer_class):
+    """
+    Summary:
+        Build the response for a list action filtered by an `ids` query parameter.
+
+    Args:
+        queryset (QuerySet): The filtered queryset to select from.
+        value (str): Comma separated primary keys, e.g. "1,5,9".
+        serializer_class (Serializer): The serializer used for each object.
+
+    Returns:
+        Response: The serialized objects in request order with the ids that were not found and HTTP status 200 OK,
+        or HTTP status 400 Bad Request if the ids are not integers.
+    """
+    try:
+        objects, missing = select_ids(queryset, value)
+    except ValueError:
+        return Response({'message': 'ids must be a comma separated list of integers'}, status=status.HTTP_400_BAD_REQUEST)
+
+    serializer = serializer_class(objects, many=True)
+    return Response({'results': serializer.data, 'missing': missing}, status=status.HTTP_200_OK)
@@ -0,0 +1,120 @@
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+
+
+class IncludeError(ValueError):
+    """Raised when an include path names something that cannot be included."""
+
+
+def parse_includes(value):
+    """
+    Summary:
+        Turn an `include` query parameter into a tree of relation names.
+
+    Args:
+        value (str): Comma separated dotted paths, e.g. "inventory.resource.type,event.event".
+
+    Returns:
+        dict: Each relation name mapped to the tree of relations included beneath it.
+    """
+    tree = {}
+    for path in (value or "").split(","):
+        node = tree
+        for name in filter(None, path.strip().split(".")):
+            node = node.setdefault(name, {})
+    return tree
+
+
+def plan_includes(queryset, tree):
+    """
+    Summary:
+        Add the select_related and Prefetch objects needed to load an include tree.
+        Single valued relations are joined into the query, many valued relations are
+        prefetched with a queryset that is itself planned for the relations beneath them.
+
+    Args:
+        queryset (QuerySet): The queryset the include tree is rooted at.
+        tree (dict): An include tree as returned by parse_includes.
+
+    Returns:
+        QuerySet: The queryset with related loading configured.
+
+    Raises:
+        IncludeError: If a name in the tree is not an includable relation.
+    """
+    select, prefetch = _plan(queryset.model, tree)
+    if select:
+        queryset = queryset.select_related(*select)
+    if prefetch:
+        queryset = queryset.prefetch_related(*prefetch)
+    return queryset
+
+
+def serialize_includes(instance, tree):
+    """
+    Summary:
+        Serialize the relations of an include tree for an instance loaded with plan_includes.
+
+    Args:
+        instance (Model): The instance the include tree is rooted at.
+        tree (dict): An include tree as returned by parse_includes.
+
+    Returns:
+        dict: Each included relation name mapped to its serialized data.
+    """
+    data = {}
+    for name, children in tree.items():
+        field = instance._meta.get_field(name)
+        if field.many_to_one or field.one_to_one:
+            related = getattr(instance, _accessor(field), None)
+            data[name] = None if related is None else _serialize(related, children)
+        else:
+            related = getattr(instance, _accessor(field)).all()
+            data[name] = [_serialize(obj, children) for obj in related]
+    return data
+
+
+def _plan(model, tree, prefix=""):
+    select = []
+    prefetch = []
+    for name, children in tree.items():
+        field = _relation(model, name)
+        path = f"{prefix}{name}"
+        if field.many_to_one or field.one_to_one:
+            # Joined relations keep extending the parent's lookup path
+            select.append(path)
+            child_select, child_prefetch = _plan(field.related_model, children, f"{path}__")
+            select.extend(child_select)
+            prefetch.extend(child_prefetch)
+        else:
+            queryset = plan_includes(field.related_model.objects.all(), children)
+            prefetch.append(Prefetch(path, queryset=queryset))
+    return select, prefetch
+
+
+def _relation(model, name):
+    try:
+        field = model._meta.get_field(name)
+    except FieldDoesNotExist:
+        field = None
+    if field is None or not field.is_relation:
+        raise IncludeError(f"'{name}' is not a relation of {model.__name__}")
+    # Only relations between this app's models can be included, which keeps
+    # auth users and tokens out of responses
+    if field.related_model._meta.app_label != model._meta.app_label:
+        raise IncludeError(f"'{name}' cannot be included")
+    return field
+
+
+def _accessor(field):
+    if field.concrete:
+        return field.name
+    return field.get_accessor_name()
+
+
+def _serialize(instance, tree):
+    data = {}
+    for field in instance._meta.concrete_fields:
+        data[field.name] = getattr(instance, field.attname)
+    data.update(serialize_includes(instance, tree))
+    return data
@@ -0,0 +1,89 @@
+from django.db import transaction
+from kingdomdeathapi.models import SettlementInventory
+from .broker import publish_change
+from .changes import record_changes
+from .resource_totals import adjust_resource_totals
+
+
+class InventoryError(ValueError):
+    """A settlement does not hold enough of the resources taken from its inventory."""
+
+    def __init__(self, short):
+        super().__init__(f'Not enough of resources: {", ".join(map(str, sorted(short)))}')
+        self.short = short
+
+
+def add_to_inventory(settlement_id, amounts):
+    """
+    Summary:
+        Add amounts of resources to a settlement's inventory as one batch: a single query for the rows it
+        already holds, one bulk update for those and one bulk insert for the rest. Changes are recorded
+        in the settlement's change log, pushed to live sessions and added to the resource type totals,
+        as bulk writes send no signals.
+
+    Args:
+        settlement_id (int): The settlement.
+        amounts (dict): The amount to add by resource id. Negative amounts take resources away,
+            spread across the rows holding the resource.
+
+    Returns:
+        tuple: The inventory rows written and the settlement's new version, or None if nothing changed.
+
+    Raises:
+        InventoryError: With the amount missing by resource id, if the settlement holds less of a resource
+            than is taken away. Nothing is written then.
+    """
+    amounts = {resource: amount for resource, amount in amounts.items() if amount}
+    if not amounts:
+        return [], None
+
+    with transaction.atomic():
+        held = {}
+        rows = SettlementInventory.objects.select_for_update().filter(settlement_id=settlement_id, resource_id__in=amounts)
+        for row in rows.order_by('pk'):
+            held.setdefault(row.resource_id, []).append(row)
+
+        # The rows are locked, so what they hold cannot change before the deductions are written
+        short = {}
+        for resource, amount in amounts.items():
+            available = sum(max(row.amount, 0) for row in held.get(resource, []))
+            if available + amount < 0:
+                short[resource] = -amount - available
+        if short:
+            raise InventoryError(short)
+
+        updated, created = [], []
+        for resource, amount in amounts.items():
+            rows = held.get(resource)
+            if rows is None:
+                created.append(SettlementInventory(settlement_id=settlement_id, resource_id=resource, amount=amount))
+            elif amount > 0:
+                # A resource held in several rows is added to the first
+                rows[0].amount += amount
+                updated.append(rows[0])
+            else:
+                updated.extend(_take(rows, -amount))
+
+        SettlementInventory.objects.bulk_update(updated, ['amount'])
+        SettlementInventory.objects.bulk_create(created)
+        adjust_resource_totals({(settlement_id, resource): amount for resource, amount in amounts.items()})
+
+        written = updated + created
+        version = record_changes(settlement_id, [('settlement_inventory', row.pk, 'save') for row in written])
+        for row in written:
+            publish_change(row, 'save')
+    return written, version
+
+
+def _take(rows, amount):
+    # Take an amount from a resource's rows in order, so no row goes below 0
+    taken = []
+    for row in rows:
+        if amount <= 0:
+            break
+        part = min(amount, max(row.amount, 0))
+        if part:
+            row.amount -= part
+            amount -= part
+            taken.append(row)
+    return taken
@@ -0,0 +1,108 @@
+from functools import lru_cache
+from heapq import heappush, heapreplace
+from .showdown import LOCATIONS, MONSTER_HIT_TARGET, SURVIVOR_HIT_TARGET, WEAPON_STRENGTH
+
+# Score added for every different weapon proficiency in a party
+DIVERSITY_BONUS = 0.25
+FIGHTING_ART_WEIGHT = 0.15
+DISORDER_WEIGHT = 0.1
+
+
+def survivor_score(survivor, profile):
+    """
+    Summary:
+        Score how much a survivor adds to a party against a monster: the wounds they are expected to
+        inflict per round, how hard they are to hurt, and their fighting arts and disorders.
+        Scores are memoized on the stats they depend on, so they are only worked out once per survivor and monster.
+
+    Args:
+        survivor (dict): The survivor's SURVIVOR_FIELDS plus fighting_arts and disorders counts.
+        profile (dict): The monster's stats, from monster_profile.
+
+    Returns:
+        float: The score. Higher is better.
+    """
+    armor = sum(survivor[f'{location}_armor'] for location in LOCATIONS)
+    light = sum(survivor[f'{location}_light_wound'] for location in LOCATIONS[1:])
+    heavy = survivor['head_wound'] + sum(survivor[f'{location}_heavy_wound'] for location in LOCATIONS[1:])
+    return _score(survivor['accuracy'], survivor['strength'], survivor['speed'], survivor['luck'], survivor['movement'],
+                  survivor['evasion'], armor, light, heavy, survivor['fighting_arts'], survivor['disorders'],
+                  tuple(sorted(profile.items())))
+
+
+@lru_cache(maxsize=4096)
+def _score(accuracy, strength, speed, luck, movement, evasion, armor, light, heavy, fighting_arts, disorders, profile):
+    profile = dict(profile)
+    # Chances on a d10, where a 10 always succeeds
+    hit = (11 - max(2, min(10, SURVIVOR_HIT_TARGET - accuracy + profile['evasion']))) / 10
+    crit = (11 - max(2, min(10, 10 - luck))) / 10
+    wound = (11 - max(1, min(10, profile['toughness'] + 1 - strength - WEAPON_STRENGTH))) / 10
+    attacks = max(1, speed) + (1 if movement >= profile['movement'] else 0)
+    offense = attacks * hit * (crit + (1 - crit) * wound)
+
+    struck = (11 - max(2, min(10, MONSTER_HIT_TARGET - profile['accuracy'] + evasion))) / 10
+    defense = 0.1 * armor / profile['damage'] - struck - 0.2 * light - 0.6 * heavy
+
+    return offense + defense + FIGHTING_ART_WEIGHT * fighting_arts - DISORDER_WEIGHT * disorders
+
+
+def best_parties(members, size, k, bonus=DIVERSITY_BONUS):
+    """
+    Summary:
+        Find the k highest scoring parties of a given size, where a party scores the sum of its members'
+        scores plus a bonus per different weapon proficiency among them.
+
+        Members are searched in descending score order, and a branch is abandoned as soon as even the best
+        remaining members and the most weapon proficiencies they could add cannot beat the k-th best party found.
+
+    Args:
+        members (list): A dictionary per candidate with its id, score and frozenset of weapons.
+        size (int): The party size.
+        k (int): The number of parties to return.
+        bonus (float): Score per different weapon proficiency in a party.
+
+    Returns:
+        tuple: The parties as (score, members) pairs, best first, and the number of complete parties scored.
+    """
+    members = sorted(members, key=lambda member: (-member['score'], member['id']))
+    count = len(members)
+    if count < size or size < 1:
+        return [], 0
+
+    scores = [member['score'] for member in members]
+    # prefix[j] - prefix[i] is the best total of members i to j - 1, as they are sorted
+    prefix = [0]
+    for score in scores:
+        prefix.append(prefix[-1] + score)
+    all_weapons = len(frozenset().union(*(member['weapons'] for member in members)))
+    most_weapons = max(len(member['weapons']) for member in members)
+
+    heap = []
+    scored = 0
+
+    def search(start, chosen, total, weapons):
+        nonlocal scored
+        slots = size - len(chosen)
+        if slots == 0:
+            scored += 1
+            # Earlier members break ties, so the order is deterministic
+            entry = (total + bonus * len(weapons), tuple(-index for index in chosen))
+            if len(heap) < k:
+                heappush(heap, entry)
+            elif entry > heap[0]:
+                heapreplace(heap, entry)
+            return
+
+        weapon_bound = bonus * min(all_weapons, len(weapons) + slots * most_weapons)
+        for index in range(start, count - slots + 1):
+            bound = total + prefix[index + slots] - prefix[index] + weapon_bound
+            # Later members only score lower, so nothing further along can do better either
+            if len(heap) == k and bound <= heap[0][0]:
+                break
+            chosen.append(index)
+            search(index + 1, chosen, total + scores[index], weapons | members[index]['weapons'])
+            chosen.pop()
+
+    search(0, [], 0, frozenset())
+    parties = sorted(heap, reverse=True)
+    return [(score, [members[-index] for index in indices]) for score, indices in parties], scored
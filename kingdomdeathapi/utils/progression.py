@@ -0,0 +1,140 @@
+from django.db import transaction
+from kingdomdeathapi.models import ProficiencyLevel, Survivor, WeaponProficiency
+from .broker import publish_change
+from .changes import record_bulk_changes
+from .showdown import LOCATIONS
+
+# The ends of the hunt experience and weapon proficiency tracks
+MAX_HUNT_EXPERIENCE = 16
+MAX_PROFICIENCY_LEVEL = 8
+
+WOUND_FIELDS = ('head_wound',) + tuple(f'{location}_{kind}_wound' for location in LOCATIONS[1:] for kind in ('light', 'heavy'))
+
+
+class ProgressError(ValueError):
+    """A progression batch is malformed or names something that does not exist."""
+
+    def __init__(self, errors):
+        super().__init__('The progression is invalid')
+        self.errors = errors
+
+
+def validate_progress(entries):
+    """
+    Summary:
+        Check the progression of the survivors of a showdown before any of it is applied,
+        looking up the survivors and weapon proficiencies with a query each.
+
+    Args:
+        entries (list): An object per survivor with its id and any of the hunt_experience gained,
+            the proficiency levels gained by weapon proficiency id, clear_wounds, and wounds to set.
+
+    Returns:
+        dict: The (survivor, entry) pairs with the survivors loaded and the names of the weapon proficiencies,
+        for apply_progress.
+
+    Raises:
+        ProgressError: With the problems found, by survivor id.
+    """
+    if not isinstance(entries, list) or not entries:
+        raise ProgressError({'survivors': 'survivors must be a list of objects with an id'})
+
+    errors = {}
+    plan = {}
+    for entry in entries:
+        try:
+            survivor = int(entry['id'])
+            experience = entry.get('hunt_experience', 0)
+            proficiency = {int(weapon): levels for weapon, levels in (entry.get('proficiency') or {}).items()}
+            clear_wounds = entry.get('clear_wounds', False)
+            wounds = dict(entry.get('wounds') or {})
+        except (AttributeError, KeyError, TypeError, ValueError):
+            errors['survivors'] = 'survivors must be a list of objects with an id'
+            continue
+        if survivor in plan:
+            errors[str(survivor)] = 'A survivor can only progress once per batch'
+        elif not all(_is_int(value) for value in [experience, *proficiency.values()]):
+            errors[str(survivor)] = 'hunt_experience and proficiency levels must be whole numbers'
+        elif not isinstance(clear_wounds, bool):
+            errors[str(survivor)] = 'clear_wounds must be true or false'
+        elif any(field not in WOUND_FIELDS or not isinstance(value, bool) for field, value in wounds.items()):
+            errors[str(survivor)] = f'wounds can only set {", ".join(WOUND_FIELDS)} to true or false'
+        plan[survivor] = {'hunt_experience': experience, 'proficiency': proficiency,
+                          'clear_wounds': clear_wounds, 'wounds': wounds}
+
+    if errors:
+        raise ProgressError(errors)
+
+    survivors = Survivor.objects.in_bulk(plan)
+    for pk in plan:
+        if pk not in survivors:
+            errors[str(pk)] = 'No such survivor'
+    weapons = {weapon for entry in plan.values() for weapon in entry['proficiency']}
+    names = dict(WeaponProficiency.objects.filter(pk__in=weapons).values_list('pk', 'name')) if weapons else {}
+    missing = weapons - set(names)
+    if missing:
+        errors['proficiency'] = f'Unknown weapon proficiencies: {", ".join(map(str, sorted(missing)))}'
+
+    if errors:
+        raise ProgressError(errors)
+    return {'survivors': [(survivors[pk], entry) for pk, entry in plan.items()], 'weapons': names}
+
+
+def apply_progress(plan):
+    """
+    Summary:
+        Apply a validated progression in one transaction: one bulk update of the survivors, and the
+        proficiency levels upserted with one query for the levels held, one bulk update and one bulk insert.
+        Hunt experience and proficiency levels stop at the ends of their tracks.
+
+    Args:
+        plan (dict): The progression, from validate_progress.
+
+    Returns:
+        tuple: The survivors and the proficiency levels written.
+    """
+    entries = plan['survivors']
+    survivors = [survivor for survivor, _ in entries]
+    gains = {(survivor.pk, weapon): levels for survivor, entry in entries for weapon, levels in entry['proficiency'].items()}
+
+    with transaction.atomic():
+        for survivor, entry in entries:
+            survivor.hunt_experience = max(0, min(MAX_HUNT_EXPERIENCE, survivor.hunt_experience + entry['hunt_experience']))
+            if entry['clear_wounds']:
+                for field in WOUND_FIELDS:
+                    setattr(survivor, field, False)
+            for field, value in entry['wounds'].items():
+                setattr(survivor, field, value)
+        Survivor.objects.bulk_update(survivors, ['hunt_experience', *WOUND_FIELDS])
+
+        levels = []
+        if gains:
+            held = {}
+            rows = ProficiencyLevel.objects.filter(survivor__in=survivors, weapon_type__in={weapon for _, weapon in gains})
+            for row in rows.order_by('pk'):
+                held.setdefault((row.survivor_id, row.weapon_type_id), row)
+
+            updated = [row for key, row in held.items() if key in gains]
+            for row in updated:
+                row.level = _level(row.level + gains[(row.survivor_id, row.weapon_type_id)])
+            ProficiencyLevel.objects.bulk_update(updated, ['level'])
+
+            created = [ProficiencyLevel(survivor_id=survivor, weapon_type_id=weapon, name=plan['weapons'][weapon], level=_level(gained))
+                       for (survivor, weapon), gained in gains.items() if (survivor, weapon) not in held]
+            ProficiencyLevel.objects.bulk_create(created)
+            levels = updated + created
+
+        # bulk_update sends no signals, so the survivors' changes are recorded and pushed here
+        record_bulk_changes(survivors, 'save')
+        for survivor in survivors:
+            publish_change(survivor, 'save')
+
+    return survivors, levels
+
+
+def _is_int(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _level(level):
+    return max(0, min(MAX_PROFICIENCY_LEVEL, level))
@@ -0,0 +1,249 @@
+import copy
+import os
+import random
+import threading
+import uuid
+from concurrent.futures import as_completed
+from concurrent.futures.process import BrokenProcessPool
+from django.conf import settings
+from django.db import connection, transaction
+from kingdomdeathapi.models import Projection
+from .showdown import _drop_pool, _worker_pool
+
+# What a settlement does each lantern year unless the request says otherwise
+DEFAULT_STRATEGY = {
+    'hunts': 1,           # Hunts per year
+    'party_size': 4,      # Survivors sent on each hunt
+    'death_rate': 0.1,    # Chance each hunter dies on a hunt
+    'win_rate': 0.7,      # Chance a hunt brings resources home
+    'drops': 4,           # Resources gathered by a successful hunt
+    'intimacy': 1,        # Attempts at a child per year
+    'birth_rate': 0.5,    # Chance each attempt adds a survivor
+    'spend': 2,           # Resources used up per year on innovating and crafting
+}
+
+# Milestones that can be reached in a projection, by milestone type
+MILESTONE_RULES = {
+    'First Child Born': lambda population, births, deaths: births > 0,
+    'First Death': lambda population, births, deaths: deaths > 0,
+    'Population Reaches 15': lambda population, births, deaths: population >= 15,
+}
+
+
+def submit_projection(owner, settlement_id, state, strategy, start_year, years, runs, seed=None):
+    """
+    Summary:
+        Start projecting a settlement's future in the worker processes without waiting for it.
+        The job is kept in the database, so any process can report on it, and the oldest jobs are
+        forgotten once there are more than MAX_PROJECTION_JOBS. A thread of this process records
+        the job's progress and results as its chunks finish.
+
+    Args:
+        owner (int): The user who may read the results.
+        settlement_id (int): The settlement projected.
+        state (dict): The settlement's population, survival_limit, inventory {resource id: amount}
+            and the names of the milestones it has reached.
+        strategy (dict): Overrides of DEFAULT_STRATEGY.
+        start_year (int): The lantern year the settlement is in.
+        years (int): The number of years to project.
+        runs (int): The number of futures to simulate.
+        seed (int): Seed for the random rolls. A random one is used when None.
+
+    Returns:
+        str: The job's id.
+    """
+    if seed is None:
+        seed = random.SystemRandom().randrange(2 ** 32)
+    strategy = {**DEFAULT_STRATEGY, **strategy}
+
+    workers = settings.SIMULATION_WORKERS or os.cpu_count() or 1
+    # A few chunks per worker, so progress can be reported while the job runs
+    chunks = max(1, min(runs // settings.PROJECTION_CHUNK_SIZE, workers * 4))
+    sizes = [runs // chunks + (1 if i < runs % chunks else 0) for i in range(chunks)]
+
+    job = Projection.objects.create(id=uuid.uuid4().hex, owner_id=owner, settlement_id=settlement_id)
+    forgotten = Projection.objects.order_by('-created', '-pk').values_list('pk', flat=True)[settings.MAX_PROJECTION_JOBS:]
+    Projection.objects.filter(pk__in=list(forgotten)).delete()
+
+    pool = _worker_pool(workers)
+    try:
+        futures = [pool.submit(project_chunk, state, strategy, years, size, seed + i) for i, size in enumerate(sizes)]
+    except BrokenProcessPool:
+        # A pool broken by a worker dying takes no more work, so a new one is started
+        _drop_pool(pool)
+        pool = _worker_pool(workers)
+        futures = [pool.submit(project_chunk, state, strategy, years, size, seed + i) for i, size in enumerate(sizes)]
+    watcher = threading.Thread(target=_watch_projection, args=(job.pk, pool, futures, start_year, sorted(state['inventory'])),
+                               daemon=True)
+    # Started once the job is committed, so the thread's own connection can see it
+    transaction.on_commit(watcher.start)
+    return job.pk
+
+
+def projection_status(job_id, owner):
+    """
+    Summary:
+        Check on a projection.
+
+    Args:
+        job_id (str): The job's id.
+        owner (int): The user asking.
+
+    Returns:
+        dict: The job's status and, once it is done, its results per year,
+        or None if there is no such job for the user.
+    """
+    job = Projection.objects.filter(pk=job_id, owner_id=owner).values('status', 'progress', 'message', 'result').first()
+    if job is None:
+        return None
+    if job['status'] == 'failed':
+        return {'id': job_id, 'status': 'failed', 'message': job['message']}
+    if job['status'] == 'running':
+        return {'id': job_id, 'status': 'running', 'progress': job['progress']}
+    return {'id': job_id, 'status': 'done', 'progress': 1.0, **job['result']}
+
+
+def _watch_projection(job_id, pool, futures, start_year, resources):
+    # Runs in its own thread, so it uses and then closes a database connection of its own
+    try:
+        counts = []
+        for future in as_completed(futures):
+            try:
+                counts.append(future.result())
+            except Exception as ex:  # pylint: disable=broad-except
+                for other in futures:
+                    other.cancel()
+                if isinstance(ex, BrokenProcessPool):
+                    # The job is lost with the pool, but the next one gets a new pool
+                    _drop_pool(pool)
+                Projection.objects.filter(pk=job_id).update(status='failed', message=str(ex) or type(ex).__name__)
+                return
+            if len(counts) < len(futures):
+                Projection.objects.filter(pk=job_id).update(progress=len(counts) / len(futures))
+
+        summary = summarize_projection(merge_projections(counts), start_year, resources)
+        Projection.objects.filter(pk=job_id).update(status='done', progress=1.0, result=summary)
+    finally:
+        connection.close()
+
+
+def project_chunk(state, strategy, years, runs, seed):
+    """
+    Summary:
+        Simulate futures of a settlement in the current process.
+
+    Returns:
+        dict: Per year histograms, to be merged with other chunks and summarized.
+    """
+    rng = random.Random(seed).random
+    resources = sorted(state['inventory'])
+    start_stock = [state['inventory'][resource] for resource in resources]
+    kinds = len(resources)
+    rules = [(name, rule) for name, rule in MILESTONE_RULES.items() if name not in state['milestones']]
+
+    hunts, party_size = strategy['hunts'], strategy['party_size']
+    death_rate, win_rate, drops = strategy['death_rate'], strategy['win_rate'], strategy['drops']
+    intimacy, birth_rate, spend = strategy['intimacy'], strategy['birth_rate'], strategy['spend']
+
+    population = [{} for _ in range(years)]
+    stockpiles = [[{} for _ in range(kinds)] for _ in range(years)]
+    limits = [0] * years
+    milestones = [{name: 0 for name, _ in rules} for _ in range(years)]
+
+    for _ in range(runs):
+        alive = state['population']
+        limit = state['survival_limit']
+        stock = list(start_stock)
+        reached = set()
+        births = deaths = 0
+
+        for year in range(years):
+            for _ in range(hunts):
+                party = min(party_size, alive)
+                if not party:
+                    break
+                dead = sum(1 for _ in range(party) if rng() < death_rate)
+                alive -= dead
+                deaths += dead
+                if party > dead and kinds and rng() < win_rate:
+                    for _ in range(drops):
+                        stock[int(rng() * kinds)] += 1
+            for _ in range(intimacy):
+                if alive >= 2 and rng() < birth_rate:
+                    alive += 1
+                    births += 1
+            for _ in range(spend):
+                held = [index for index, amount in enumerate(stock) if amount > 0]
+                if not held:
+                    break
+                stock[held[int(rng() * len(held))]] -= 1
+
+            # Every milestone reached raises the survival limit
+            for name, rule in rules:
+                if name not in reached and rule(alive, births, deaths):
+                    reached.add(name)
+                    limit += 1
+
+            population[year][alive] = population[year].get(alive, 0) + 1
+            for index, amount in enumerate(stock):
+                stockpiles[year][index][amount] = stockpiles[year][index].get(amount, 0) + 1
+            limits[year] += limit
+            for name in reached:
+                milestones[year][name] += 1
+
+    return {'runs': runs, 'population': population, 'stockpiles': stockpiles, 'limits': limits, 'milestones': milestones}
+
+
+def merge_projections(counts):
+    """
+    Summary:
+        Add up the histograms of several chunks, leaving the chunks as they were.
+    """
+    merged = copy.deepcopy(counts[0])
+    for other in counts[1:]:
+        merged['runs'] += other['runs']
+        merged['limits'] = [a + b for a, b in zip(merged['limits'], other['limits'])]
+        for year, histogram in enumerate(other['population']):
+            _add(merged['population'][year], histogram)
+        for year, histograms in enumerate(other['stockpiles']):
+            for index, histogram in enumerate(histograms):
+                _add(merged['stockpiles'][year][index], histogram)
+        for year, reached in enumerate(other['milestones']):
+            _add(merged['milestones'][year], reached)
+    return merged
+
+
+def summarize_projection(counts, start_year, resources):
+    """
+    Summary:
+        Turn histograms into the distribution of each figure per year.
+    """
+    runs = counts['runs']
+    return {
+        'runs': runs,
+        'years': [{
+            'year': start_year + index + 1,
+            'population': _distribution(counts['population'][index], runs),
+            'extinct': counts['population'][index].get(0, 0) / runs,
+            'survival_limit': counts['limits'][index] / runs,
+            'milestones': {name: reached / runs for name, reached in counts['milestones'][index].items()},
+            'resources': {str(resource): _distribution(counts['stockpiles'][index][i], runs) for i, resource in enumerate(resources)},
+        } for index in range(len(counts['limits']))],
+    }
+
+
+def _add(histogram, other):
+    for value, count in other.items():
+        histogram[value] = histogram.get(value, 0) + count
+
+
+def _distribution(histogram, runs):
+    # Percentiles from the histogram's cumulative counts
+    percentiles = {}
+    targets = [('p10', 0.1), ('p50', 0.5), ('p90', 0.9)]
+    seen = 0
+    for value in sorted(histogram):
+        seen += histogram[value]
+        while targets and seen >= targets[0][1] * runs:
+            percentiles[targets.pop(0)[0]] = value
+    return {'mean': sum(value * count for value, count in histogram.items()) / runs, **percentiles}
@@ -0,0 +1,57 @@
+class ResourceIndex:
+    """
+    Summary:
+        An in-memory columnar index over serialized resources.
+
+        Each filterable value, e.g. ('type', 2), ('strange', True) or ('expansion', None), maps to a
+        bitset held in a Python int with one bit per resource. Any combination of include and exclude
+        filters is then a few integer AND/NOT operations over the whole table instead of a joined query.
+    """
+    COLUMNS = ('type', 'consumable', 'monster', 'strange', 'indomitable', 'monster_origin', 'expansion')
+
+    def __init__(self, rows):
+        """
+        Args:
+            rows (list): Serialized resources, as output by the resource serializers, in response order.
+        """
+        self.rows = rows
+        self.all = (1 << len(rows)) - 1
+        self.bitsets = {}
+        for position, row in enumerate(rows):
+            bit = 1 << position
+            keys = [('type', resource_type['id']) for resource_type in row['type']]
+            keys.extend((flag, True) for flag in ('consumable', 'monster', 'strange', 'indomitable') if row[flag])
+            for relation in ('monster_origin', 'expansion'):
+                keys.append((relation, row[relation]['id'] if row[relation] else None))
+            for key in keys:
+                self.bitsets[key] = self.bitsets.get(key, 0) | bit
+
+    def select(self, filters):
+        """
+        Summary:
+            Select the resources matching every filter.
+
+        Args:
+            filters (list): (column, value, include) triples. With include set a resource must have
+                the value, otherwise it must not. A value of None stands for a null relation
+                and a tuple for any of its values.
+
+        Returns:
+            list: The matching serialized resources in index order.
+        """
+        mask = self.all
+        for column, value, include in filters:
+            if isinstance(value, tuple):
+                bits = 0
+                for option in value:
+                    bits |= self.bitsets.get((column, option), 0)
+            else:
+                bits = self.bitsets.get((column, value), 0)
+            mask = mask & bits if include else mask & ~bits
+
+        rows = []
+        while mask:
+            lowest = mask & -mask
+            rows.append(self.rows[lowest.bit_length() - 1])
+            mask ^= lowest
+        return rows
@@ -0,0 +1,114 @@
+from django.db import transaction
+from django.db.models import Sum
+from kingdomdeathapi.models import Resource, SettlementInventory, SettlementResourceTotal
+
+
+def adjust_resource_totals(deltas):
+    """
+    Summary:
+        Move a settlement's resource type totals on by changes to its inventory, as one batch: a query for
+        the resources' types, one for the totals held, one bulk update and one bulk insert.
+        Call it in the same transaction as the inventory write it follows.
+
+    Args:
+        deltas (dict): The change in amount by (settlement id, resource id).
+    """
+    deltas = {key: delta for key, delta in deltas.items() if delta}
+    if not deltas:
+        return
+
+    types = {}
+    links = Resource.type.through.objects.filter(resource_id__in={resource for _, resource in deltas})
+    for resource, resource_type in links.values_list('resource_id', 'resourcetype_id'):
+        types.setdefault(resource, []).append(resource_type)
+
+    changes = {}
+    for (settlement, resource), delta in deltas.items():
+        for resource_type in types.get(resource, ()):
+            changes[(settlement, resource_type)] = changes.get((settlement, resource_type), 0) + delta
+    if not changes:
+        return
+
+    with transaction.atomic():
+        held = SettlementResourceTotal.objects.select_for_update().filter(
+            settlement_id__in={settlement for settlement, _ in changes},
+            resource_type_id__in={resource_type for _, resource_type in changes})
+        updated = []
+        for row in held:
+            key = (row.settlement_id, row.resource_type_id)
+            if key in changes:
+                row.total += changes.pop(key)
+                updated.append(row)
+        SettlementResourceTotal.objects.bulk_update(updated, ['total'])
+        # A total that is missing but taken from is out of step, so its settlement is worked out again instead
+        stale = {settlement for (settlement, _), delta in changes.items() if delta < 0}
+        SettlementResourceTotal.objects.bulk_create([
+            SettlementResourceTotal(settlement_id=settlement, resource_type_id=resource_type, total=delta)
+            for (settlement, resource_type), delta in changes.items() if settlement not in stale
+        ])
+        if stale:
+            rebuild_resource_totals(sorted(stale))
+
+
+def expected_resource_totals(settlement_ids=None):
+    """
+    Summary:
+        Work out resource type totals from the inventory itself, with one aggregate query.
+
+    Args:
+        settlement_ids (list): The settlements to work out, or None for all of them.
+
+    Returns:
+        dict: The total by (settlement id, resource type id), leaving out totals of 0.
+    """
+    inventory = SettlementInventory.objects.filter(resource__type__isnull=False)
+    if settlement_ids is not None:
+        inventory = inventory.filter(settlement_id__in=settlement_ids)
+    rows = inventory.values('settlement_id', 'resource__type').annotate(total=Sum('amount')).order_by()
+    return {(row['settlement_id'], row['resource__type']): row['total'] for row in rows if row['total']}
+
+
+def rebuild_resource_totals(settlement_ids=None):
+    """
+    Summary:
+        Replace resource type totals with ones worked out from the inventory.
+
+    Args:
+        settlement_ids (list): The settlements to rebuild, or None for all of them.
+
+    Returns:
+        int: The number of totals written.
+    """
+    expected = expected_resource_totals(settlement_ids)
+    with transaction.atomic():
+        totals = SettlementResourceTotal.objects.all()
+        if settlement_ids is not None:
+            totals = totals.filter(settlement_id__in=settlement_ids)
+        totals.delete()
+        SettlementResourceTotal.objects.bulk_create([
+            SettlementResourceTotal(settlement_id=settlement, resource_type_id=resource_type, total=total)
+            for (settlement, resource_type), total in sorted(expected.items())
+        ])
+    return len(expected)
+
+
+def check_resource_totals(settlement_ids=None):
+    """
+    Summary:
+        Compare resource type totals with ones worked out from the inventory.
+
+    Args:
+        settlement_ids (list): The settlements to check, or None for all of them.
+
+    Returns:
+        list: A (settlement id, resource type id, expected, actual) tuple per total that differs.
+    """
+    expected = expected_resource_totals(settlement_ids)
+    totals = SettlementResourceTotal.objects.all()
+    if settlement_ids is not None:
+        totals = totals.filter(settlement_id__in=settlement_ids)
+    actual = {(settlement, resource_type): total
+              for settlement, resource_type, total in totals.values_list('settlement_id', 'resource_type_id', 'total') if total}
+    return [(settlement, resource_type, expected.get((settlement, resource_type), 0), actual.get((settlement, resource_type), 0))
+            for settlement, resource_type in sorted(expected.keys() | actual.keys())
+            if expected.get((settlement, resource_type), 0) != actual.get((settlement, resource_type), 0)]
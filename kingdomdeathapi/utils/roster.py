@@ -0,0 +1,68 @@
+from django.db.models import Count, Q
+from kingdomdeathapi.models import Player, Survivor
+from .showdown import LOCATIONS
+
+
+def settlement_roster(settlement_id):
+    """
+    Summary:
+        The survivors who can hunt for a settlement: those of its game master and of every player
+        hosting or playing one of its sessions. This is the inverse of change_settlements.
+
+    Args:
+        settlement_id (int): The settlement.
+
+    Returns:
+        QuerySet: The survivors, ordered by id.
+    """
+    players = Player.objects.filter(
+        Q(settlements=settlement_id) | Q(hosting_session__settlement=settlement_id) | Q(participating__settlement=settlement_id))
+    return Survivor.objects.filter(user__in=players.values('pk')).order_by('id')
+
+
+
+# Stats returned for every survivor alongside the derived columns
+ROSTER_FIELDS = ('id', 'name', 'survival', 'insanity', 'hunt_experience', 'movement', 'accuracy', 'strength', 'evasion',
+                 'speed', 'luck', 'understanding', 'courage')
+
+# A survivor with at least this much insanity is insane
+INSANITY_THRESHOLD = 3
+
+_ARMOR = tuple(f'{location}_armor' for location in LOCATIONS)
+_LIGHT = tuple(f'{location}_light_wound' for location in LOCATIONS[1:])
+_HEAVY = ('head_wound',) + tuple(f'{location}_heavy_wound' for location in LOCATIONS[1:])
+
+
+def roster_columns(survivors):
+    """
+    Summary:
+        Work out the derived stats of a whole roster a column at a time: total armor, light and heavy wounds,
+        whether each survivor can hunt, whether they are insane, and their disorder and fighting art counts.
+        The rows come from a single values_list query and are transposed into columns, so each derived
+        column is one pass over plain lists.
+
+    Args:
+        survivors (QuerySet): The survivors.
+
+    Returns:
+        dict: A list per column, in the order of the survivors.
+    """
+    lookups = ROSTER_FIELDS + _ARMOR + _LIGHT + _HEAVY
+    rows = list(survivors.order_by('pk').annotate(
+        disorders=Count('disorder', distinct=True), fighting_arts=Count('fighting_art', distinct=True),
+    ).values_list(*lookups, 'disorders', 'fighting_arts'))
+    names = (*lookups, 'disorders', 'fighting_arts')
+    columns = dict(zip(names, map(list, zip(*rows)))) if rows else {name: [] for name in names}
+
+    heavy = [sum(wounds) for wounds in zip(*(columns[field] for field in _HEAVY))]
+    return {
+        **{field: columns[field] for field in ROSTER_FIELDS},
+        'total_armor': [sum(armor) for armor in zip(*(columns[field] for field in _ARMOR))],
+        'light_wounds': [sum(wounds) for wounds in zip(*(columns[field] for field in _LIGHT))],
+        'heavy_wounds': heavy,
+        # A heavy wound anywhere keeps a survivor home
+        'can_hunt': [wounds == 0 for wounds in heavy],
+        'insane': [insanity >= INSANITY_THRESHOLD for insanity in columns['insanity']],
+        'disorders': columns['disorders'],
+        'fighting_arts': columns['fighting_arts'],
+    }
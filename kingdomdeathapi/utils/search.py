@@ -0,0 +1,170 @@
+import html
+import re
+from django.db import connection
+from kingdomdeathapi.models import Ability, Disorder, FightingArt, Impairment, Resource, WeaponProficiency
+
+SEARCH_TABLE = 'kingdomdeathapi_search'
+
+# Searchable kind, model and the text fields indexed as the card body
+SEARCH_KINDS = (
+    ('ability', Ability, ('effect',)),
+    ('disorder', Disorder, ('flavor_text', 'effect')),
+    ('fighting_art', FightingArt, ('effect',)),
+    ('weapon_proficiency', WeaponProficiency, ('specialist_effect', 'master_effect')),
+    ('resource', Resource, ('effect', 'flavor_text')),
+    ('impairment', Impairment, ('effect',)),
+)
+
+SEARCH_MODELS = {model: index for index, (kind, model, fields) in enumerate(SEARCH_KINDS)}
+
+# Matches in the name count for more than matches in the card text
+NAME_WEIGHT = 10.0
+BODY_WEIGHT = 1.0
+
+# Marks FTS5 puts around matches, private use characters that card text has no use for.
+# They become <mark> tags once the text around them is escaped.
+MATCH_START = '\ue000'
+MATCH_END = '\ue001'
+
+# Whether the SQLite library was built with FTS5, which does not change while the process runs
+_fts5 = None
+
+
+def search_available():
+    """
+    Summary:
+        Check whether the database can hold the search index. It needs SQLite built with the FTS5 extension.
+
+    Returns:
+        bool: True if search is available.
+    """
+    global _fts5  # pylint: disable=global-statement
+    if connection.vendor != 'sqlite':
+        return False
+    if _fts5 is None:
+        with connection.cursor() as cursor:
+            cursor.execute('PRAGMA compile_options')
+            _fts5 = 'ENABLE_FTS5' in {option for option, in cursor.fetchall()}
+    return _fts5
+
+
+def ensure_search_index():
+    """
+    Summary:
+        Create the FTS5 table if it does not exist yet. Migrations create it, this is for databases built otherwise.
+        Rows are keyed by rowid = primary key * number of kinds + kind index, so writes never scan the table.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5(name, body, tokenize='porter unicode61')")
+
+
+def rebuild_search_index():
+    """
+    Summary:
+        Recreate every row of the search index from the catalog tables.
+    """
+    ensure_search_index()
+    rows = []
+    for index, (kind, model, fields) in enumerate(SEARCH_KINDS):
+        for pk, name, *texts in model.objects.values_list('pk', 'name', *fields):
+            rows.append((_rowid(pk, index), name, _body(texts)))
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {SEARCH_TABLE}")
+        cursor.executemany(f"INSERT INTO {SEARCH_TABLE} (rowid, name, body) VALUES (%s, %s, %s)", rows)
+
+
+def index_instance(instance):
+    """
+    Summary:
+        Add or replace the search row for a saved catalog object.
+
+    Args:
+        instance (Model): An instance of one of the searchable models.
+    """
+    index = SEARCH_MODELS[type(instance)]
+    kind, model, fields = SEARCH_KINDS[index]
+    rowid = _rowid(instance.pk, index)
+    texts = [getattr(instance, field) for field in fields]
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {SEARCH_TABLE} WHERE rowid = %s", [rowid])
+        cursor.execute(f"INSERT INTO {SEARCH_TABLE} (rowid, name, body) VALUES (%s, %s, %s)",
+                       [rowid, instance.name, _body(texts)])
+
+
+def unindex_instance(instance):
+    """
+    Summary:
+        Remove the search row for a deleted catalog object.
+
+    Args:
+        instance (Model): An instance of one of the searchable models.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {SEARCH_TABLE} WHERE rowid = %s",
+                       [_rowid(instance.pk, SEARCH_MODELS[type(instance)])])
+
+
+def search(text, kinds=None, limit=20):
+    """
+    Summary:
+        Search card names and text, ranked by BM25 with the matches highlighted.
+        Every word must match, and the last word also matches as a prefix so partial input finds results.
+
+    Args:
+        text (str): The words to search for.
+        kinds (list): Only return these kinds, e.g. ["ability", "disorder"]. All kinds when empty.
+        limit (int): The maximum number of results.
+
+    Returns:
+        list: A dictionary per match with its kind, id, name, highlighted name, snippet and rank.
+        The highlighted name and snippet are HTML, with the card text escaped and matches in <mark> tags.
+    """
+    words = re.findall(r'\w+', text.lower())
+    if not words:
+        return []
+    # Quoting every word keeps FTS5 operators typed by users from being interpreted
+    query = ' '.join(f'"{word}"' for word in words) + '*'
+
+    sql = (f"SELECT rowid, name, highlight({SEARCH_TABLE}, 0, '{MATCH_START}', '{MATCH_END}'), "
+           f"snippet({SEARCH_TABLE}, 1, '{MATCH_START}', '{MATCH_END}', '…', 16), "
+           f"bm25({SEARCH_TABLE}, {NAME_WEIGHT}, {BODY_WEIGHT}) AS rank "
+           f"FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s")
+    params = [query]
+    if kinds:
+        indexes = [index for index, (kind, model, fields) in enumerate(SEARCH_KINDS) if kind in kinds]
+        sql += f" AND rowid %% {len(SEARCH_KINDS)} IN ({', '.join(['%s'] * len(indexes)) or 'NULL'})"
+        params.extend(indexes)
+    sql += " ORDER BY rank LIMIT %s"
+    params.append(limit)
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+
+    results = []
+    for rowid, name, highlighted, snippet, rank in rows:
+        pk, index = divmod(rowid, len(SEARCH_KINDS))
+        results.append({
+            'kind': SEARCH_KINDS[index][0],
+            'id': pk,
+            'name': name,
+            'highlight': _marked(highlighted),
+            'snippet': _marked(snippet),
+            'rank': rank,
+        })
+    return results
+
+
+def _rowid(pk, index):
+    return pk * len(SEARCH_KINDS) + index
+
+
+def _body(texts):
+    return '\n'.join(text for text in texts if text)
+
+
+def _marked(text):
+    return html.escape(text).replace(MATCH_START, '<mark>').replace(MATCH_END, '</mark>')
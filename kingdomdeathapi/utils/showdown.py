@@ -0,0 +1,254 @@
+import multiprocessing
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import django
+from django.conf import settings
+
+# Hit locations in survivor order, and the d10 hit location table
+LOCATIONS = ('head', 'arm', 'body', 'waist', 'leg')
+HIT_LOCATIONS = (0, 0, 1, 1, 2, 2, 3, 3, 4, 4)
+
+# Survivor fields the simulation reads
+SURVIVOR_FIELDS = ('id', 'name', 'movement', 'accuracy', 'strength', 'evasion', 'speed', 'luck',
+                   'head_armor', 'head_wound', 'arm_armor', 'arm_light_wound', 'arm_heavy_wound',
+                   'body_armor', 'body_light_wound', 'body_heavy_wound', 'waist_armor', 'waist_light_wound',
+                   'waist_heavy_wound', 'leg_armor', 'leg_light_wound', 'leg_heavy_wound')
+
+# A survivor hits on a d10 of at least this, less their accuracy, plus the monster's evasion
+SURVIVOR_HIT_TARGET = 7
+# Strength of the weapon every survivor is assumed to carry, added to theirs when rolling to wound
+WEAPON_STRENGTH = 2
+# A monster hits on a d10 of at least this, less its accuracy, plus the survivor's evasion
+MONSTER_HIT_TARGET = 5
+# Showdowns still running after this many rounds end with the monster fleeing
+MAX_ROUNDS = 20
+
+# Level 1 stats by kind of monster. Health is the number of wounds it takes to kill.
+MONSTER_KINDS = {
+    'quarry': {'toughness': 8, 'evasion': 0, 'accuracy': 0, 'speed': 1, 'damage': 1, 'movement': 6, 'health': 9},
+    'nemesis': {'toughness': 10, 'evasion': 1, 'accuracy': 1, 'speed': 2, 'damage': 2, 'movement': 6, 'health': 11},
+    'legendary': {'toughness': 14, 'evasion': 2, 'accuracy': 2, 'speed': 2, 'damage': 3, 'movement': 8, 'health': 15},
+}
+
+# Monsters that differ from the stats of their kind
+MONSTER_PROFILES = {
+    'White Lion': {'toughness': 8, 'movement': 6, 'health': 10},
+    'Screaming Antelope': {'toughness': 8, 'evasion': 1, 'movement': 8, 'health': 10},
+    'Phoenix': {'toughness': 10, 'evasion': 2, 'movement': 8, 'health': 12},
+    'Butcher': {'toughness': 9, 'speed': 2, 'damage': 2, 'health': 10},
+    'Dragon King': {'toughness': 12, 'damage': 2, 'movement': 8, 'health': 13},
+    'Sunstalker': {'toughness': 11, 'evasion': 1, 'movement': 8, 'health': 12},
+    'Gorm': {'toughness': 10, 'damage': 2, 'movement': 5, 'health': 12},
+}
+
+# Added per level above 1
+LEVEL_BONUS = {'toughness': 2, 'accuracy': 1, 'damage': 1, 'health': 3}
+
+_pool = (None, None)
+
+
+def monster_profile(monster, level=1):
+    """
+    Summary:
+        The stats a monster is simulated with.
+
+    Args:
+        monster (Monster): The monster.
+        level (int): The monster's level, 1 to 3.
+
+    Returns:
+        dict: Its toughness, evasion, accuracy, speed, damage, movement and health.
+    """
+    if monster.legendary:
+        kind = 'legendary'
+    elif monster.nemesis:
+        kind = 'nemesis'
+    else:
+        kind = 'quarry'
+    profile = {**MONSTER_KINDS[kind], **MONSTER_PROFILES.get(monster.name, {})}
+    for stat, bonus in LEVEL_BONUS.items():
+        profile[stat] += bonus * (level - 1)
+    return profile
+
+
+def simulate_showdowns(party, profile, runs, seed=None):
+    """
+    Summary:
+        Simulate showdowns of a party against a monster, spread over worker processes when there are enough runs.
+        Results are reproducible for a seed and a SIMULATION_WORKERS setting.
+
+    Args:
+        party (list): A dictionary of SURVIVOR_FIELDS per survivor.
+        profile (dict): The monster's stats, from monster_profile.
+        runs (int): The number of showdowns to simulate.
+        seed (int): Seed for the random rolls. A random one is used when None.
+
+    Returns:
+        dict: The win rate, rounds taken, distribution of survivors dying, and per survivor outcomes.
+    """
+    if seed is None:
+        seed = random.SystemRandom().randrange(2 ** 32)
+
+    workers = settings.SIMULATION_WORKERS or os.cpu_count() or 1
+    chunks = min(workers, max(1, runs // settings.SIMULATION_CHUNK_SIZE))
+    sizes = [runs // chunks + (1 if i < runs % chunks else 0) for i in range(chunks)]
+
+    if chunks == 1:
+        counts = [simulate_chunk(party, profile, runs, seed)]
+    else:
+        chunk_args = ([party] * chunks, [profile] * chunks, sizes, [seed + i for i in range(chunks)])
+        pool = _worker_pool(workers)
+        try:
+            counts = list(pool.map(simulate_chunk, *chunk_args))
+        except BrokenProcessPool:
+            # A worker that dies, e.g. killed for its memory, breaks the whole pool, so it is replaced and the runs tried again
+            _drop_pool(pool)
+            counts = list(_worker_pool(workers).map(simulate_chunk, *chunk_args))
+    return summarize(party, merge_counts(counts))
+
+
+def simulate_chunk(party, profile, runs, seed):
+    """
+    Summary:
+        Simulate showdowns in the current process.
+
+    Returns:
+        dict: Raw counts, to be merged with other chunks and summarized.
+    """
+    rng = random.Random(seed).random
+    size = len(party)
+
+    # Per survivor thresholds, worked out once rather than every roll
+    hit_at = [max(2, SURVIVOR_HIT_TARGET - s['accuracy'] + profile['evasion']) for s in party]
+    crit_at = [max(2, 10 - s['luck']) for s in party]
+    wound_at = [profile['toughness'] + 1 - s['strength'] - WEAPON_STRENGTH for s in party]
+    attacks = [max(1, s['speed']) + (1 if s['movement'] >= profile['movement'] else 0) for s in party]
+    struck_at = [max(2, MONSTER_HIT_TARGET - profile['accuracy'] + s['evasion']) for s in party]
+    start_armor = [[s[f'{location}_armor'] for location in LOCATIONS] for s in party]
+    start_state = [[2 if s['head_wound'] else 0] +
+                   [2 if s[f'{location}_heavy_wound'] else 1 if s[f'{location}_light_wound'] else 0
+                    for location in LOCATIONS[1:]] for s in party]
+
+    wins = rounds_total = 0
+    deaths = [0] * (size + 1)
+    died = [0] * size
+    severe = [0] * size
+    injuries = [[0] * len(LOCATIONS) for _ in range(size)]
+
+    for _ in range(runs):
+        health = profile['health']
+        armor = [list(row) for row in start_armor]
+        state = [list(row) for row in start_state]
+        alive = list(range(size))
+        rounds = 0
+
+        while health > 0 and alive and rounds < MAX_ROUNDS:
+            rounds += 1
+            for index in alive:
+                for _ in range(attacks[index]):
+                    roll = int(rng() * 10) + 1
+                    if roll < 10 and roll < hit_at[index]:
+                        continue
+                    wound_roll = int(rng() * 10) + 1
+                    if roll >= crit_at[index] or wound_roll == 10 or wound_roll >= wound_at[index]:
+                        health -= 1
+                        if health == 0:
+                            break
+                if health <= 0:
+                    break
+            if health <= 0:
+                break
+
+            for _ in range(profile['speed']):
+                if not alive:
+                    break
+                target = alive[int(rng() * len(alive))]
+                roll = int(rng() * 10) + 1
+                if roll < 10 and roll < struck_at[target]:
+                    continue
+                location = HIT_LOCATIONS[int(rng() * 10)]
+                for _ in range(profile['damage']):
+                    if armor[target][location] > 0:
+                        armor[target][location] -= 1
+                    elif state[target][location] < 2:
+                        # The head has no light wound
+                        state[target][location] = 2 if location == 0 else state[target][location] + 1
+                    else:
+                        severe[target] += 1
+                        injury = int(rng() * 10) + 1
+                        if injury <= (3 if location == 0 else 2):
+                            died[target] += 1
+                            alive.remove(target)
+                            break
+                        if injury <= 6:
+                            injuries[target][location] += 1
+
+        rounds_total += rounds
+        if health <= 0:
+            wins += 1
+        deaths[size - len(alive)] += 1
+
+    return {'runs': runs, 'wins': wins, 'rounds': rounds_total, 'deaths': deaths, 'died': died, 'severe': severe,
+            'injuries': injuries}
+
+
+def merge_counts(counts):
+    """
+    Summary:
+        Add up the raw counts of several chunks.
+    """
+    merged = counts[0]
+    for other in counts[1:]:
+        merged = {
+            'runs': merged['runs'] + other['runs'],
+            'wins': merged['wins'] + other['wins'],
+            'rounds': merged['rounds'] + other['rounds'],
+            'deaths': [a + b for a, b in zip(merged['deaths'], other['deaths'])],
+            'died': [a + b for a, b in zip(merged['died'], other['died'])],
+            'severe': [a + b for a, b in zip(merged['severe'], other['severe'])],
+            'injuries': [[a + b for a, b in zip(mine, theirs)] for mine, theirs in zip(merged['injuries'], other['injuries'])],
+        }
+    return merged
+
+
+def summarize(party, counts):
+    """
+    Summary:
+        Turn raw counts into rates per showdown.
+    """
+    runs = counts['runs']
+    return {
+        'runs': runs,
+        'win_rate': counts['wins'] / runs,
+        'mean_rounds': counts['rounds'] / runs,
+        'deaths': {str(dead): count / runs for dead, count in enumerate(counts['deaths'])},
+        'survivors': [{
+            'id': survivor['id'],
+            'name': survivor['name'],
+            'death_rate': counts['died'][index] / runs,
+            'severe_injuries': counts['severe'][index] / runs,
+            'injuries': {location: counts['injuries'][index][i] / runs for i, location in enumerate(LOCATIONS)},
+        } for index, survivor in enumerate(party)],
+    }
+
+
+def _worker_pool(workers):
+    global _pool  # pylint: disable=global-statement
+    # Started once and reused, as starting worker processes costs far more than a request. Workers are
+    # started fresh rather than forked from a server with threads running, and set Django up first.
+    if _pool[0] != workers:
+        if _pool[1] is not None:
+            _pool[1].shutdown(wait=False)
+        context = multiprocessing.get_context(settings.SIMULATION_START_METHOD)
+        _pool = (workers, ProcessPoolExecutor(workers, mp_context=context, initializer=django.setup))
+    return _pool[1]
+
+
+def _drop_pool(pool):
+    global _pool  # pylint: disable=global-statement
+    # Only if it is still the pool in use, as another request may have replaced it already
+    if _pool[1] is pool:
+        pool.shutdown(wait=False, cancel_futures=True)
+        _pool = (None, None)
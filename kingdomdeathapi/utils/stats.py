@@ -0,0 +1,61 @@
+from django.db.models import Avg, Count, Max, Q, Sum
+from kingdomdeathapi.models import MilestoneType, SettlementEvent, SettlementInventory
+from .roster import settlement_roster
+
+# Survivor attributes summarized by settlement_stats
+SURVIVOR_ATTRIBUTES = ('survival', 'insanity', 'hunt_experience', 'movement', 'accuracy', 'strength', 'evasion', 'speed',
+                       'luck', 'understanding', 'courage')
+
+
+def settlement_stats(settlement_id):
+    """
+    Summary:
+        Summarize a settlement's survivors, inventory, milestones and timeline. Every figure is
+        aggregated in the database, with one query per group, so no rows are loaded into Python.
+
+    Args:
+        settlement_id (int): The settlement.
+
+    Returns:
+        dict: The survivor count with the mean and max of each attribute, the inventory totals overall and
+        by resource type, the milestones reached out of all milestone types, and the number of events per year.
+    """
+    aggregates = {}
+    for attribute in SURVIVOR_ATTRIBUTES:
+        aggregates[f'{attribute}__mean'] = Avg(attribute)
+        aggregates[f'{attribute}__max'] = Max(attribute)
+    survivors = settlement_roster(settlement_id).order_by().aggregate(count=Count('pk'), **aggregates)
+
+    inventory = SettlementInventory.objects.filter(settlement_id=settlement_id)
+    totals = inventory.aggregate(total=Sum('amount'), resources=Count('resource', distinct=True))
+    # A resource with several types counts towards each of them
+    by_type = inventory.filter(resource__type__isnull=False).values('resource__type', 'resource__type__name') \
+        .annotate(total=Sum('amount'), resources=Count('resource', distinct=True)).order_by('resource__type')
+
+    milestones = MilestoneType.objects.aggregate(
+        total=Count('pk', distinct=True),
+        achieved=Count('achievements__milestone_type', distinct=True,
+                       filter=Q(achievements__settlement=settlement_id, achievements__achieved=True)))
+
+    years = SettlementEvent.objects.filter(settlement_id=settlement_id).values('year') \
+        .annotate(events=Count('pk')).order_by('year')
+
+    return {
+        'survivors': {
+            'count': survivors['count'],
+            'attributes': {attribute: {'mean': survivors[f'{attribute}__mean'], 'max': survivors[f'{attribute}__max']}
+                           for attribute in SURVIVOR_ATTRIBUTES},
+        },
+        'inventory': {
+            'total': totals['total'] or 0,
+            'resources': totals['resources'],
+            'types': [{'type': {'id': row['resource__type'], 'name': row['resource__type__name']},
+                       'total': row['total'], 'resources': row['resources']} for row in by_type],
+        },
+        'milestones': {
+            'achieved': milestones['achieved'],
+            'total': milestones['total'],
+            'ratio': milestones['achieved'] / milestones['total'] if milestones['total'] else 0.0,
+        },
+        'events_per_year': [{'year': row['year'], 'events': row['events']} for row in years],
+    }
@@ -0,0 +1,208 @@
+from django.db import transaction
+from django.db.models import Sum
+from kingdomdeathapi.models import Event, Milestone, MilestoneType, Resource, SettlementEvent, SettlementInventory, Survivor
+from .broker import publish_change
+from .changes import record_bulk_changes, record_changes
+from .inventory import InventoryError, add_to_inventory
+from .roster import settlement_roster
+
+TURN_SECTIONS = ('population', 'survival_limit', 'inventory', 'milestones', 'events', 'survivors')
+
+# Survivor fields a turn can set, and the type of each
+SURVIVOR_TURN_FIELDS = {
+    field.name: bool if field.get_internal_type() == 'BooleanField' else str if field.get_internal_type() == 'CharField' else int
+    for field in Survivor._meta.concrete_fields if field.name not in ('id', 'user')
+}
+
+
+class TurnError(ValueError):
+    """A turn document is malformed or names something that does not exist."""
+
+    def __init__(self, errors):
+        super().__init__('The turn is invalid')
+        self.errors = errors
+
+
+def validate_turn(settlement_id, document):
+    """
+    Summary:
+        Check a whole settlement phase before any of it is applied. Every id the turn names is looked up
+        with one query per kind of row, whatever the size of the turn.
+
+    Args:
+        settlement_id (int): The settlement.
+        document (dict): The turn, with any of TURN_SECTIONS.
+
+    Returns:
+        dict: The turn in a normalized form for apply_turn, with the survivors to update loaded.
+
+    Raises:
+        TurnError: With the problems found, by section.
+    """
+    if not isinstance(document, dict):
+        raise TurnError({'turn': 'The turn must be an object'})
+    errors = {}
+    unknown = set(document) - set(TURN_SECTIONS)
+    if unknown:
+        errors['turn'] = f'Unknown sections: {", ".join(sorted(unknown))}'
+
+    turn = {'settlement': {}, 'inventory': {}, 'milestones': [], 'events': [], 'survivors': {}}
+    for field in ('population', 'survival_limit'):
+        if field in document:
+            if not _is_int(document[field]) or document[field] < 0:
+                errors[field] = f'{field} must be a whole number of at least 0'
+            else:
+                turn['settlement'][field] = document[field]
+
+    try:
+        for resource, amount in dict(document.get('inventory') or {}).items():
+            if not _is_int(amount):
+                raise ValueError
+            turn['inventory'][int(resource)] = turn['inventory'].get(int(resource), 0) + amount
+    except (TypeError, ValueError):
+        errors['inventory'] = 'inventory must map resource ids to the whole amounts added or taken away'
+
+    try:
+        milestones = list(document.get('milestones') or [])
+        if not all(_is_int(milestone) for milestone in milestones):
+            raise ValueError
+        turn['milestones'] = list(dict.fromkeys(milestones))
+    except (TypeError, ValueError):
+        errors['milestones'] = 'milestones must be a list of milestone type ids'
+
+    try:
+        for event in document.get('events') or []:
+            if not _is_int(event['event']) or not _is_int(event['year']):
+                raise ValueError
+            turn['events'].append((event['event'], event['year']))
+    except (KeyError, TypeError, ValueError):
+        errors['events'] = 'events must be a list of objects with an event id and a year'
+
+    try:
+        for change in document.get('survivors') or []:
+            fields = {field: value for field, value in change.items() if field != 'id'}
+            bad = [field for field, value in fields.items()
+                   if field not in SURVIVOR_TURN_FIELDS or not _is_type(value, SURVIVOR_TURN_FIELDS[field])]
+            if bad:
+                errors['survivors'] = f'Survivors cannot have these fields set to those values: {", ".join(sorted(bad))}'
+            turn['survivors'].setdefault(int(change['id']), {}).update(fields)
+    except (AttributeError, KeyError, TypeError, ValueError):
+        errors['survivors'] = 'survivors must be a list of objects with an id and the fields to set'
+
+    if errors:
+        raise TurnError(errors)
+
+    missing = _missing(Resource, turn['inventory'])
+    if missing:
+        errors['inventory'] = f'Unknown resources: {missing}'
+    else:
+        held = dict(SettlementInventory.objects.filter(settlement_id=settlement_id, resource_id__in=turn['inventory'])
+                    .values('resource_id').annotate(total=Sum('amount')).values_list('resource_id', 'total'))
+        short = [resource for resource, amount in turn['inventory'].items() if held.get(resource, 0) + amount < 0]
+        if short:
+            errors['inventory'] = f'Not enough of resources: {", ".join(map(str, sorted(short)))}'
+
+    missing = _missing(MilestoneType, turn['milestones'])
+    if missing:
+        errors['milestones'] = f'Unknown milestone types: {missing}'
+
+    missing = _missing(Event, [event for event, _ in turn['events']])
+    if missing:
+        errors['events'] = f'Unknown events: {missing}'
+
+    survivors = settlement_roster(settlement_id).in_bulk(turn['survivors'])
+    missing = [pk for pk in turn['survivors'] if pk not in survivors]
+    if missing:
+        errors['survivors'] = f'Survivors not in the settlement: {", ".join(map(str, missing))}'
+
+    if errors:
+        raise TurnError(errors)
+    turn['survivors'] = [(survivors[pk], fields) for pk, fields in turn['survivors'].items()]
+    return turn
+
+
+def apply_turn(settlement, turn):
+    """
+    Summary:
+        Apply a validated turn in one transaction, with a bulk write per kind of row.
+        Nothing is applied if any part fails.
+
+    Args:
+        settlement (Settlement): The settlement.
+        turn (dict): The turn, from validate_turn.
+
+    Returns:
+        dict: The ids of the rows written, by section.
+
+    Raises:
+        TurnError: If the inventory no longer holds what the turn takes away, as another request
+            took it after the turn was validated.
+    """
+    with transaction.atomic():
+        if turn['settlement']:
+            for field, value in turn['settlement'].items():
+                setattr(settlement, field, value)
+            settlement.save(update_fields=list(turn['settlement']))
+
+        try:
+            # The amounts are checked again under the row locks, which also rolls back the settlement's fields
+            inventory, _ = add_to_inventory(settlement.pk, turn['inventory'])
+        except InventoryError as ex:
+            raise TurnError({'inventory': str(ex)})
+
+        milestones = []
+        if turn['milestones']:
+            held = {}
+            for milestone in Milestone.objects.filter(settlement=settlement, milestone_type__in=turn['milestones']).order_by('pk'):
+                held.setdefault(milestone.milestone_type_id, milestone)
+            reached = [milestone for milestone in held.values() if not milestone.achieved]
+            for milestone in reached:
+                milestone.achieved = True
+            Milestone.objects.bulk_update(reached, ['achieved'])
+            created = [Milestone(settlement=settlement, milestone_type_id=milestone_type, achieved=True)
+                       for milestone_type in turn['milestones'] if milestone_type not in held]
+            Milestone.objects.bulk_create(created)
+            milestones = reached + created
+
+        events = SettlementEvent.objects.bulk_create(
+            [SettlementEvent(settlement=settlement, event_id=event, year=year) for event, year in turn['events']])
+
+        # Bulk writes send no signals, so their changes are recorded and pushed here
+        record_changes(settlement.pk, [('milestone', row.pk, 'save') for row in milestones] +
+                       [('settlement_event', row.pk, 'save') for row in events])
+        for row in milestones + events:
+            publish_change(row, 'save')
+
+        survivors = [survivor for survivor, _ in turn['survivors']]
+        fields = set()
+        for survivor, changes in turn['survivors']:
+            for field, value in changes.items():
+                setattr(survivor, field, value)
+            fields.update(changes)
+        if fields:
+            Survivor.objects.bulk_update(survivors, sorted(fields))
+            record_bulk_changes(survivors, 'save')
+            for survivor in survivors:
+                publish_change(survivor, 'save')
+
+    return {
+        'inventory': [row.pk for row in inventory],
+        'milestones': [row.pk for row in milestones],
+        'events': [row.pk for row in events],
+        'survivors': [survivor.pk for survivor in survivors],
+    }
+
+
+def _is_int(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_type(value, kind):
+    return _is_int(value) if kind is int else isinstance(value, kind)
+
+
+def _missing(model, ids):
+    if not ids:
+        return ''
+    found = set(model.objects.filter(pk__in=ids).values_list('pk', flat=True))
+    return ', '.join(str(pk) for pk in ids if pk not in found)
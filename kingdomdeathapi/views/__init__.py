@@ -1,4 +1,5 @@
 from .auth import login_user, register_user
+from .batch import batch_requests
 from .player import PlayerView
 from .settlement import SettlementView
 from .resource import ResourceView
@@ -13,3 +14,11 @@ from .survivor import SurvivorView
 from .settlement_inventory import SettlementInventoryView
 from .settlement_event import SettlementEventView
 from .session import SessionView
+from .catalog import CatalogView
+from .search import SearchView
+from .autocomplete import AutocompleteView
+from .async_read import resource_list, resource_detail, settlement_list, settlement_detail, survivor_list, survivor_detail
+from .async_read import ability_list, disorder_list, fighting_art_list, weapon_proficiency_list, event_list
+from .simulation import simulate_showdown
+from .projection import projection_detail
+from .proficiency_level import ProficiencyLevelView
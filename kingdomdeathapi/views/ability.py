@@ -2,8 +2,8 @@ from rest_framework import serializers
 from rest_framework.viewsets import ViewSet
 from rest_framework.response import Response
 from rest_framework import status
-from django.db.models import Q
 from kingdomdeathapi.models import Ability, ExpansionType
+from kingdomdeathapi.utils import FilterError, apply_filters, expansion_filters, ids_response
 
 
 class AbilityView(ViewSet):
@@ -17,39 +17,18 @@ class AbilityView(ViewSet):
             request (HttpRequest): The full HTTP request object.
 
         Returns:
-            Response: A serialized dictionary and HTTP status 200 OK.
+            Response: A serialized dictionary and HTTP status 200 OK,
+            or HTTP status 400 Bad Request if an unknown expansion is listed.
         """
-        abilities = Ability.objects.all()
-
-        expansion_mappings = {
-            "dragon_king_exp": 1,
-            "dung_beetle_knight_exp": 2,
-            "flower_knight_exp": 3,
-            "gorm_exp": 4,
-            "lion_god_exp": 5,
-            "lion_knight_exp": 6,
-            "lonely_tree_exp": 7,
-            "manhunter_exp": 8,
-            "slenderman_exp": 9,
-            "spidicules_exp": 10,
-            "sunstalker_exp": 11,
-            "gamblers_chest_exp": 12
-        }
-
-        for param, expansion_id in expansion_mappings.items():
-            if request.query_params.get(param) is not None:
-                value = request.query_params.get(param) == 'true'
-                if value:
-                    abilities = abilities.filter(expansion=expansion_id)
-                else:
-                    abilities = abilities.exclude(expansion=expansion_id)
-
-        if request.query_params.get('expansion') is not None:
-            if request.query_params.get('expansion') == 'true':
-                # The Q() syntax selects objects that follow the expression within the brackets. The ~ negates the expression
-                abilities = abilities.filter(~Q(expansion=None))
-            if request.query_params.get('expansion') == 'false':
-                abilities = abilities.filter(expansion__isnull=True)
+        abilities = Ability.objects.select_related('expansion')
+
+        try:
+            abilities = apply_filters(abilities, expansion_filters(request.query_params))
+        except FilterError as ex:
+            return Response({'message': str(ex)}, status=status.HTTP_400_BAD_REQUEST)
+
+        if "ids" in request.query_params:
+            return ids_response(abilities, request.query_params['ids'], AbilitySerializer)
 
         serializer = AbilitySerializer(abilities, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -68,7 +47,7 @@ class AbilityView(ViewSet):
             or HTTP status 404 Not Found if the ability with the specified primary key does not exist.
         """
         try:
-            ability = Ability.objects.get(pk=pk)
+            ability = Ability.objects.select_related('expansion').get(pk=pk)
             serializer = AbilitySerializer(ability, many=False)
             return Response(serializer.data, status=status.HTTP_200_OK)
         except Ability.DoesNotExist:
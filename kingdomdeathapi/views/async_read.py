@@ -0,0 +1,253 @@
+from functools import wraps
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from rest_framework import status
+from rest_framework.exceptions import APIException, AuthenticationFailed, NotAcceptable, NotAuthenticated, PermissionDenied
+from rest_framework.renderers import BrowsableAPIRenderer
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from kingdomdeathapi.models import Resource, Settlement, Survivor
+from kingdomdeathapi.utils import FilterError, apply_filters, expansion_filters, select_ids
+from .ability import AbilityView
+from .catalog import AbilityFlatSerializer, DisorderFlatSerializer, FightingArtFlatSerializer, WeaponProficiencyFlatSerializer
+from .disorder import DisorderView
+from .event import EventView, EventFlatSerializer
+from .fighting_art import FightingArtView
+from .resource import ResourceFlatSerializer, ResourceSerializer, resource_filters, resource_index
+from .settlement import SettlementView, SettlementFlatSerializer
+from .survivor import SurvivorView, SurvivorFlatSerializer
+from .weapon_proficiency import WeaponProficiencyView
+
+# The configured renderers, less the browsable API which needs a DRF view to render
+renderers = [renderer() for renderer in api_settings.DEFAULT_RENDERER_CLASSES if not issubclass(renderer, BrowsableAPIRenderer)]
+negotiator = api_settings.DEFAULT_CONTENT_NEGOTIATION_CLASS()
+
+
+def async_read(view):
+    '''Wraps an async read view with the API's authentication and rendering
+
+    The wrapped view is given the DRF request and returns the data to render,
+    or a (data, status) pair, which is rendered with the configured renderer
+    the request accepts. Only GET requests are allowed. The configured
+    authentication and permission classes run in a worker thread, and a
+    request they turn away gets the same response an APIView would give.
+
+    Method arguments:
+      view -- The async view to wrap
+    '''
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        request = Request(request, authenticators=[auth() for auth in api_settings.DEFAULT_AUTHENTICATION_CLASSES])
+        try:
+            renderer, media_type = negotiator.select_renderer(request, renderers)
+        except NotAcceptable as ex:
+            renderer, media_type = renderers[0], renderers[0].media_type
+            return _render(renderer, media_type, {'detail': str(ex.detail)}, status.HTTP_406_NOT_ACCEPTABLE)
+
+        if request.method != 'GET':
+            return _render(renderer, media_type, {'detail': f'Method "{request.method}" not allowed.'},
+                           status.HTTP_405_METHOD_NOT_ALLOWED)
+
+        denied = await sync_to_async(_check_access)(request)
+        if denied is not None:
+            data, code, headers = denied
+            return _render(renderer, media_type, data, code, headers)
+
+        result = await view(request, *args, **kwargs)
+        data, code = result if isinstance(result, tuple) else (result, status.HTTP_200_OK)
+        return _render(renderer, media_type, data, code)
+    return wrapper
+
+
+@async_read
+async def resource_list(request):
+    '''Async variant of the resource list, taking the same filters
+
+    Method arguments:
+      request -- The full HTTP request object
+    '''
+    try:
+        # The filter registry and the index only touch the database when the catalog has changed
+        filters = await sync_to_async(resource_filters)(request.GET)
+    except FilterError as ex:
+        return {'message': str(ex)}, status.HTTP_400_BAD_REQUEST
+
+    if 'ids' in request.GET:
+        return await sync_to_async(_select_resource_ids)(filters, request.GET['ids'])
+    return await sync_to_async(_select_resources)(filters)
+
+
+@async_read
+async def resource_detail(request, pk):
+    '''Async variant of the resource retrieve
+
+    Method arguments:
+      request -- The full HTTP request object
+      pk -- The primary key of the resource
+    '''
+    return await _one(ResourceFlatSerializer, pk)
+
+
+@async_read
+async def settlement_list(request):
+    '''Async variant of the settlement list, taking the same ids and include parameters
+
+    Method arguments:
+      request -- The full HTTP request object
+    '''
+    if 'ids' in request.GET or 'include' in request.GET:
+        return await _sync_action(SettlementView, 'list', request)
+    return await SettlementFlatSerializer(Settlement.objects.order_by('id')).adata()
+
+
+@async_read
+async def settlement_detail(request, pk):
+    '''Async variant of the settlement retrieve, taking the same include parameter
+
+    Method arguments:
+      request -- The full HTTP request object
+      pk -- The primary key of the settlement
+    '''
+    if 'include' in request.GET:
+        return await _sync_action(SettlementView, 'retrieve', request, pk=pk)
+    return await _one(SettlementFlatSerializer, pk)
+
+
+@async_read
+async def survivor_list(request):
+    '''Async variant of the survivor list, taking the same ids parameter
+
+    Method arguments:
+      request -- The full HTTP request object
+    '''
+    if 'ids' in request.GET:
+        return await _sync_action(SurvivorView, 'list', request)
+    return await SurvivorFlatSerializer(Survivor.objects.order_by('id')).adata()
+
+
+@async_read
+async def survivor_detail(request, pk):
+    '''Async variant of the survivor retrieve
+
+    Method arguments:
+      request -- The full HTTP request object
+      pk -- The primary key of the survivor
+    '''
+    return await _one(SurvivorFlatSerializer, pk)
+
+
+@async_read
+async def ability_list(request):
+    '''Async variant of the ability list, taking the same filters
+
+    Method arguments:
+      request -- The full HTTP request object
+    '''
+    return await _catalog_list(request, AbilityView, AbilityFlatSerializer)
+
+
+@async_read
+async def disorder_list(request):
+    '''Async variant of the disorder list, taking the same filters
+
+    Method arguments:
+      request -- The full HTTP request object
+    '''
+    return await _catalog_list(request, DisorderView, DisorderFlatSerializer)
+
+
+@async_read
+async def fighting_art_list(request):
+    '''Async variant of the fighting art list, taking the same filters
+
+    Method arguments:
+      request -- The full HTTP request object
+    '''
+    return await _catalog_list(request, FightingArtView, FightingArtFlatSerializer)
+
+
+@async_read
+async def weapon_proficiency_list(request):
+    '''Async variant of the weapon proficiency list, taking the same filters
+
+    Method arguments:
+      request -- The full HTTP request object
+    '''
+    return await _catalog_list(request, WeaponProficiencyView, WeaponProficiencyFlatSerializer)
+
+
+@async_read
+async def event_list(request):
+    '''Async variant of the event list
+
+    Method arguments:
+      request -- The full HTTP request object
+    '''
+    return await _catalog_list(request, EventView, EventFlatSerializer, filtered=False)
+
+
+def _check_access(request):
+    # The authentication and permission checks an APIView runs before its handler
+    try:
+        request.user
+        for permission in [permission() for permission in api_settings.DEFAULT_PERMISSION_CLASSES]:
+            if not permission.has_permission(request, None):
+                if request.authenticators and not request.successful_authenticator:
+                    raise NotAuthenticated()
+                raise PermissionDenied(getattr(permission, 'message', None))
+    except APIException as ex:
+        code, headers = ex.status_code, {}
+        if isinstance(ex, (AuthenticationFailed, NotAuthenticated)):
+            header = request.authenticators[0].authenticate_header(request) if request.authenticators else None
+            if header:
+                headers['WWW-Authenticate'] = header
+            else:
+                code = status.HTTP_403_FORBIDDEN
+        return {'detail': str(ex.detail)}, code, headers
+    return None
+
+
+async def _sync_action(view_class, action, request, **kwargs):
+    # Parameters the flat serializers cannot serve fall back to the ViewSet action itself
+    response = await sync_to_async(getattr(view_class(), action))(request, **kwargs)
+    return response.data, response.status_code
+
+
+async def _catalog_list(request, view_class, serializer_class, filtered=True):
+    if 'ids' in request.GET:
+        return await _sync_action(view_class, 'list', request)
+
+    queryset = serializer_class.model.objects.all()
+    if filtered:
+        try:
+            queryset = apply_filters(queryset, await sync_to_async(expansion_filters)(request.GET))
+        except FilterError as ex:
+            return {'message': str(ex)}, status.HTTP_400_BAD_REQUEST
+    return await serializer_class(queryset).adata()
+
+
+def _select_resources(filters):
+    return resource_index().select(filters)
+
+
+def _select_resource_ids(filters, value):
+    resources = Resource.objects.select_related('monster_origin', 'expansion').prefetch_related('type')
+    try:
+        objects, missing = select_ids(apply_filters(resources, filters), value)
+    except ValueError:
+        return {'message': 'ids must be a comma separated list of integers'}, status.HTTP_400_BAD_REQUEST
+    return {'results': ResourceSerializer(objects, many=True).data, 'missing': missing}
+
+
+async def _one(serializer_class, pk):
+    rows = await serializer_class(serializer_class.model.objects.filter(pk=pk)).adata()
+    if not rows:
+        return None, status.HTTP_404_NOT_FOUND
+    return rows[0]
+
+
+def _render(renderer, media_type, data, code, headers=None):
+    if data is None:
+        return HttpResponse(status=code, headers=headers)
+    content_type = f'{media_type}; charset={renderer.charset}' if renderer.charset else media_type
+    return HttpResponse(renderer.render(data, media_type, {}), status=code, content_type=content_type, headers=headers)
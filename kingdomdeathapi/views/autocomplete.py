@@ -0,0 +1,34 @@
+from rest_framework.viewsets import ViewSet
+from rest_framework.response import Response
+from rest_framework import status
+from kingdomdeathapi.utils import AUTOCOMPLETE_KINDS, autocomplete_index
+
+
+class AutocompleteView(ViewSet):
+
+    def list(self, request):
+        """
+        Summary:
+            Suggest catalog names for typed text, tolerating a small number of typos.
+
+        Args:
+            request (HttpRequest): The full HTTP request object.
+                q (str): The typed text.
+                kind (str): Optional kind of name, e.g. "fighting_art" or "resource".
+                limit (int): Optional maximum number of suggestions from 1 to 50, 10 by default.
+
+        Returns:
+            Response: A list of suggestions, best first, and HTTP status 200 OK,
+            or HTTP status 400 Bad Request if the parameters are invalid.
+        """
+        kind = request.query_params.get('kind')
+        if kind is not None and kind not in AUTOCOMPLETE_KINDS:
+            return Response({'message': f'Unknown kind: {kind}'}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            limit = max(1, min(int(request.query_params.get('limit', 10)), 50))
+        except ValueError:
+            return Response({'message': 'limit must be an integer'}, status=status.HTTP_400_BAD_REQUEST)
+
+        suggestions = autocomplete_index().lookup(request.query_params.get('q', ''), kind, limit)
+        return Response(suggestions, status=status.HTTP_200_OK)
@@ -0,0 +1,113 @@
+import inspect
+import json
+import logging
+from io import BytesIO
+from asgiref.sync import async_to_sync
+from django.core.handlers.wsgi import WSGIRequest
+from django.db import transaction
+from django.urls import Resolver404, resolve
+from rest_framework import status
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+
+MAX_BATCH_SIZE = 50
+
+# Sub-requests that raise are logged where Django logs the errors of whole requests
+logger = logging.getLogger('django.request')
+
+
+@api_view(['POST'])
+def batch_requests(request):
+    '''Handles several API requests sent as one
+
+    The body is either a list of sub-requests or an object with a `requests`
+    list and an optional `atomic` flag. Each sub-request is an object with a
+    `method`, a `path` such as "/survivors/3" and an optional `body`. The
+    sub-requests run in order against the same URL configuration as normal
+    requests, with the batch's Authorization header, and their responses are
+    returned in the same order.
+
+    With `atomic` set the batch runs in one transaction which is rolled back
+    as soon as a sub-request fails, and the remaining sub-requests are not run.
+
+    Method arguments:
+      request -- The full HTTP request object
+    '''
+    atomic = False
+    sub_requests = request.data
+    if isinstance(sub_requests, dict):
+        atomic = bool(sub_requests.get('atomic', False))
+        sub_requests = sub_requests.get('requests')
+
+    if not isinstance(sub_requests, list) \
+            or not all(isinstance(sub, dict) and 'method' in sub and 'path' in sub for sub in sub_requests):
+        return Response({'message': 'You must provide a list of requests with a method and a path'}, status=status.HTTP_400_BAD_REQUEST)
+
+    if len(sub_requests) > MAX_BATCH_SIZE:
+        return Response({'message': f'A batch can contain at most {MAX_BATCH_SIZE} requests'}, status=status.HTTP_400_BAD_REQUEST)
+
+    if not atomic:
+        return Response([_dispatch(request, sub) for sub in sub_requests], status=status.HTTP_200_OK)
+
+    responses = []
+    with transaction.atomic():
+        for sub in sub_requests:
+            responses.append(_dispatch(request, sub))
+            if responses[-1]['status'] >= 400:
+                transaction.set_rollback(True)
+                break
+
+    # Sub-requests after a failure in an atomic batch were never run
+    skipped = [{'status': status.HTTP_424_FAILED_DEPENDENCY, 'body': None}] * (len(sub_requests) - len(responses))
+    return Response(responses + skipped, status=status.HTTP_200_OK)
+
+
+def _dispatch(request, sub):
+    path, _, query = str(sub['path']).partition('?')
+    try:
+        match = resolve(path)
+    except Resolver404:
+        return {'status': status.HTTP_404_NOT_FOUND, 'body': None}
+
+    if match.func is batch_requests:
+        return {'status': status.HTTP_400_BAD_REQUEST, 'body': {'message': 'Batches cannot be nested'}}
+
+    view = match.func
+    # The async views are run to completion here, the batch itself is answered synchronously
+    if inspect.iscoroutinefunction(view):
+        view = async_to_sync(view)
+
+    sub_request = _build_request(request, str(sub['method']).upper(), path, query, sub.get('body'))
+    try:
+        response = view(sub_request, *match.args, **match.kwargs)
+        if hasattr(response, 'render'):
+            response.render()
+
+        body = None
+        if response.content:
+            if response.get('Content-Type', '').startswith('application/json'):
+                body = json.loads(response.content)
+            else:
+                body = response.content.decode(response.charset)
+    except Exception:  # pylint: disable=broad-except
+        # The error itself may hold details of the server, so it only goes to the log
+        logger.exception('Internal Server Error in batch: %s %s', sub_request.method, path)
+        return {'status': status.HTTP_500_INTERNAL_SERVER_ERROR, 'body': {'message': 'The request failed'}}
+    return {'status': response.status_code, 'body': body}
+
+
+def _build_request(request, method, path, query, body):
+    payload = b'' if body is None else json.dumps(body).encode()
+    # The batch's headers, Authorization among them, are copied so the sub-request is authenticated
+    # and checked by the view's own authentication and permission classes
+    environ = dict(request.META)
+    environ.update({
+        'REQUEST_METHOD': method,
+        'PATH_INFO': path,
+        'QUERY_STRING': query,
+        'CONTENT_TYPE': 'application/json',
+        'CONTENT_LENGTH': str(len(payload)),
+        'HTTP_ACCEPT': 'application/json',
+        'wsgi.input': BytesIO(payload),
+    })
+    return WSGIRequest(environ)
@@ -0,0 +1,136 @@
+from rest_framework.viewsets import ViewSet
+from rest_framework.response import Response
+from rest_framework import status
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags
+from kingdomdeathapi.models import (
+    Ability, Campaign, Disorder, Event, ExpansionType, FightingArt, Impairment, MilestoneType, Monster, ResourceType,
+    WeaponProficiency)
+from kingdomdeathapi.utils import catalog_version, FlatSerializer, One
+from .resource import ResourceFlatSerializer
+
+
+class CatalogView(ViewSet):
+
+    def list(self, request):
+        """
+        Summary:
+            Retrieve every reference table in one versioned payload.
+            The payload is built once per catalog version and carries the version as its ETag,
+            so clients holding the current version get HTTP status 304 Not Modified. ETags are compared weakly,
+            as compressed responses carry a weak one.
+
+        Args:
+            request (HttpRequest): The full HTTP request object.
+
+        Returns:
+            Response: A serialized dictionary of every catalog table and HTTP status 200 OK,
+            or HTTP status 304 Not Modified if the client's ETag matches the current version.
+        """
+        version = catalog_version()
+        etag = f'"catalog-{version}"'
+
+        held = parse_etags(request.headers.get('If-None-Match', ''))
+        if '*' in held or etag in [tag.removeprefix('W/') for tag in held]:
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(build_catalog(version), status=status.HTTP_200_OK)
+
+        response['ETag'] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+
+_catalog = (None, None)
+
+
+def build_catalog(version):
+    """
+    Summary:
+        Build the catalog payload for a version, reusing the last one built while the version is unchanged.
+        The version is taken before the tables are read, so the payload is never older than its version.
+
+    Args:
+        version (int): The current catalog version.
+
+    Returns:
+        dict: The version and a list per catalog table.
+    """
+    global _catalog  # pylint: disable=global-statement
+    if _catalog[0] != version:
+        data = {'version': version}
+        for name, serializer in CATALOG_SERIALIZERS:
+            data[name] = serializer(serializer.model.objects.all()).data
+        _catalog = (version, data)
+    return _catalog[1]
+
+
+class AbilityFlatSerializer(FlatSerializer):
+    model = Ability
+    fields = ('id', 'name', 'effect', ('expansion', One('id', 'name')))
+
+
+class DisorderFlatSerializer(FlatSerializer):
+    model = Disorder
+    fields = ('id', 'name', 'flavor_text', 'effect', ('expansion', One('id', 'name')))
+
+
+class FightingArtFlatSerializer(FlatSerializer):
+    model = FightingArt
+    fields = ('id', 'name', 'effect', ('expansion', One('id', 'name')))
+
+
+class WeaponProficiencyFlatSerializer(FlatSerializer):
+    model = WeaponProficiency
+    fields = ('id', 'name', 'specialist_effect', 'master_effect', 'expansion')
+
+
+class EventFlatSerializer(FlatSerializer):
+    model = Event
+    fields = ('id', 'name', 'effect', 'story', 'campaign', 'expansion')
+
+
+class MilestoneTypeFlatSerializer(FlatSerializer):
+    model = MilestoneType
+    fields = ('id', 'type')
+
+
+class MonsterFlatSerializer(FlatSerializer):
+    model = Monster
+    fields = ('id', 'name', 'expansion', 'nemesis', 'core', 'legendary')
+
+
+class ExpansionTypeFlatSerializer(FlatSerializer):
+    model = ExpansionType
+    fields = ('id', 'name')
+
+
+class CampaignFlatSerializer(FlatSerializer):
+    model = Campaign
+    fields = ('id', 'name', 'years', 'expansion')
+
+
+class ImpairmentFlatSerializer(FlatSerializer):
+    model = Impairment
+    fields = ('id', 'name', 'effect')
+
+
+class ResourceTypeFlatSerializer(FlatSerializer):
+    model = ResourceType
+    fields = ('id', 'name')
+
+
+CATALOG_SERIALIZERS = (
+    ('abilities', AbilityFlatSerializer),
+    ('disorders', DisorderFlatSerializer),
+    ('fighting_arts', FightingArtFlatSerializer),
+    ('weapon_proficiencies', WeaponProficiencyFlatSerializer),
+    ('resources', ResourceFlatSerializer),
+    ('resource_types', ResourceTypeFlatSerializer),
+    ('events', EventFlatSerializer),
+    ('milestone_types', MilestoneTypeFlatSerializer),
+    ('monsters', MonsterFlatSerializer),
+    ('expansion_types', ExpansionTypeFlatSerializer),
+    ('campaigns', CampaignFlatSerializer),
+    ('impairments', ImpairmentFlatSerializer),
+)
@@ -2,8 +2,8 @@ from rest_framework import serializers
 from rest_framework.viewsets import ViewSet
 from rest_framework.response import Response
 from rest_framework import status
-from django.db.models import Q
 from kingdomdeathapi.models import Disorder, ExpansionType
+from kingdomdeathapi.utils import FilterError, apply_filters, expansion_filters, ids_response
 
 
 class DisorderView(ViewSet):
@@ -17,39 +17,18 @@ class DisorderView(ViewSet):
             request (HttpRequest): The full HTTP request object.
 
         Returns:
-            Response: A serialized dictionary and HTTP status 200 OK.
+            Response: A serialized dictionary and HTTP status 200 OK,
+            or HTTP status 400 Bad Request if an unknown expansion is listed.
         """
-        disorders = Disorder.objects.all()
-
-        expansion_mappings = {
-            "dragon_king_exp": 1,
-            "dung_beetle_knight_exp": 2,
-            "flower_knight_exp": 3,
-            "gorm_exp": 4,
-            "lion_god_exp": 5,
-            "lion_knight_exp": 6,
-            "lonely_tree_exp": 7,
-            "manhunter_exp": 8,
-            "slenderman_exp": 9,
-            "spidicules_exp": 10,
-            "sunstalker_exp": 11,
-            "gamblers_chest_exp": 12
-        }
-
-        for param, expansion_id in expansion_mappings.items():
-            if request.query_params.get(param) is not None:
-                value = request.query_params.get(param) == 'true'
-                if value:
-                    disorders = disorders.filter(expansion=expansion_id)
-                else:
-                    disorders = disorders.exclude(expansion=expansion_id)
-
-        if request.query_params.get('expansion') is not None:
-            if request.query_params.get('expansion') == 'true':
-                # The Q() syntax selects objects that follow the expression within the brackets. The ~ negates the expression
-                disorders = disorders.filter(~Q(expansion=None))
-            if request.query_params.get('expansion') == 'false':
-                disorders = disorders.filter(expansion__isnull=True)
+        disorders = Disorder.objects.select_related('expansion')
+
+        try:
+            disorders = apply_filters(disorders, expansion_filters(request.query_params))
+        except FilterError as ex:
+            return Response({'message': str(ex)}, status=status.HTTP_400_BAD_REQUEST)
+
+        if "ids" in request.query_params:
+            return ids_response(disorders, request.query_params['ids'], DisorderSerializer)
 
         serializer = DisorderSerializer(disorders, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -68,7 +47,7 @@ class DisorderView(ViewSet):
             or HTTP status 404 Not Found if the disorder with the specified primary key does not exist.
         """
         try:
-            disorder = Disorder.objects.get(pk=pk)
+            disorder = Disorder.objects.select_related('expansion').get(pk=pk)
             serializer = DisorderSerializer(disorder, many=False)
             return Response(serializer.data, status=status.HTTP_200_OK)
         except Disorder.DoesNotExist:
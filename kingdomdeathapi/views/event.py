@@ -3,6 +3,7 @@ from rest_framework.viewsets import ViewSet
 from rest_framework.response import Response
 from rest_framework import status
 from kingdomdeathapi.models import Event
+from kingdomdeathapi.utils import ids_response, FlatSerializer
 
 
 class EventView(ViewSet):
@@ -20,6 +21,9 @@ class EventView(ViewSet):
         """
         events = Event.objects.all()
 
+        if "ids" in request.query_params:
+            return ids_response(events, request.query_params['ids'], EventSerializer)
+
         serializer = EventSerializer(events, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -110,3 +114,8 @@ class EventSerializer(serializers.ModelSerializer):
     class Meta:
         model = Event
         fields = ('id', 'name', )
+
+
+class EventFlatSerializer(FlatSerializer):
+    model = Event
+    fields = ('id', 'name')
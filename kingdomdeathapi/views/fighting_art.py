@@ -2,8 +2,8 @@ from rest_framework import serializers
 from rest_framework.viewsets import ViewSet
 from rest_framework.response import Response
 from rest_framework import status
-from django.db.models import Q
 from kingdomdeathapi.models import FightingArt, ExpansionType
+from kingdomdeathapi.utils import FilterError, apply_filters, expansion_filters, ids_response
 
 
 class FightingArtView(ViewSet):
@@ -17,39 +17,18 @@ class FightingArtView(ViewSet):
             request (HttpRequest): The full HTTP request object.
 
         Returns:
-            Response: A serialized dictionary and HTTP status 200 OK.
+            Response: A serialized dictionary and HTTP status 200 OK,
+            or HTTP status 400 Bad Request if an unknown expansion is listed.
         """
-        fighting_arts = FightingArt.objects.all()
-
-        expansion_mappings = {
-            "dragon_king_exp": 1,
-            "dung_beetle_knight_exp": 2,
-            "flower_knight_exp": 3,
-            "gorm_exp": 4,
-            "lion_god_exp": 5,
-            "lion_knight_exp": 6,
-            "lonely_tree_exp": 7,
-            "manhunter_exp": 8,
-            "slenderman_exp": 9,
-            "spidicules_exp": 10,
-            "sunstalker_exp": 11,
-            "gamblers_chest_exp": 12
-        }
-
-        for param, expansion_id in expansion_mappings.items():
-            if request.query_params.get(param) is not None:
-                value = request.query_params.get(param) == 'true'
-                if value:
-                    fighting_arts = fighting_arts.filter(expansion=expansion_id)
-                else:
-                    fighting_arts = fighting_arts.exclude(expansion=expansion_id)
-
-        if request.query_params.get('expansion') is not None:
-            if request.query_params.get('expansion') == 'true':
-                # The Q() syntax selects objects that follow the expression within the brackets. The ~ negates the expression
-                fighting_arts = fighting_arts.filter(~Q(expansion=None))
-            if request.query_params.get('expansion') == 'false':
-                fighting_arts = fighting_arts.filter(expansion__isnull=True)
+        fighting_arts = FightingArt.objects.select_related('expansion')
+
+        try:
+            fighting_arts = apply_filters(fighting_arts, expansion_filters(request.query_params))
+        except FilterError as ex:
+            return Response({'message': str(ex)}, status=status.HTTP_400_BAD_REQUEST)
+
+        if "ids" in request.query_params:
+            return ids_response(fighting_arts, request.query_params['ids'], FightingArtSerializer)
 
         serializer = FightingArtSerializer(fighting_arts, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -68,7 +47,7 @@ class FightingArtView(ViewSet):
             or HTTP status 404 Not Found if the fighting_art with the specified primary key does not exist.
         """
         try:
-            fighting_art = FightingArt.objects.get(pk=pk)
+            fighting_art = FightingArt.objects.select_related('expansion').get(pk=pk)
             serializer = FightingArtSerializer(fighting_art, many=False)
             return Response(serializer.data, status=status.HTTP_200_OK)
         except FightingArt.DoesNotExist:
@@ -3,6 +3,7 @@ from rest_framework.viewsets import ViewSet
 from rest_framework.response import Response
 from rest_framework import status
 from kingdomdeathapi.models import Milestone, Settlement, MilestoneType
+from kingdomdeathapi.utils import ids_response
 
 
 class MilestoneView(ViewSet):
@@ -18,7 +19,7 @@ class MilestoneView(ViewSet):
         Returns:
             Response: A serialized dictionary and HTTP status 200 OK.
         """
-        milestones = Milestone.objects.all()
+        milestones = Milestone.objects.select_related('milestone_type').order_by('id')
 
         if "achieved" in request.query_params:
             achieved_value = request.query_params.get('achieved')
@@ -29,6 +30,9 @@ class MilestoneView(ViewSet):
             milestones = milestones.filter(settlement=settlement_value)
 
 
+        if "ids" in request.query_params:
+            return ids_response(milestones, request.query_params['ids'], MilestoneSerializer)
+
         serializer = MilestoneSerializer(milestones, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -46,7 +50,7 @@ class MilestoneView(ViewSet):
             or HTTP status 404 Not Found if the milestone with the specified primary key does not exist.
         """
         try:
-            milestone = Milestone.objects.get(pk=pk)
+            milestone = Milestone.objects.select_related('milestone_type').get(pk=pk)
             serializer = MilestoneSerializer(milestone, many=False)
             return Response(serializer.data, status=status.HTTP_200_OK)
         except Milestone.DoesNotExist:
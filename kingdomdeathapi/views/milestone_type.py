@@ -3,6 +3,7 @@ from rest_framework.viewsets import ViewSet
 from rest_framework.response import Response
 from rest_framework import status
 from kingdomdeathapi.models import MilestoneType
+from kingdomdeathapi.utils import ids_response
 
 
 class MilestoneTypeView(ViewSet):
@@ -20,6 +21,9 @@ class MilestoneTypeView(ViewSet):
         """
         milestones = MilestoneType.objects.all()
 
+        if "ids" in request.query_params:
+            return ids_response(milestones, request.query_params['ids'], MilestoneSerializer)
+
         serializer = MilestoneSerializer(milestones, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
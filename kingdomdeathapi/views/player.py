@@ -3,6 +3,7 @@ from rest_framework.viewsets import ViewSet
 from rest_framework.response import Response
 from rest_framework import status
 from kingdomdeathapi.models import Player
+from kingdomdeathapi.utils import ids_response
 
 
 class PlayerView(ViewSet):
@@ -18,7 +19,7 @@ class PlayerView(ViewSet):
         Returns:
             Response: A serialized dictionary and HTTP status 200 OK.
         """
-        players = Player.objects.all()
+        players = Player.objects.select_related('user').order_by('id')
 
         if request.query_params.get('is_game_master') is not None:
             if request.query_params.get('is_game_master') == 'true':
@@ -29,6 +30,9 @@ class PlayerView(ViewSet):
         if "current" in request.query_params:
             players = players.filter(user=request.auth.user)
 
+        if "ids" in request.query_params:
+            return ids_response(players, request.query_params['ids'], PlayerSerializer)
+
         serializer = PlayerSerializer(players, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -46,7 +50,7 @@ class PlayerView(ViewSet):
             or HTTP status 404 Not Found if the player with the specified primary key does not exist.
         """
         try:
-            player = Player.objects.get(pk=pk)
+            player = Player.objects.select_related('user').get(pk=pk)
             serializer = PlayerSerializer(player, many=False)
             return Response(serializer.data, status=status.HTTP_200_OK)
         except Player.DoesNotExist:
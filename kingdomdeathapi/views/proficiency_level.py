@@ -0,0 +1,149 @@
+from django.conf import settings
+from rest_framework import serializers
+from rest_framework.viewsets import ViewSet
+from rest_framework.response import Response
+from rest_framework import status
+from kingdomdeathapi.models import ProficiencyLevel, Survivor, WeaponProficiency
+from kingdomdeathapi.utils import ids_response, FlatSerializer, One
+
+
+class ProficiencyLevelView(ViewSet):
+
+    def list(self, request):
+        """
+        Summary:
+            Retrieve a list of proficiency levels based on query parameters.
+
+        Args:
+            request (HttpRequest): The full HTTP request object.
+
+        Returns:
+            Response: A serialized dictionary and HTTP status 200 OK.
+        """
+        proficiency_levels = ProficiencyLevel.objects.select_related('weapon_type').order_by('id')
+
+        if "survivor" in request.query_params:
+            survivor_value = request.query_params.get('survivor')
+            proficiency_levels = proficiency_levels.filter(survivor=survivor_value)
+
+        if "weapon_type" in request.query_params:
+            weapon_type_value = request.query_params.get('weapon_type')
+            proficiency_levels = proficiency_levels.filter(weapon_type=weapon_type_value)
+
+        if "ids" in request.query_params:
+            return ids_response(proficiency_levels, request.query_params['ids'], ProficiencyLevelSerializer)
+
+        if settings.FAST_SERIALIZATION:
+            serializer = ProficiencyLevelFlatSerializer(proficiency_levels)
+        else:
+            serializer = ProficiencyLevelSerializer(proficiency_levels, many=True)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+    def retrieve(self, request, pk=None):
+        """
+        Summary:
+            Retrieve a specific proficiency level by primary key.
+
+        Args:
+            request (HttpRequest): The full HTTP request object.
+            pk (int): The primary key of the proficiency level to retrieve.
+
+        Returns:
+            Response: A serialized dictionary containing the proficiency level's data and HTTP status 200 OK,
+            or HTTP status 404 Not Found if the proficiency level with the specified primary key does not exist.
+        """
+        try:
+            proficiency_level = ProficiencyLevel.objects.select_related('weapon_type').get(pk=pk)
+            serializer = ProficiencyLevelSerializer(proficiency_level, many=False)
+            return Response(serializer.data, status=status.HTTP_200_OK)
+        except ProficiencyLevel.DoesNotExist:
+            return Response(status=status.HTTP_404_NOT_FOUND)
+
+    def create(self, request):
+        """
+        Summary:
+            Create a new object using the request data
+
+        Args:
+            request (HttpRequest): The full HTTP request object.
+
+        Returns:
+            Response: A serialized dictionary containing the proficiency level's data and HTTP status 201 Created.
+        """
+        survivor = Survivor.objects.get(pk=request.data["survivor"])
+        weapon_type = WeaponProficiency.objects.get(pk=request.data["weapon_type"])
+
+        proficiency_level = ProficiencyLevel.objects.create(
+            name=request.data.get("name", weapon_type.name),
+            survivor=survivor,
+            weapon_type=weapon_type,
+            level=request.data["level"],
+        )
+
+        serializer = ProficiencyLevelSerializer(proficiency_level, many=False)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    def update(self, request, pk=None):
+        """
+        Summary:
+            Update a specific proficiency level by primary key.
+
+        Args:
+            request (HttpRequest): The full HTTP request object.
+            pk (int): The primary key of the proficiency level to update.
+
+        Returns:
+            Response: A successful HTTP status 204 No Content response after updating the proficiency level,
+            or HTTP status 404 Not Found if the proficiency level with the specified primary key does not exist.
+        """
+        try:
+            proficiency_level = ProficiencyLevel.objects.get(pk=pk)
+            proficiency_level.level = request.data["level"]
+            proficiency_level.weapon_type = WeaponProficiency.objects.get(
+                pk=request.data["weapon_type"])
+            proficiency_level.survivor = Survivor.objects.get(
+                pk=request.data["survivor"])
+            proficiency_level.save()
+            return Response(None, status=status.HTTP_204_NO_CONTENT)
+        except ProficiencyLevel.DoesNotExist:
+            return Response(status=status.HTTP_404_NOT_FOUND)
+
+    def destroy(self, request, pk=None):
+        """
+        Summary:
+            Delete a specific proficiency level by primary key.
+
+        Args:
+            request (HttpRequest): The full HTTP request object.
+            pk (int): The primary key of the proficiency level to delete.
+
+        Returns:
+            Response: A successful HTTP status 204 No Content response after deletion,
+            or HTTP status 404 Not Found if the proficiency level with the specified primary key does not exist.
+        """
+
+        try:
+            proficiency_level = ProficiencyLevel.objects.get(pk=pk)
+            proficiency_level.delete()
+            return Response(None, status=status.HTTP_204_NO_CONTENT)
+        except ProficiencyLevel.DoesNotExist:
+            return Response(status=status.HTTP_404_NOT_FOUND)
+
+
+class WeaponProficiencySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = WeaponProficiency
+        fields = ('id', 'name',)
+
+class ProficiencyLevelSerializer(serializers.ModelSerializer):
+
+    weapon_type = WeaponProficiencySerializer(many=False)
+
+    class Meta:
+        model = ProficiencyLevel
+        fields = ('id', 'name', 'survivor', 'weapon_type', 'level', )
+
+
+class ProficiencyLevelFlatSerializer(FlatSerializer):
+    model = ProficiencyLevel
+    fields = ('id', 'name', 'survivor', ('weapon_type', One('id', 'name')), 'level', )
@@ -0,0 +1,29 @@
+from rest_framework import status
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from kingdomdeathapi.utils import projection_status
+
+
+@api_view(['GET'])
+def projection_detail(request, job_id):
+    '''Fetches a settlement projection started with POST /settlements/N/projections
+
+    While the projection runs the response is 202 Accepted with its progress
+    from 0 to 1. Once it is done the response has, for every year projected,
+    the mean and 10th, 50th and 90th percentiles of the population and of
+    each resource stockpile, the chance the settlement has died out, the mean
+    survival limit and the chance of having reached each milestone. Jobs are
+    kept in the database, so any worker process can answer.
+
+    Method arguments:
+      request -- The full HTTP request object
+      job_id -- The projection's id
+    '''
+    job = projection_status(job_id, request.user.id)
+    if job is None:
+        return Response(status=status.HTTP_404_NOT_FOUND)
+    if job['status'] == 'running':
+        return Response(job, status=status.HTTP_202_ACCEPTED)
+    if job['status'] == 'failed':
+        return Response(job, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    return Response(job, status=status.HTTP_200_OK)
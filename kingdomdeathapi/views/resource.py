@@ -1,9 +1,17 @@
+from django.conf import settings
 from rest_framework import serializers
 from rest_framework.viewsets import ViewSet
 from rest_framework.response import Response
 from rest_framework import status
-from django.db.models import Q
 from kingdomdeathapi.models import Resource, ResourceType, Monster, ExpansionType
+from kingdomdeathapi.utils import (
+    FilterError, FlatSerializer, Many, One, ResourceIndex, apply_filters, catalog_version, expansion_filters,
+    filter_registry, ids_response, monster_filters)
+
+BOOL_MAPPINGS = ("consumable", "monster", "strange", "indomitable")
+
+# Parameters that are not type or monster slugs
+PLAIN_PARAMS = {*BOOL_MAPPINGS, "expansion", "ids", "format"}
 
 
 class ResourceView(ViewSet):
@@ -13,98 +21,25 @@ class ResourceView(ViewSet):
         Summary:
             Retrieve a list of resources based on query parameters.
 
+            Filters are answered from the in-memory resource index, so a list costs no query.
+
         Args:
             request (HttpRequest): The full HTTP request object.
 
         Returns:
-            Response: A serialized dictionary and HTTP status 200 OK.
+            Response: A serialized dictionary and HTTP status 200 OK,
+            or HTTP status 400 Bad Request if an unknown expansion is listed.
         """
-        resources = Resource.objects.all()
-
-        # Define a dictionary mapping query parameters to type IDs
-        type_mappings = {
-            "hide": 1,
-            "bone": 2,
-            "organ": 3,
-            "scrap": 4,
-            "herb": 5,
-            "iron": 6,
-            "vermin": 7,
-            "flower": 8
-        }
-
-        # Iterate over the dictionary and apply filters
-        for param, type_id in type_mappings.items():
-            if request.query_params.get(param) is not None:
-                value = request.query_params.get(param) == 'true'
-                if value:
-                    resources = resources.filter(type__id=type_id)
-                else:
-                    resources = resources.exclude(type__id=type_id)
-
-        bool_mappings = {
-            "consumable": True,
-            "monster": True,
-            "strange": True,
-            "indomitable": True
-        }
-
-        for param, bool_value in bool_mappings.items():
-            if request.query_params.get(param) is not None:
-                value = request.query_params.get(param) == 'true'
-                if value:
-                    resources = resources.filter(**{f"{param}": bool_value})
-                else:
-                    resources = resources.exclude(**{f"{param}": bool_value})
-
-        monster_mappings = {
-            "white_lion": 1,
-            "screaming_antelope": 2,
-            "phoenix": 3,
-            "dragon_king": 9,
-            "dung_beetle_knight": 11,
-        }
-
-        for param, monster_id in monster_mappings.items():
-            if request.query_params.get(param) is not None:
-                value = request.query_params.get(param) == 'true'
-                if value:
-                    resources = resources.filter(monster_origin=monster_id)
-                else:
-                    resources = resources.exclude(monster_origin=monster_id)
-
-        expansion_mappings = {
-            "dragon_king_exp": 1,
-            "dung_beetle_knight_exp": 2,
-            "flower_knight_exp": 3,
-            "gorm_exp": 4,
-            "lion_god_exp": 5,
-            "lion_knight_exp": 6,
-            "lonely_tree_exp": 7,
-            "manhunter_exp": 8,
-            "slenderman_exp": 9,
-            "spidicules_exp": 10,
-            "sunstalker_exp": 11,
-            "gamblers_chest_exp": 12
-        }
-
-        for param, expansion_id in expansion_mappings.items():
-            if request.query_params.get(param) is not None:
-                value = request.query_params.get(param) == 'true'
-                if value:
-                    resources = resources.filter(expansion=expansion_id)
-                else:
-                    resources = resources.exclude(expansion=expansion_id)
-
-        if request.query_params.get('expansion') is not None:
-            if request.query_params.get('expansion') == 'true':
-                # The Q() syntax selects objects that follow the expression within the brackets. The ~ negates the expression
-                resources = resources.filter(~Q(expansion=None))
-            if request.query_params.get('expansion') == 'false':
-                resources = resources.filter(expansion__isnull=True)
-
-        serializer = ResourceSerializer(resources, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        try:
+            filters = resource_filters(request.query_params)
+        except FilterError as ex:
+            return Response({'message': str(ex)}, status=status.HTTP_400_BAD_REQUEST)
+
+        if "ids" in request.query_params:
+            resources = Resource.objects.select_related('monster_origin', 'expansion').prefetch_related('type')
+            return ids_response(apply_filters(resources, filters), request.query_params['ids'], ResourceSerializer)
+
+        return Response(resource_index().select(filters), status=status.HTTP_200_OK)
 
     def retrieve(self, request, pk=None):
         """
@@ -120,7 +55,7 @@ class ResourceView(ViewSet):
             or HTTP status 404 Not Found if the resource with the specified primary key does not exist.
         """
         try:
-            resource = Resource.objects.get(pk=pk)
+            resource = Resource.objects.select_related('monster_origin', 'expansion').prefetch_related('type').get(pk=pk)
             serializer = ResourceSerializer(resource, many=False)
             return Response(serializer.data, status=status.HTTP_200_OK)
         except Resource.DoesNotExist:
@@ -193,6 +128,61 @@ class ResourceView(ViewSet):
             return Response(status=status.HTTP_404_NOT_FOUND)
 
 
+def resource_filters(query_params):
+    """
+    Summary:
+        Translate resource query parameters into (column, value, include) filters,
+        e.g. ?bone=true&white_lion=false becomes [('type', 2, True), ('monster_origin', (1,), False)].
+        Type, monster and expansion parameters are named after the slugs in the filter registry.
+
+    Args:
+        query_params (QueryDict): The request's query parameters.
+
+    Returns:
+        list: The filters in the order they are applied.
+
+    Raises:
+        FilterError: If ?expansion= lists an unknown expansion.
+    """
+    filters = []
+    for param in BOOL_MAPPINGS:
+        if query_params.get(param) is not None:
+            filters.append((param, True, query_params.get(param) == 'true'))
+
+    if not set(query_params) - PLAIN_PARAMS:
+        return filters + expansion_filters(query_params)
+
+    # Every type is a separate requirement, as a resource can have several
+    for param, type_id in filter_registry().resource_types.items():
+        if query_params.get(param) is not None:
+            filters.append(('type', type_id, query_params.get(param) == 'true'))
+
+    return filters + monster_filters(query_params) + expansion_filters(query_params)
+
+
+_index = (None, None)
+
+
+def resource_index():
+    """
+    Summary:
+        Get the resource index for the current catalog version, rebuilding it when any process has changed the catalog.
+
+    Returns:
+        ResourceIndex: Every resource, serialized and indexed by filterable value.
+    """
+    global _index  # pylint: disable=global-statement
+    version = catalog_version()
+    if _index[0] != version:
+        resources = Resource.objects.select_related('monster_origin', 'expansion').prefetch_related('type').order_by('id')
+        if settings.FAST_SERIALIZATION:
+            rows = ResourceFlatSerializer(resources).data
+        else:
+            rows = ResourceSerializer(resources, many=True).data
+        _index = (version, ResourceIndex(rows))
+    return _index[1]
+
+
 class ResourceTypeSerializer(serializers.ModelSerializer):
     class Meta:
         model = ResourceType
@@ -218,3 +208,9 @@ class ResourceSerializer(serializers.ModelSerializer):
     class Meta:
         model = Resource
         fields = ('id', 'name', 'type', 'consumable', 'monster', 'strange', 'indomitable', 'monster_origin', 'expansion', 'flavor_text', 'effect')
+
+
+class ResourceFlatSerializer(FlatSerializer):
+    model = Resource
+    fields = ('id', 'name', ('type', Many('id', 'name')), 'consumable', 'monster', 'strange', 'indomitable',
+              ('monster_origin', One('id', 'name')), ('expansion', One('id', 'name')), 'flavor_text', 'effect')
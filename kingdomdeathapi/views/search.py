@@ -0,0 +1,40 @@
+from rest_framework.viewsets import ViewSet
+from rest_framework.response import Response
+from rest_framework import status
+from kingdomdeathapi.utils import SEARCH_KINDS, search, search_available
+
+
+class SearchView(ViewSet):
+
+    def list(self, request):
+        """
+        Summary:
+            Search the text of abilities, disorders, fighting arts, weapon proficiencies, resources and impairments.
+            Results are ranked by BM25 and the matching words are wrapped in <mark> tags.
+
+        Args:
+            request (HttpRequest): The full HTTP request object.
+                q (str): The words to search for.
+                kind (str): Optional comma separated kinds to search, e.g. "ability,disorder".
+                limit (int): Optional maximum number of results from 1 to 100, 20 by default.
+
+        Returns:
+            Response: A list of matches and HTTP status 200 OK,
+            HTTP status 400 Bad Request if the parameters are invalid,
+            or HTTP status 501 Not Implemented if the database cannot hold the search index.
+        """
+        if not search_available():
+            return Response({'message': 'Search needs an SQLite database with FTS5'}, status=status.HTTP_501_NOT_IMPLEMENTED)
+
+        kinds = [kind for kind in request.query_params.get('kind', '').split(',') if kind]
+        unknown = set(kinds) - {kind for kind, model, fields in SEARCH_KINDS}
+        if unknown:
+            return Response({'message': f'Unknown kind: {", ".join(sorted(unknown))}'}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            limit = max(1, min(int(request.query_params.get('limit', 20)), 100))
+        except ValueError:
+            return Response({'message': 'limit must be an integer'}, status=status.HTTP_400_BAD_REQUEST)
+
+        results = search(request.query_params.get('q', ''), kinds, limit)
+        return Response(results, status=status.HTTP_200_OK)
@@ -2,7 +2,9 @@ from rest_framework import serializers
 from rest_framework.viewsets import ViewSet
 from rest_framework.response import Response
 from rest_framework import status
+from django.db.models import Prefetch
 from kingdomdeathapi.models import Session, Player, Settlement
+from kingdomdeathapi.utils import ids_response
 
 
 class SessionView(ViewSet):
@@ -18,7 +20,10 @@ class SessionView(ViewSet):
         Returns:
             Response: A serialized dictionary and HTTP status 200 OK.
         """
-        sessions = Session.objects.all()
+        sessions = Session.objects.select_related('host__user').prefetch_related(Prefetch('players', queryset=Player.objects.select_related('user'))).order_by('id')
+
+        if "ids" in request.query_params:
+            return ids_response(sessions, request.query_params['ids'], SessionSerializer)
 
         serializer = SessionSerializer(sessions, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -37,7 +42,7 @@ class SessionView(ViewSet):
             or HTTP status 404 Not Found if the session with the specified primary key does not exist.
         """
         try:
-            session = Session.objects.get(pk=pk)
+            session = Session.objects.select_related('host__user').prefetch_related(Prefetch('players', queryset=Player.objects.select_related('user'))).get(pk=pk)
             serializer = SessionSerializer(session, many=False)
             return Response(serializer.data, status=status.HTTP_200_OK)
         except Session.DoesNotExist:
@@ -1,8 +1,29 @@
+import math
+import random
+from collections import Counter
 from rest_framework import serializers
 from rest_framework.viewsets import ViewSet
 from rest_framework.response import Response
 from rest_framework import status
-from kingdomdeathapi.models import Settlement, Player
+from rest_framework.decorators import action
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Max, Sum
+from kingdomdeathapi.models import Settlement, SettlementChange, Player, Monster, Survivor, Campaign, Milestone, SettlementEvent, SettlementInventory, Event, Resource, SettlementResourceTotal
+from kingdomdeathapi.utils import FlatSerializer, One, IncludeError, parse_includes, plan_includes, serialize_includes, select_ids
+from kingdomdeathapi.utils import MONSTER_KINDS, SURVIVOR_FIELDS, monster_profile, simulate_showdowns, settlement_roster, survivor_score, best_parties
+from kingdomdeathapi.utils import DEFAULT_STRATEGY, submit_projection
+from kingdomdeathapi.utils import FilterError, expansion_filters, event_deck, record_changes, publish_change
+from kingdomdeathapi.utils import AliasTable, add_to_inventory
+from kingdomdeathapi.utils import TurnError, validate_turn, apply_turn, roster_columns, settlement_stats
+
+MAX_PARTY_SIZE = 4
+MAX_PARTIES = 10
+MAX_PARTY_RUNS = 20000
+MAX_PROJECTION_YEARS = 50
+MAX_PROJECTION_RUNS = 20000
+MAX_EVENT_DRAWS = 20
+MAX_HUNT_DROPS = 50
 
 
 class SettlementView(ViewSet):
@@ -11,22 +32,42 @@ class SettlementView(ViewSet):
         """
         Summary:
             Retrieve a list of settlements based on query parameters.
+            Related data named in the `include` parameter is loaded alongside each settlement.
 
         Args:
             request (HttpRequest): The full HTTP request object.
 
         Returns:
-            Response: A serialized dictionary and HTTP status 200 OK.
+            Response: A serialized dictionary and HTTP status 200 OK,
+            or HTTP status 400 Bad Request if an include path is not a relation.
         """
-        settlements = Settlement.objects.all()
+        includes = parse_includes(request.query_params.get('include'))
+        try:
+            settlements = plan_includes(Settlement.objects.select_related('game_master__user').order_by('id'), includes)
+        except IncludeError as ex:
+            return Response({'message': str(ex)}, status=status.HTTP_400_BAD_REQUEST)
+
+        missing = None
+        if "ids" in request.query_params:
+            try:
+                settlements, missing = select_ids(settlements, request.query_params['ids'])
+            except ValueError:
+                return Response({'message': 'ids must be a comma separated list of integers'}, status=status.HTTP_400_BAD_REQUEST)
 
         serializer = SettlementSerializer(settlements, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        data = serializer.data
+        for item, settlement in zip(data, serializer.instance):
+            item.update(serialize_includes(settlement, includes))
+
+        if missing is not None:
+            return Response({'results': data, 'missing': missing}, status=status.HTTP_200_OK)
+        return Response(data, status=status.HTTP_200_OK)
 
     def retrieve(self, request, pk=None):
         """
         Summary:
             Retrieve a specific settlement by primary key.
+            Related data named in the `include` parameter is loaded alongside the settlement.
 
         Args:
             request (HttpRequest): The full HTTP request object.
@@ -34,12 +75,18 @@ class SettlementView(ViewSet):
 
         Returns:
             Response: A serialized dictionary containing the settlement's data and HTTP status 200 OK,
+            HTTP status 400 Bad Request if an include path is not a relation,
             or HTTP status 404 Not Found if the settlement with the specified primary key does not exist.
         """
+        includes = parse_includes(request.query_params.get('include'))
         try:
-            settlement = Settlement.objects.get(pk=pk)
+            settlement = plan_includes(Settlement.objects.select_related('game_master__user'), includes).get(pk=pk)
             serializer = SettlementSerializer(settlement, many=False)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            data = serializer.data
+            data.update(serialize_includes(settlement, includes))
+            return Response(data, status=status.HTTP_200_OK)
+        except IncludeError as ex:
+            return Response({'message': str(ex)}, status=status.HTTP_400_BAD_REQUEST)
         except Settlement.DoesNotExist:
             return Response(status=status.HTTP_404_NOT_FOUND)
 
@@ -87,7 +134,8 @@ class SettlementView(ViewSet):
             settlement.population = request.data["population"]
             settlement.game_master = Player.objects.get(
                 pk=request.data["game_master"]["id"])
-            settlement.save()
+            # The version is left alone, as it is only ever moved on by recording a change
+            settlement.save(update_fields=['name', 'survival_limit', 'population', 'game_master'])
             return Response(status=status.HTTP_204_NO_CONTENT)
         except Settlement.DoesNotExist:
             return Response(status=status.HTTP_404_NOT_FOUND)
@@ -113,6 +161,441 @@ class SettlementView(ViewSet):
         except Settlement.DoesNotExist:
             return Response(status=status.HTTP_404_NOT_FOUND)
 
+    @action(detail=True, methods=['get'])
+    def changes(self, request, pk=None):
+        """
+        Summary:
+            Retrieve what changed in a settlement since a version, for clients syncing a copy they already hold.
+            Each changed object is listed once, with its latest change.
+
+        Args:
+            request (HttpRequest): The full HTTP request object.
+                since (int): The version the client holds. Everything is listed when it is omitted.
+            pk (int): The primary key of the settlement.
+
+        Returns:
+            Response: The settlement's current version and its changes in version order and HTTP status 200 OK,
+            HTTP status 400 Bad Request if since is not an integer,
+            HTTP status 410 Gone if since is older than the changes kept, MAX_SETTLEMENT_CHANGES,
+            or HTTP status 404 Not Found if the settlement with the specified primary key does not exist.
+        """
+        try:
+            since = int(request.query_params.get('since', 0))
+        except ValueError:
+            return Response({'message': 'since must be an integer'}, status=status.HTTP_400_BAD_REQUEST)
+
+        version = Settlement.objects.filter(pk=pk).values_list('version', flat=True).first()
+        if version is None:
+            return Response(status=status.HTTP_404_NOT_FOUND)
+        if 'since' in request.query_params and since < version - settings.MAX_SETTLEMENT_CHANGES:
+            return Response({'message': 'Changes that old are no longer kept, fetch the settlement again', 'version': version},
+                            status=status.HTTP_410_GONE)
+
+        latest = {}
+        rows = SettlementChange.objects.filter(settlement_id=pk, version__gt=since, version__lte=version).order_by('version')
+        for change_version, model, object_id, op in rows.values_list('version', 'model', 'object_id', 'op'):
+            # Later changes to an object replace earlier ones, and move it to the later position
+            latest.pop((model, object_id), None)
+            latest[(model, object_id)] = {'model': model, 'id': object_id, 'op': op, 'version': change_version}
+
+        return Response({'version': version, 'changes': list(latest.values())}, status=status.HTTP_200_OK)
+
+    @action(detail=True, methods=['get'])
+    def best_party(self, request, pk=None):
+        """
+        Summary:
+            Pick the best hunting parties from a settlement's survivors, scored on their stats, armor, wounds,
+            fighting arts and disorders, with a bonus for covering different weapon proficiencies.
+            The parties can then be ranked by simulated showdowns instead.
+
+        Args:
+            request (HttpRequest): The full HTTP request object.
+                size (int): The party size, 1 to 4. Defaults to 4.
+                k (int): The number of parties to return, 1 to 10. Defaults to 3.
+                monster (int): The monster hunted. A level 1 quarry is assumed when it is omitted.
+                level (int): The monster's level, 1 to 3. Defaults to 1.
+                exclude (str): Comma separated ids of survivors staying home.
+                runs (int): Showdowns to simulate per party, up to 20000. Parties are not simulated when it is 0, the default.
+                seed (int): Seed for the simulated rolls.
+            pk (int): The primary key of the settlement.
+
+        Returns:
+            Response: The parties, best first, with their members and scores and HTTP status 200 OK,
+            HTTP status 400 Bad Request if a parameter is invalid,
+            or HTTP status 404 Not Found if the settlement or monster does not exist.
+        """
+        params = request.query_params
+        try:
+            size = int(params.get('size', MAX_PARTY_SIZE))
+            k = int(params.get('k', 3))
+            level = int(params.get('level', 1))
+            runs = int(params.get('runs', 0))
+            seed = None if params.get('seed') is None else int(params['seed'])
+            monster_id = None if params.get('monster') is None else int(params['monster'])
+            exclude = {int(survivor) for survivor in params.get('exclude', '').split(',') if survivor.strip()}
+        except ValueError:
+            return Response({'message': 'size, k, level, runs, seed, monster and exclude must be integers'}, status=status.HTTP_400_BAD_REQUEST)
+
+        if not 1 <= size <= MAX_PARTY_SIZE or not 1 <= k <= MAX_PARTIES or not 1 <= level <= 3 or not 0 <= runs <= MAX_PARTY_RUNS:
+            return Response({'message': f'size must be 1 to {MAX_PARTY_SIZE}, k 1 to {MAX_PARTIES}, level 1 to 3 and runs 0 to {MAX_PARTY_RUNS}'},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        if not Settlement.objects.filter(pk=pk).exists():
+            return Response(status=status.HTTP_404_NOT_FOUND)
+
+        monster = None
+        if monster_id is None:
+            profile = dict(MONSTER_KINDS['quarry'])
+        else:
+            monster = Monster.objects.filter(pk=monster_id).first()
+            if monster is None:
+                return Response(status=status.HTTP_404_NOT_FOUND)
+            profile = monster_profile(monster, level)
+
+        roster = settlement_roster(pk).exclude(pk__in=exclude)
+        survivors = list(roster.values(*SURVIVOR_FIELDS).annotate(
+            fighting_arts=Count('fighting_art', distinct=True), disorders=Count('disorder', distinct=True)))
+        weapons = {}
+        for survivor_id, weapon_id in Survivor.weapon_proficiency.through.objects.filter(survivor__in=roster.values('pk')) \
+                .values_list('survivor_id', 'weaponproficiency_id'):
+            weapons.setdefault(survivor_id, set()).add(weapon_id)
+
+        members = [{'id': survivor['id'], 'score': survivor_score(survivor, profile),
+                    'weapons': frozenset(weapons.get(survivor['id'], ())), 'survivor': survivor} for survivor in survivors]
+        found, scored = best_parties(members, size, k)
+
+        parties = []
+        for score, party in found:
+            entry = {
+                'score': score,
+                'weapon_proficiencies': len(frozenset().union(*(member['weapons'] for member in party))),
+                'survivors': [{'id': member['id'], 'name': member['survivor']['name'], 'score': member['score']} for member in party],
+            }
+            if runs:
+                result = simulate_showdowns([member['survivor'] for member in party], profile, runs, seed)
+                entry.update(win_rate=result['win_rate'], mean_rounds=result['mean_rounds'])
+            parties.append(entry)
+        if runs:
+            # sorted is stable, so parties simulated as equally good keep their score order
+            parties.sort(key=lambda entry: -entry['win_rate'])
+
+        return Response({
+            'monster': None if monster is None else {'id': monster.id, 'name': monster.name, 'level': level},
+            'candidates': len(members),
+            'scored': scored,
+            'parties': parties,
+        }, status=status.HTTP_200_OK)
+
+    @action(detail=True, methods=['post'])
+    def projections(self, request, pk=None):
+        """
+        Summary:
+            Start projecting many possible futures of a settlement, year by year, from its population,
+            survival limit, inventory and milestones. The projection runs in worker processes and
+            its results are fetched from /projections/<id> once it is done.
+
+        Args:
+            request (HttpRequest): The full HTTP request object.
+                campaign (int): The campaign played, to project up to its last year.
+                years (int): The number of years to project, up to 50. Defaults to the rest of the campaign, or 10 without one.
+                runs (int): The number of futures to simulate, up to 20000. Defaults to 1000.
+                seed (int): Seed for the random rolls.
+                strategy (dict): Overrides of the hunts, party_size, death_rate, win_rate, drops, intimacy,
+                    birth_rate and spend per year. Rates are 0 to 1 and counts 0 to 20.
+            pk (int): The primary key of the settlement.
+
+        Returns:
+            Response: The projection's id and where to fetch it with HTTP status 202 Accepted,
+            HTTP status 400 Bad Request if a parameter is invalid,
+            or HTTP status 404 Not Found if the settlement or campaign does not exist.
+        """
+        if not isinstance(request.data, dict):
+            return Response({'message': 'The projection must be an object'}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            runs = int(request.data.get('runs', 1000))
+            seed = request.data.get('seed')
+            seed = None if seed is None else int(seed)
+            years = request.data.get('years')
+            years = None if years is None else int(years)
+            campaign_id = request.data.get('campaign')
+            campaign_id = None if campaign_id is None else int(campaign_id)
+            strategy = dict(request.data.get('strategy') or {})
+            for key, value in strategy.items():
+                if key not in DEFAULT_STRATEGY:
+                    raise KeyError(key)
+                strategy[key] = type(DEFAULT_STRATEGY[key])(value)
+        except (KeyError, TypeError, ValueError):
+            return Response({'message': f'runs, seed, years and campaign must be integers and strategy only sets {", ".join(DEFAULT_STRATEGY)}'},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        if any(not 0 <= value <= (1 if isinstance(value, float) else 20) for value in strategy.values()):
+            return Response({'message': 'Strategy rates must be 0 to 1 and counts 0 to 20'}, status=status.HTTP_400_BAD_REQUEST)
+
+        settlement = Settlement.objects.filter(pk=pk).first()
+        if settlement is None:
+            return Response(status=status.HTTP_404_NOT_FOUND)
+
+        start_year = SettlementEvent.objects.filter(settlement=settlement).aggregate(year=Max('year'))['year'] or 0
+        if years is None:
+            years = 10
+            if campaign_id is not None:
+                campaign = Campaign.objects.filter(pk=campaign_id).first()
+                if campaign is None:
+                    return Response(status=status.HTTP_404_NOT_FOUND)
+                years = campaign.years - start_year
+        if not 1 <= years <= MAX_PROJECTION_YEARS or not 1 <= runs <= MAX_PROJECTION_RUNS:
+            return Response({'message': f'There must be 1 to {MAX_PROJECTION_YEARS} years to project and runs must be 1 to {MAX_PROJECTION_RUNS}'},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        inventory = SettlementInventory.objects.filter(settlement=settlement).values('resource_id').annotate(total=Sum('amount'))
+        state = {
+            'population': settlement.population,
+            'survival_limit': settlement.survival_limit,
+            'inventory': {row['resource_id']: row['total'] for row in inventory},
+            'milestones': list(Milestone.objects.filter(settlement=settlement, achieved=True).values_list('milestone_type__type', flat=True)),
+        }
+        job_id = submit_projection(request.user.id, settlement.pk, state, strategy, start_year, years, runs, seed)
+        return Response({'id': job_id, 'status': 'running', 'url': f'/projections/{job_id}'}, status=status.HTTP_202_ACCEPTED)
+
+    @action(detail=True, methods=['post'])
+    def draw_events(self, request, pk=None):
+        """
+        Summary:
+            Draw events from the deck for a settlement and add them to its timeline. Events already in the
+            timeline are left out of the deck, and every draw in a request is a different event.
+
+        Args:
+            request (HttpRequest): The full HTTP request object.
+                campaign (int): Query parameter keeping the events of a campaign.
+                story (bool): Query parameter keeping story events, or only other events when false.
+                expansion (str): Query parameter filtering on expansions, as in the catalog lists.
+                count (int): The number of events to draw, 1 to 20. Defaults to 1.
+                weights (dict): Weights of events other than 1, by event id. A weight of 0 leaves an event out.
+                repeat (bool): Whether events already in the timeline can be drawn. Defaults to false.
+                year (int): The lantern year of the drawn events. Defaults to the year after the latest in the timeline.
+                seed (int): Seed for the draws.
+                save (bool): Whether to add the events to the timeline. Defaults to true.
+            pk (int): The primary key of the settlement.
+
+        Returns:
+            Response: The events drawn and the settlement's version with HTTP status 201 Created,
+            or 200 OK when they are not saved, HTTP status 400 Bad Request if a parameter is invalid,
+            or HTTP status 404 Not Found if the settlement does not exist.
+        """
+        params = request.query_params
+        try:
+            filters = expansion_filters(params)
+            if 'campaign' in params:
+                filters.append(('campaign', int(params['campaign']), True))
+            if params.get('story') in ('true', 'false'):
+                filters.append(('story', params['story'] == 'true', True))
+        except FilterError as ex:
+            return Response({'message': str(ex)}, status=status.HTTP_400_BAD_REQUEST)
+        except ValueError:
+            return Response({'message': 'campaign must be an integer'}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            count = int(request.data.get('count', 1))
+            weights = {int(event): float(weight) for event, weight in (request.data.get('weights') or {}).items()}
+            year = request.data.get('year')
+            year = None if year is None else int(year)
+            seed = request.data.get('seed')
+            seed = None if seed is None else int(seed)
+        except (AttributeError, TypeError, ValueError):
+            return Response({'message': 'count, year and seed must be integers and weights numbers by event id'},
+                            status=status.HTTP_400_BAD_REQUEST)
+        if not 1 <= count <= MAX_EVENT_DRAWS or any(not math.isfinite(weight) or weight < 0 for weight in weights.values()):
+            return Response({'message': f'count must be 1 to {MAX_EVENT_DRAWS} and weights finite numbers of 0 or more'},
+                            status=status.HTTP_400_BAD_REQUEST)
+        repeat = bool(request.data.get('repeat', False))
+        save = bool(request.data.get('save', True))
+
+        version = Settlement.objects.filter(pk=pk).values_list('version', flat=True).first()
+        if version is None:
+            return Response(status=status.HTTP_404_NOT_FOUND)
+
+        table, deck_weights = event_deck(int(pk), version, filters, weights, repeat)
+        drawn = table.sample_unique(count, random.Random(seed), deck_weights)
+        names = dict(Event.objects.filter(pk__in=drawn).values_list('pk', 'name'))
+        if year is None:
+            year = (SettlementEvent.objects.filter(settlement_id=pk).aggregate(year=Max('year'))['year'] or 0) + 1
+
+        rows = [SettlementEvent(settlement_id=pk, event_id=event, year=year) for event in drawn]
+        if save and rows:
+            with transaction.atomic():
+                SettlementEvent.objects.bulk_create(rows)
+                # bulk_create sends no signals, so the changes are recorded and pushed here
+                version = record_changes(int(pk), [('settlement_event', row.pk, 'save') for row in rows])
+                for row in rows:
+                    publish_change(row, 'save')
+
+        return Response({
+            'version': version,
+            'events': [{'id': row.pk, 'event': {'id': row.event_id, 'name': names[row.event_id]}, 'year': row.year} for row in rows],
+        }, status=status.HTTP_201_CREATED if save else status.HTTP_200_OK)
+
+    @action(detail=True, methods=['post'])
+    def hunt_rewards(self, request, pk=None):
+        """
+        Summary:
+            Draw the resources a settlement gains from a monster after a showdown and add them to its inventory
+            in one batch. Drops come from the resources the monster is the origin of.
+
+        Args:
+            request (HttpRequest): The full HTTP request object.
+                monster (int): The monster hunted.
+                count (int): The number of resources drawn, 1 to 50. Defaults to 4.
+                weights (dict): Weights of resources other than 1, by resource id. A weight of 0 leaves a resource out.
+                seed (int): Seed for the draws.
+                save (bool): Whether to add the resources to the inventory. Defaults to true.
+            pk (int): The primary key of the settlement.
+
+        Returns:
+            Response: The resources drawn, the inventory rows written and the settlement's version with
+            HTTP status 201 Created, or 200 OK when they are not saved, HTTP status 400 Bad Request if
+            a parameter is invalid, or HTTP status 404 Not Found if the settlement or monster does not exist.
+        """
+        try:
+            monster_id = int(request.data['monster'])
+            count = int(request.data.get('count', 4))
+            weights = {int(resource): float(weight) for resource, weight in (request.data.get('weights') or {}).items()}
+            seed = request.data.get('seed')
+            seed = None if seed is None else int(seed)
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return Response({'message': 'You must provide a monster, and count and seed must be integers and weights numbers by resource id'},
+                            status=status.HTTP_400_BAD_REQUEST)
+        if not 1 <= count <= MAX_HUNT_DROPS or any(not math.isfinite(weight) or weight < 0 for weight in weights.values()):
+            return Response({'message': f'count must be 1 to {MAX_HUNT_DROPS} and weights finite numbers of 0 or more'},
+                            status=status.HTTP_400_BAD_REQUEST)
+        save = bool(request.data.get('save', True))
+
+        version = Settlement.objects.filter(pk=pk).values_list('version', flat=True).first()
+        monster = Monster.objects.filter(pk=monster_id).first()
+        if version is None or monster is None:
+            return Response(status=status.HTTP_404_NOT_FOUND)
+
+        names = dict(Resource.objects.filter(monster_origin=monster).order_by('pk').values_list('pk', 'name'))
+        table = AliasTable(list(names), [weights.get(resource, 1.0) for resource in names])
+        # Duplicates are merged before anything is written, so each resource is written once
+        drops = Counter(table.sample(count, random.Random(seed)) if len(table) else [])
+
+        rows = []
+        if save:
+            rows, changed = add_to_inventory(int(pk), drops)
+            version = changed or version
+
+        return Response({
+            'version': version,
+            'monster': {'id': monster.id, 'name': monster.name},
+            'drops': [{'resource': {'id': resource, 'name': names[resource]}, 'amount': amount}
+                      for resource, amount in sorted(drops.items())],
+            'inventory': [{'id': row.pk, 'resource': row.resource_id, 'amount': row.amount} for row in rows],
+        }, status=status.HTTP_201_CREATED if save else status.HTTP_200_OK)
+
+    @action(detail=True, methods=['post'])
+    def turn(self, request, pk=None):
+        """
+        Summary:
+            Apply a whole settlement phase at once, instead of a request per change. Every id in the turn is
+            checked before anything is written, and the turn is applied in one transaction.
+
+        Args:
+            request (HttpRequest): The full HTTP request object.
+                population (int): The settlement's new population.
+                survival_limit (int): The settlement's new survival limit.
+                inventory (dict): Amounts of resources added, or taken away when negative, by resource id.
+                milestones (list): Ids of the milestone types reached.
+                events (list): Timeline events to add, as objects with an event id and a year.
+                survivors (list): Survivors of the settlement to change, as objects with an id and the fields to set.
+            pk (int): The primary key of the settlement.
+
+        Returns:
+            Response: The settlement, its new version and the ids of the rows written with HTTP status 200 OK,
+            HTTP status 400 Bad Request with the problems by section if the turn is invalid,
+            or HTTP status 404 Not Found if the settlement does not exist.
+        """
+        settlement = Settlement.objects.select_related('game_master__user').filter(pk=pk).first()
+        if settlement is None:
+            return Response(status=status.HTTP_404_NOT_FOUND)
+
+        try:
+            turn = validate_turn(settlement.pk, request.data)
+        except TurnError as ex:
+            return Response({'message': str(ex), 'errors': ex.errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            written = apply_turn(settlement, turn)
+        except TurnError as ex:
+            return Response({'message': str(ex), 'errors': ex.errors}, status=status.HTTP_400_BAD_REQUEST)
+        settlement.version = Settlement.objects.filter(pk=pk).values_list('version', flat=True).get()
+        return Response({'settlement': SettlementSerializer(settlement).data, **written}, status=status.HTTP_200_OK)
+
+    @action(detail=True, methods=['get'])
+    def roster(self, request, pk=None):
+        """
+        Summary:
+            Retrieve the survivors of a settlement's players with their derived stats, as a list per column
+            rather than an object per survivor: total armor, light and heavy wounds, whether they can hunt,
+            whether they are insane, and how many disorders and fighting arts they have.
+
+        Args:
+            request (HttpRequest): The full HTTP request object.
+            pk (int): The primary key of the settlement.
+
+        Returns:
+            Response: The number of survivors and their columns with HTTP status 200 OK,
+            or HTTP status 404 Not Found if the settlement does not exist.
+        """
+        if not Settlement.objects.filter(pk=pk).exists():
+            return Response(status=status.HTTP_404_NOT_FOUND)
+
+        columns = roster_columns(settlement_roster(pk))
+        return Response({'count': len(columns['id']), 'columns': columns}, status=status.HTTP_200_OK)
+
+    @action(detail=True, methods=['get'])
+    def stats(self, request, pk=None):
+        """
+        Summary:
+            Retrieve figures summarizing a settlement, aggregated in the database: its survivor count with
+            the mean and max of each attribute, inventory totals overall and by resource type, the share
+            of milestones reached, and the number of events in each year of its timeline.
+
+        Args:
+            request (HttpRequest): The full HTTP request object.
+            pk (int): The primary key of the settlement.
+
+        Returns:
+            Response: The settlement's figures and HTTP status 200 OK,
+            or HTTP status 404 Not Found if the settlement does not exist.
+        """
+        if not Settlement.objects.filter(pk=pk).exists():
+            return Response(status=status.HTTP_404_NOT_FOUND)
+
+        return Response(settlement_stats(pk), status=status.HTTP_200_OK)
+
+    @action(detail=True, methods=['get'])
+    def resource_totals(self, request, pk=None):
+        """
+        Summary:
+            Retrieve how much of each resource type a settlement holds, e.g. for crafting.
+            The totals are kept up to date as the inventory changes, so nothing is summed here.
+
+        Args:
+            request (HttpRequest): The full HTTP request object.
+            pk (int): The primary key of the settlement.
+
+        Returns:
+            Response: The total per resource type and HTTP status 200 OK,
+            or HTTP status 404 Not Found if the settlement does not exist.
+        """
+        if not Settlement.objects.filter(pk=pk).exists():
+            return Response(status=status.HTTP_404_NOT_FOUND)
+
+        totals = SettlementResourceTotal.objects.filter(settlement_id=pk).exclude(total=0).order_by('resource_type')
+        return Response([{'type': {'id': resource_type, 'name': name}, 'total': total}
+                         for resource_type, name, total in totals.values_list('resource_type', 'resource_type__name', 'total')],
+                        status=status.HTTP_200_OK)
+
 
 class PlayerSerializer(serializers.ModelSerializer):
     class Meta:
@@ -125,4 +608,10 @@ class SettlementSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Settlement
-        fields = ('id', 'name', 'population', 'survival_limit', 'game_master',)
+        fields = ('id', 'name', 'population', 'survival_limit', 'game_master', 'version',)
+
+
+class SettlementFlatSerializer(FlatSerializer):
+    model = Settlement
+    fields = ('id', 'name', 'population', 'survival_limit', ('game_master', One('id', ('username', 'user__username'))),
+              'version')
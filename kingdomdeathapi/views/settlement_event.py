@@ -3,6 +3,7 @@ from rest_framework.viewsets import ViewSet
 from rest_framework.response import Response
 from rest_framework import status
 from kingdomdeathapi.models import SettlementEvent, Settlement, Event
+from kingdomdeathapi.utils import ids_response
 
 
 class SettlementEventView(ViewSet):
@@ -18,13 +19,16 @@ class SettlementEventView(ViewSet):
         Returns:
             Response: A serialized dictionary and HTTP status 200 OK.
         """
-        settlement_events = SettlementEvent.objects.all()
+        settlement_events = SettlementEvent.objects.select_related('event').order_by('id')
 
         if "settlement" in request.query_params:
             settlement_value = request.query_params.get('settlement')
             settlement_events = settlement_events.filter(settlement=settlement_value)
 
 
+        if "ids" in request.query_params:
+            return ids_response(settlement_events, request.query_params['ids'], SettlementEventSerializer)
+
         serializer = SettlementEventSerializer(settlement_events, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -42,7 +46,7 @@ class SettlementEventView(ViewSet):
             or HTTP status 404 Not Found if the settlement_event with the specified primary key does not exist.
         """
         try:
-            settlement_event = SettlementEvent.objects.get(pk=pk)
+            settlement_event = SettlementEvent.objects.select_related('event').get(pk=pk)
             serializer = SettlementEventSerializer(settlement_event, many=False)
             return Response(serializer.data, status=status.HTTP_200_OK)
         except SettlementEvent.DoesNotExist:
@@ -1,8 +1,10 @@
+from django.conf import settings
 from rest_framework import serializers
 from rest_framework.viewsets import ViewSet
 from rest_framework.response import Response
 from rest_framework import status
 from kingdomdeathapi.models import SettlementInventory, Settlement, Resource, ResourceType
+from kingdomdeathapi.utils import ids_response, FlatSerializer, One, Many
 
 
 class SettlementInventoryView(ViewSet):
@@ -18,13 +20,19 @@ class SettlementInventoryView(ViewSet):
         Returns:
             Response: A serialized dictionary and HTTP status 200 OK.
         """
-        settlement_inventories = SettlementInventory.objects.all()
+        settlement_inventories = SettlementInventory.objects.select_related('resource').prefetch_related('resource__type').order_by('id')
 
         if "settlement" in request.query_params:
             settlement_value = request.query_params.get('settlement')
             settlement_inventories = settlement_inventories.filter(settlement=settlement_value)
 
-        serializer = SettlementInventorySerializer(settlement_inventories, many=True)
+        if "ids" in request.query_params:
+            return ids_response(settlement_inventories, request.query_params['ids'], SettlementInventorySerializer)
+
+        if settings.FAST_SERIALIZATION:
+            serializer = SettlementInventoryFlatSerializer(settlement_inventories)
+        else:
+            serializer = SettlementInventorySerializer(settlement_inventories, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     def retrieve(self, request, pk=None):
@@ -41,7 +49,7 @@ class SettlementInventoryView(ViewSet):
             or HTTP status 404 Not Found if the settlement_inventory with the specified primary key does not exist.
         """
         try:
-            settlement_inventory = SettlementInventory.objects.get(pk=pk)
+            settlement_inventory = SettlementInventory.objects.select_related('resource').prefetch_related('resource__type').get(pk=pk)
             serializer = SettlementInventorySerializer(settlement_inventory, many=False)
             return Response(serializer.data, status=status.HTTP_200_OK)
         except SettlementInventory.DoesNotExist:
@@ -125,7 +133,7 @@ class ResourceSerializer(serializers.ModelSerializer):
             model = ResourceType
             fields = ('id', 'name', )
 
-    type = ResourceTypeSerializer(many=False)
+    type = ResourceTypeSerializer(many=True)
 
     class Meta:
         model = Resource
@@ -138,3 +146,8 @@ class SettlementInventorySerializer(serializers.ModelSerializer):
     class Meta:
         model = SettlementInventory
         fields = ('id', 'settlement', 'resource', 'amount', )
+
+
+class SettlementInventoryFlatSerializer(FlatSerializer):
+    model = SettlementInventory
+    fields = ('id', 'settlement', ('resource', One('id', 'name', ('type', Many('id', 'name')))), 'amount', )
@@ -0,0 +1,47 @@
+from rest_framework import status
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from kingdomdeathapi.models import Monster, Survivor
+from kingdomdeathapi.utils import SURVIVOR_FIELDS, monster_profile, simulate_showdowns
+
+MAX_PARTY_SIZE = 4
+MAX_RUNS = 200000
+
+
+@api_view(['POST'])
+def simulate_showdown(request):
+    '''Simulates showdowns of a party of survivors against a monster
+
+    The body names the `survivors` in the party, the `monster` and optionally
+    its `level` (1 to 3), the number of `runs` (10000 by default) and a `seed`
+    to make the rolls reproducible. The response has the party's win rate,
+    the mean number of rounds, the distribution of how many survivors die,
+    and each survivor's death rate and expected injuries per hit location.
+
+    Method arguments:
+      request -- The full HTTP request object
+    '''
+    try:
+        survivor_ids = [int(pk) for pk in request.data['survivors']]
+        monster_id = int(request.data['monster'])
+        level = int(request.data.get('level', 1))
+        runs = int(request.data.get('runs', 10000))
+        seed = request.data.get('seed')
+        seed = None if seed is None else int(seed)
+    except (KeyError, TypeError, ValueError):
+        return Response({'message': 'You must provide a list of survivors, a monster, and integer level, runs and seed'}, status=status.HTTP_400_BAD_REQUEST)
+
+    if not 1 <= len(set(survivor_ids)) == len(survivor_ids) <= MAX_PARTY_SIZE:
+        return Response({'message': f'A party is 1 to {MAX_PARTY_SIZE} different survivors'}, status=status.HTTP_400_BAD_REQUEST)
+    if not 1 <= level <= 3 or not 1 <= runs <= MAX_RUNS:
+        return Response({'message': f'level must be 1 to 3 and runs 1 to {MAX_RUNS}'}, status=status.HTTP_400_BAD_REQUEST)
+
+    party = {survivor['id']: survivor for survivor in Survivor.objects.filter(pk__in=survivor_ids).values(*SURVIVOR_FIELDS)}
+    monster = Monster.objects.filter(pk=monster_id).first()
+    if len(party) != len(survivor_ids) or monster is None:
+        return Response(status=status.HTTP_404_NOT_FOUND)
+
+    profile = monster_profile(monster, level)
+    result = simulate_showdowns([party[pk] for pk in survivor_ids], profile, runs, seed)
+    return Response({'monster': {'id': monster.id, 'name': monster.name, 'level': level, **profile}, **result},
+                    status=status.HTTP_200_OK)
@@ -1,8 +1,11 @@
+from django.conf import settings
 from rest_framework import serializers
 from rest_framework.viewsets import ViewSet
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework.decorators import action
 from kingdomdeathapi.models import Survivor, Player, WeaponProficiency, FightingArt, Ability, Disorder
+from kingdomdeathapi.utils import ids_response, FlatSerializer, One, Many, WOUND_FIELDS, ProgressError, validate_progress, apply_progress
 
 
 class SurvivorView(ViewSet):
@@ -18,9 +21,15 @@ class SurvivorView(ViewSet):
         Returns:
             Response: A serialized dictionary and HTTP status 200 OK.
         """
-        survivors = Survivor.objects.all()
+        survivors = Survivor.objects.select_related('user__user').prefetch_related('weapon_proficiency', 'fighting_art', 'disorder', 'ability').order_by('id')
 
-        serializer = SurvivorSerializer(survivors, many=True)
+        if "ids" in request.query_params:
+            return ids_response(survivors, request.query_params['ids'], SurvivorSerializer)
+
+        if settings.FAST_SERIALIZATION:
+            serializer = SurvivorFlatSerializer(survivors)
+        else:
+            serializer = SurvivorSerializer(survivors, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     def retrieve(self, request, pk=None):
@@ -37,7 +46,7 @@ class SurvivorView(ViewSet):
             or HTTP status 404 Not Found if the survivor with the specified primary key does not exist.
         """
         try:
-            survivor = Survivor.objects.get(pk=pk)
+            survivor = Survivor.objects.select_related('user__user').prefetch_related('weapon_proficiency', 'fighting_art', 'disorder', 'ability').get(pk=pk)
             serializer = SurvivorSerializer(survivor, many=False)
             return Response(serializer.data, status=status.HTTP_200_OK)
         except Survivor.DoesNotExist:
@@ -187,6 +196,37 @@ class SurvivorView(ViewSet):
         except Survivor.DoesNotExist:
             return Response(status=status.HTTP_404_NOT_FOUND)
 
+    @action(detail=False, methods=['post'])
+    def progress(self, request):
+        """
+        Summary:
+            Apply the progression of every survivor of a showdown at once: hunt experience gained,
+            weapon proficiency levels gained, and wounds cleared or taken.
+
+        Args:
+            request (HttpRequest): The full HTTP request object.
+                survivors (list): An object per survivor with its id and any of hunt_experience gained,
+                    proficiency levels gained by weapon proficiency id, clear_wounds, and wounds to set to true or false.
+
+        Returns:
+            Response: The survivors' hunt experience and wounds and the proficiency levels written with HTTP status 200 OK,
+            or HTTP status 400 Bad Request with the problems found if the progression is invalid.
+        """
+        # A body other than an object has no survivors, which validation reports
+        entries = request.data.get('survivors') if isinstance(request.data, dict) else None
+        try:
+            plan = validate_progress(entries)
+        except ProgressError as ex:
+            return Response({'message': str(ex), 'errors': ex.errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        survivors, levels = apply_progress(plan)
+        return Response({
+            'survivors': [{'id': survivor.pk, 'hunt_experience': survivor.hunt_experience,
+                           **{field: getattr(survivor, field) for field in WOUND_FIELDS}} for survivor in survivors],
+            'proficiency_levels': [{'id': level.pk, 'survivor': level.survivor_id, 'weapon_type': level.weapon_type_id,
+                                    'level': level.level} for level in levels],
+        }, status=status.HTTP_200_OK)
+
 
 class PlayerSerializer(serializers.ModelSerializer):
     class Meta:
@@ -232,3 +272,16 @@ class SurvivorSerializer(serializers.ModelSerializer):
     'leg_light_wound', 'leg_heavy_wound', 'weapon_proficiency', 'fighting_art',
     'disorder', 'ability',
 )
+
+
+class SurvivorFlatSerializer(FlatSerializer):
+    model = Survivor
+    fields = (
+    'id', ('user', One('id', ('username', 'user__username'))), 'name', 'survival', 'insanity', 'hunt_experience', 'gender',
+    'movement', 'accuracy', 'strength', 'evasion', 'speed', 'luck', 'understanding',
+    'courage', 'head_armor', 'head_wound', 'arm_armor', 'arm_light_wound',
+    'arm_heavy_wound', 'body_armor', 'body_light_wound', 'body_heavy_wound',
+    'waist_armor', 'waist_light_wound', 'waist_heavy_wound', 'leg_armor',
+    'leg_light_wound', 'leg_heavy_wound', ('weapon_proficiency', Many('id', 'name')), ('fighting_art', Many('id', 'name')),
+    ('disorder', Many('id', 'name')), ('ability', Many('id', 'name')),
+)
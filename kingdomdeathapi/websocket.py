@@ -0,0 +1,117 @@
+import asyncio
+import json
+import re
+from kingdomdeathapi.models import Player, Session
+from kingdomdeathapi.utils import broker
+
+LIVE_PATH = re.compile(r'/sessions/(?P<pk>\d+)/live/?')
+
+# The subprotocol a browser offers ahead of its token, as in new WebSocket(url, ['token', key]).
+# It is the one the server accepts, so the token is never echoed back.
+TOKEN_PROTOCOL = 'token'
+
+# Close codes sent before the handshake is accepted
+CLOSE_NOT_FOUND = 4404
+CLOSE_UNAUTHORIZED = 4401
+CLOSE_FORBIDDEN = 4403
+
+
+async def session_channel(scope, receive, send):
+    '''ASGI application pushing live change events for a session over a WebSocket
+
+    Clients connect to /sessions/<id>/live with their API token, either as the
+    subprotocol following "token" in the Sec-WebSocket-Protocol header, which
+    browsers can set, or in an Authorization header. The token is never taken
+    from the query string, which ends up in access logs. Clients must be the
+    session's host, one of its players or the settlement's game master. Each
+    change to the session, its settlement's inventory, milestones, events or
+    details, or a participant's survivors is sent as a JSON text frame such as
+    {"model": "survivor", "id": 3, "op": "save"}. A {"op": "resync"} frame
+    means events were dropped and the client should refetch.
+
+    Method arguments:
+      scope -- The ASGI connection scope
+      receive -- Awaitable returning the next ASGI event
+      send -- Awaitable sending an ASGI event
+    '''
+    if (await receive())['type'] != 'websocket.connect':
+        return
+
+    match = LIVE_PATH.fullmatch(scope['path'])
+    if match is None:
+        await send({'type': 'websocket.close', 'code': CLOSE_NOT_FOUND})
+        return
+
+    player_id = await _authenticate(scope)
+    if player_id is None:
+        await send({'type': 'websocket.close', 'code': CLOSE_UNAUTHORIZED})
+        return
+
+    session_id = int(match['pk'])
+    topics = await _session_topics(session_id, player_id)
+    if topics is None:
+        await send({'type': 'websocket.close', 'code': CLOSE_FORBIDDEN})
+        return
+
+    subscription = broker.subscribe(topics)
+    if TOKEN_PROTOCOL in scope.get('subprotocols', []):
+        await send({'type': 'websocket.accept', 'subprotocol': TOKEN_PROTOCOL})
+    else:
+        await send({'type': 'websocket.accept'})
+
+    receiving = asyncio.ensure_future(receive())
+    getting = asyncio.ensure_future(subscription.get())
+    try:
+        while True:
+            done, _ = await asyncio.wait({receiving, getting}, return_when=asyncio.FIRST_COMPLETED)
+
+            if receiving in done:
+                if receiving.result()['type'] == 'websocket.disconnect':
+                    return
+                # Nothing is expected from the client, so its frames are ignored
+                receiving = asyncio.ensure_future(receive())
+
+            if getting in done:
+                event = getting.result()
+                await send({'type': 'websocket.send', 'text': json.dumps(event)})
+
+                if event.get('model') == 'session' and event['id'] == session_id:
+                    # The session or its players changed, so follow its new participants
+                    topics = await _session_topics(session_id, player_id)
+                    if topics is None:
+                        await send({'type': 'websocket.close', 'code': CLOSE_FORBIDDEN})
+                        return
+                    broker.update(subscription, topics)
+                getting = asyncio.ensure_future(subscription.get())
+    finally:
+        broker.unsubscribe(subscription)
+        receiving.cancel()
+        getting.cancel()
+
+
+async def _authenticate(scope):
+    key = None
+    protocols = scope.get('subprotocols', [])
+    if TOKEN_PROTOCOL in protocols[:-1]:
+        key = protocols[protocols.index(TOKEN_PROTOCOL) + 1]
+    else:
+        header = dict(scope.get('headers', [])).get(b'authorization', b'').decode()
+        if header.startswith('Token '):
+            key = header[len('Token '):].strip()
+    if not key:
+        return None
+    return await Player.objects.filter(user__auth_token__key=key, user__is_active=True).values_list('pk', flat=True).afirst()
+
+
+async def _session_topics(session_id, player_id):
+    session = await Session.objects.select_related('settlement').filter(pk=session_id).afirst()
+    if session is None:
+        return None
+
+    participants = {session.host_id}
+    participants.update([pk async for pk in session.players.values_list('pk', flat=True)])
+    if player_id not in participants and session.settlement.game_master_id != player_id:
+        return None
+
+    return {f'session:{session_id}', f'settlement:{session.settlement_id}',
+            *(f'player:{pk}' for pk in participants)}
@@ -2,7 +2,31 @@ from .player_tests import PlayerTests
 from .settlement.settlements_tests import SettlementTests
 from .settlement.settlement_inventory_tests import SettlementInventoryTests
 from .settlement.settlement_event_tests import SettlementEventTests
+from .settlement.settlement_include_tests import SettlementIncludeTests
 from .resource_tests import ResourceTests
 from .milestone_tests import MilestoneTests
 from .survivor_tests import SurvivorTests
-from .session_tests import SessionTests
\ No newline at end of file
+from .session_tests import SessionTests
+from .ids_tests import IdsTests
+from .batch_tests import BatchTests
+from .flat_serializer_tests import FlatSerializerTests
+from .renderer_tests import RendererTests, MessagePackTests
+from .compression_tests import CompressionTests
+from .catalog_tests import CatalogTests
+from .search_tests import SearchTests
+from .autocomplete_tests import AutocompleteTests
+from .resource_index_tests import ResourceIndexTests
+from .filter_tests import FilterTests
+from .live_tests import LiveSessionTests
+from .settlement.settlement_change_tests import SettlementChangeTests
+from .async_read_tests import AsyncReadTests
+from .simulation_tests import SimulationTests
+from .settlement.settlement_party_tests import SettlementPartyTests
+from .settlement.settlement_projection_tests import SettlementProjectionTests
+from .settlement.settlement_draw_tests import SettlementDrawTests
+from .settlement.settlement_hunt_tests import SettlementHuntTests
+from .settlement.settlement_turn_tests import SettlementTurnTests
+from .survivor_progress_tests import SurvivorProgressTests
+from .settlement.settlement_roster_tests import SettlementRosterTests
+from .settlement.settlement_stats_tests import SettlementStatsTests
+from .settlement.settlement_resource_total_tests import SettlementResourceTotalTests
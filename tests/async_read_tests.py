@@ -0,0 +1,77 @@
+import json
+import msgpack
+from rest_framework import status
+from rest_framework.test import APITestCase
+from kingdomdeathapi.models import Player
+from rest_framework.authtoken.models import Token
+
+
+class AsyncReadTests(APITestCase):
+
+    fixtures = ['users', 'tokens', 'players', 'expansion_types', 'monsters', 'settlements', 'resource_types', 'resources',
+                'weapon_proficiencies', 'fighting_arts', 'disorders', 'abilities', 'events', 'survivors']
+
+    def setUp(self):
+        # Try to retrieve the first existing Player object
+        self.player = Player.objects.first()
+        # Create a Token for the user if it doesn't exist
+        token, created = Token.objects.get_or_create(user=self.player.user)
+        # Set the client's credentials using the Token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+        self.token = token.key
+
+    def test_async_reads_match_sync_reads(self):
+        """
+        Ensure the async reads return what the ViewSet reads do
+        """
+        for url in ["/resources", "/resources?bone=true&expansion=false", "/resources?ids=3,1,999",
+                    "/resources?bone=true&ids=1,2", "/resources?ids=x", "/resources/3", "/settlements",
+                    "/settlements/2", "/survivors", "/survivors/2", "/settlements?ids=2,1,999",
+                    "/settlements?include=survivors", "/settlements?include=nothing", "/settlements/1?include=survivors",
+                    "/survivors?ids=2,999", "/survivors?ids=x", "/abilities", "/abilities?ids=2,1",
+                    "/abilities?expansion=false", "/abilities?nowhere=true", "/disorders", "/fighting_arts",
+                    "/weapon_proficiencies", "/weapon_proficiencies?ids=1", "/events", "/events?ids=1,999"]:
+            expected = self.client.get(url)
+            response = self.client.get("/async" + url)
+            self.assertEqual(response.status_code, expected.status_code, url)
+            self.assertEqual(json.loads(response.content), json.loads(expected.content), url)
+
+    def test_async_reads_negotiate_renderer(self):
+        """
+        Ensure the async reads render with the renderer the client accepts
+        """
+        response = self.client.get("/async/resources", HTTP_ACCEPT="application/msgpack")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response["Content-Type"].startswith("application/msgpack"))
+        self.assertEqual(msgpack.unpackb(response.content), json.loads(self.client.get("/resources").content))
+
+        self.assertEqual(self.client.get("/async/resources", HTTP_ACCEPT="text/csv").status_code,
+                         status.HTTP_406_NOT_ACCEPTABLE)
+
+    async def test_async_client(self):
+        """
+        Ensure the async reads run on the async request path
+        """
+        response = await self.async_client.get("/async/survivors/1", headers={"Authorization": f"Token {self.token}"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(json.loads(response.content)["id"], 1)
+
+        response = await self.async_client.get("/async/survivors/999", headers={"Authorization": f"Token {self.token}"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_async_reads_require_token(self):
+        """
+        Ensure the async reads are authenticated and read only
+        """
+        self.assertEqual(self.client.post("/async/settlements", {}, format="json").status_code,
+                         status.HTTP_405_METHOD_NOT_ALLOWED)
+        self.client.credentials()
+        response = self.client.get("/async/settlements")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(response["WWW-Authenticate"], "Token")
+        self.assertEqual(json.loads(response.content), json.loads(self.client.get("/settlements").content))
+
+        self.client.credentials(HTTP_AUTHORIZATION="Token nope")
+        response = self.client.get("/async/abilities")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(json.loads(response.content), {"detail": "Invalid token."})
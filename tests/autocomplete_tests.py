@@ -0,0 +1,77 @@
+import json
+from rest_framework import status
+from rest_framework.test import APITestCase
+from kingdomdeathapi.models import Player, FightingArt
+from rest_framework.authtoken.models import Token
+
+
+class AutocompleteTests(APITestCase):
+
+    fixtures = ['users', 'tokens', 'players', 'expansion_types', 'monsters', 'resource_types', 'resources',
+                'weapon_proficiencies', 'fighting_arts', 'disorders', 'abilities', 'impairments']
+
+    def setUp(self):
+        # Try to retrieve the first existing Player object
+        self.player = Player.objects.first()
+        # Create a Token for the user if it doesn't exist
+        token, created = Token.objects.get_or_create(user=self.player.user)
+        # Set the client's credentials using the Token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+
+    def test_autocomplete_prefix(self):
+        """
+        Ensure every typed word matches the start of a word in the name
+        """
+        response = self.client.get("/autocomplete?kind=resource&q=perf bo")
+        json_response = json.loads(response.content)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(json_response[0]["name"], "Perfect Bone")
+        self.assertEqual(json_response[0]["distance"], 0)
+
+        response = self.client.get("/autocomplete?kind=resource&q=hide")
+        names = [suggestion["name"] for suggestion in json.loads(response.content)]
+        self.assertIn("Monster Hide", names)
+        self.assertIn("Perfect Hide", names)
+
+    def test_autocomplete_typo(self):
+        """
+        Ensure misspelled names are still suggested, ranked after exact matches
+        """
+        response = self.client.get("/autocomplete?kind=fighting_art&q=ambidextorus")
+        json_response = json.loads(response.content)
+
+        self.assertEqual(json_response[0]["name"], "Ambidextrous")
+        self.assertEqual(json_response[0]["distance"], 2)
+
+        response = self.client.get("/autocomplete?q=berserkr")
+        self.assertEqual(json.loads(response.content)[0]["name"], "Berserker")
+
+    def test_autocomplete_rebuilds_on_catalog_change(self):
+        """
+        Ensure names added to the catalog are suggested straight away
+        """
+        FightingArt.objects.create(name="Zealous Swing", effect="New", expansion_id=1)
+
+        response = self.client.get("/autocomplete?kind=fighting_art&q=zeal")
+        self.assertEqual(json.loads(response.content)[0]["name"], "Zealous Swing")
+
+    def test_autocomplete_unknown_kind(self):
+        """
+        Ensure an unknown kind is rejected
+        """
+        response = self.client.get("/autocomplete?kind=gear&q=lantern")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_autocomplete_limit(self):
+        """
+        Ensure the limit is kept between 1 and 50 and must be an integer
+        """
+        response = self.client.get("/autocomplete?q=a&limit=-1")
+        self.assertEqual(len(json.loads(response.content)), 1)
+
+        response = self.client.get("/autocomplete?q=a&limit=500")
+        self.assertEqual(json.loads(response.content), json.loads(self.client.get("/autocomplete?q=a&limit=50").content))
+
+        response = self.client.get("/autocomplete?q=a&limit=ten")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
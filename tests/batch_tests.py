@@ -0,0 +1,94 @@
+import json
+from rest_framework import status
+from rest_framework.test import APITestCase
+from kingdomdeathapi.models import Player, Settlement
+from rest_framework.authtoken.models import Token
+
+
+class BatchTests(APITestCase):
+
+    fixtures = ['users', 'tokens', 'players', 'settlements']
+
+    def setUp(self):
+        # Try to retrieve the first existing Player object
+        self.player = Player.objects.first()
+        # Create a Token for the user if it doesn't exist
+        token, created = Token.objects.get_or_create(user=self.player.user)
+        # Set the client's credentials using the Token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+
+    def test_batch_requests(self):
+        """
+        Ensure sub-requests run in order and their responses come back in order
+        """
+        data = [
+            {"method": "GET", "path": "/settlements/1"},
+            {"method": "POST", "path": "/settlements", "body": {
+                "name": "Test", "survival_limit": 2, "population": 5, "game_master": self.player.id}},
+            {"method": "GET", "path": "/settlements?ids=2,999"},
+            {"method": "GET", "path": "/nowhere"},
+        ]
+
+        response = self.client.post("/batch", data, format='json')
+        json_response = json.loads(response.content)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([sub["status"] for sub in json_response], [200, 201, 200, 404])
+        self.assertEqual(json_response[0]["body"]["name"], "Yharnam")
+        self.assertEqual(json_response[1]["body"]["name"], "Test")
+        self.assertEqual(json_response[2]["body"]["missing"], [999])
+
+    def test_atomic_batch_rolls_back(self):
+        """
+        Ensure a failing sub-request rolls back an atomic batch and skips the rest
+        """
+        count = Settlement.objects.count()
+        data = {"atomic": True, "requests": [
+            {"method": "POST", "path": "/settlements", "body": {
+                "name": "Test", "survival_limit": 2, "population": 5, "game_master": self.player.id}},
+            {"method": "DELETE", "path": "/settlements/999"},
+            {"method": "GET", "path": "/settlements/1"},
+        ]}
+
+        response = self.client.post("/batch", data, format='json')
+        json_response = json.loads(response.content)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([sub["status"] for sub in json_response], [201, 404, 424])
+        self.assertEqual(Settlement.objects.count(), count)
+
+    def test_invalid_batch(self):
+        """
+        Ensure a malformed or nested batch is rejected
+        """
+        response = self.client.post("/batch", {"requests": [{"path": "/settlements"}]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.post("/batch", [{"method": "POST", "path": "/batch", "body": []}], format='json')
+        self.assertEqual(json.loads(response.content)[0]["status"], status.HTTP_400_BAD_REQUEST)
+
+    def test_batch_failures(self):
+        """
+        Ensure a sub-request that raises is logged and answered without the error's details
+        """
+        with self.assertLogs('django.request', 'ERROR') as logs:
+            response = self.client.post("/batch", [{"method": "POST", "path": "/events", "body": {}}], format='json')
+
+        self.assertEqual(json.loads(response.content), [{"status": 500, "body": {"message": "The request failed"}}])
+        self.assertIn("KeyError", logs.output[0])
+
+    def test_batch_async_views(self):
+        """
+        Ensure async views can be batched alongside the ViewSets
+        """
+        data = [
+            {"method": "GET", "path": "/async/settlements/1"},
+            {"method": "GET", "path": "/settlements/1"},
+        ]
+
+        response = self.client.post("/batch", data, format='json')
+        json_response = json.loads(response.content)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([sub["status"] for sub in json_response], [200, 200])
+        self.assertEqual(json_response[0]["body"]["name"], "Yharnam")
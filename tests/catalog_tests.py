@@ -0,0 +1,82 @@
+import json
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.db.models import F
+from kingdomdeathapi.models import CatalogVersion, Player, Impairment
+from rest_framework.authtoken.models import Token
+
+
+class CatalogTests(APITestCase):
+
+    fixtures = ['users', 'tokens', 'players', 'expansion_types', 'monsters', 'campaign', 'resource_types', 'resources',
+                'events', 'milestone_types', 'weapon_proficiencies', 'fighting_arts', 'disorders', 'abilities',
+                'impairments']
+
+    def setUp(self):
+        # Try to retrieve the first existing Player object
+        self.player = Player.objects.first()
+        # Create a Token for the user if it doesn't exist
+        token, created = Token.objects.get_or_create(user=self.player.user)
+        # Set the client's credentials using the Token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+        cache.clear()
+
+    def test_get_catalog(self):
+        """
+        Ensure every reference table comes back in one payload
+        """
+        response = self.client.get("/catalog")
+        json_response = json.loads(response.content)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["ETag"], f'"catalog-{json_response["version"]}"')
+        self.assertEqual(len(json_response["resources"]), 78)
+        self.assertEqual(len(json_response["monsters"]), 30)
+        self.assertEqual(len(json_response["impairments"]), 23)
+        self.assertEqual(json_response["abilities"][45]["expansion"], {'id': 1, 'name': 'Dragon King'})
+        self.assertEqual(json_response["milestone_types"][0], {'id': 1, 'type': 'First Child Born'})
+
+    def test_catalog_etag(self):
+        """
+        Ensure a current ETag gets 304 Not Modified without rebuilding, and a catalog write changes the ETag
+        """
+        etag = self.client.get("/catalog")["ETag"]
+
+        # Only the catalog version and token lookups
+        with self.assertNumQueries(2):
+            response = self.client.get("/catalog", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        Impairment.objects.create(name="Test", effect="Test")
+
+        response = self.client.get("/catalog", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(json.loads(response.content)["impairments"][-1]["name"], "Test")
+
+    def test_catalog_etag_compressed(self):
+        """
+        Ensure the weak ETag of a compressed catalog still gets 304 Not Modified
+        """
+        response = self.client.get("/catalog", HTTP_ACCEPT_ENCODING="gzip")
+        etag = response["ETag"]
+        self.assertTrue(etag.startswith('W/'))
+
+        response = self.client.get("/catalog", HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_catalog_version_shared(self):
+        """
+        Ensure a catalog version bumped by another process is seen, even with this process's cache emptied
+        """
+        etag = self.client.get("/catalog")["ETag"]
+
+        # Another worker writing the catalog only moves the version in the database
+        Impairment.objects.bulk_create([Impairment(name="Test", effect="Test")])
+        CatalogVersion.objects.update(version=F('version') + 1)
+        cache.clear()
+
+        response = self.client.get("/catalog", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(json.loads(response.content)["impairments"][-1]["name"], "Test")
@@ -0,0 +1,105 @@
+import gzip
+from unittest import mock
+import brotli
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from kingdomdeathapi import middleware
+from kingdomdeathapi.models import Ability, Player
+from rest_framework.authtoken.models import Token
+
+
+class CompressionTests(APITestCase):
+
+    fixtures = ['users', 'tokens', 'players', 'settlements', 'expansion_types', 'abilities']
+
+    def setUp(self):
+        # Try to retrieve the first existing Player object
+        self.player = Player.objects.first()
+        # Create a Token for the user if it doesn't exist
+        token, created = Token.objects.get_or_create(user=self.player.user)
+        # Set the client's credentials using the Token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+        cache.clear()
+
+    def test_gzip_response(self):
+        """
+        Ensure gzip is used when it is the only accepted encoding
+        """
+        plain = self.client.get("/abilities").content
+        response = self.client.get("/abilities", HTTP_ACCEPT_ENCODING="gzip")
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response["Vary"])
+        self.assertEqual(gzip.decompress(response.content), plain)
+
+    def test_brotli_preferred(self):
+        """
+        Ensure brotli is preferred unless the client weights gzip higher
+        """
+        plain = self.client.get("/abilities").content
+        response = self.client.get("/abilities", HTTP_ACCEPT_ENCODING="gzip, deflate, br")
+
+        self.assertEqual(response["Content-Encoding"], "br")
+        self.assertEqual(brotli.decompress(response.content), plain)
+
+        response = self.client.get("/abilities", HTTP_ACCEPT_ENCODING="gzip, br;q=0.5")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+
+    def test_small_response_not_compressed(self):
+        """
+        Ensure responses below the minimum size are sent as they are
+        """
+        response = self.client.get("/settlements/1", HTTP_ACCEPT_ENCODING="gzip, br")
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    def test_catalog_compressed_once_per_version(self):
+        """
+        Ensure catalog responses are compressed once and reused until the catalog changes
+        """
+        with mock.patch('kingdomdeathapi.middleware.compress', wraps=middleware.compress) as compress:
+            first = self.client.get("/abilities", HTTP_ACCEPT_ENCODING="br").content
+            second = self.client.get("/abilities", HTTP_ACCEPT_ENCODING="br").content
+            self.assertEqual(compress.call_count, 1)
+            self.assertEqual(first, second)
+
+            ability = Ability.objects.first()
+            ability.name = "Changed"
+            ability.save()
+
+            response = self.client.get("/abilities", HTTP_ACCEPT_ENCODING="br")
+            self.assertEqual(compress.call_count, 2)
+            self.assertIn(b"Changed", brotli.decompress(response.content))
+
+    def test_catalog_cache_key(self):
+        """
+        Ensure the cache key ignores the order of the query, and a query with unknown parameters is not cached
+        """
+        with mock.patch('kingdomdeathapi.middleware.compress', wraps=middleware.compress) as compress:
+            first = self.client.get("/abilities?expansion=true&format=json", HTTP_ACCEPT_ENCODING="br")
+            second = self.client.get("/abilities?format=json&expansion=true", HTTP_ACCEPT_ENCODING="br")
+            self.assertEqual(compress.call_count, 1)
+            self.assertEqual(first.content, second.content)
+
+            for _ in range(2):
+                response = self.client.get("/abilities?anything=1", HTTP_ACCEPT_ENCODING="br")
+                self.assertEqual(response["Content-Encoding"], "br")
+            self.assertEqual(compress.call_count, 3)
+            self.assertFalse(compress.call_args.kwargs["best"])
+
+    def test_catalog_version_read_once(self):
+        """
+        Ensure a catalog request reads the catalog version once, however many times it is asked for
+        """
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get("/abilities?gorm_exp=false", HTTP_ACCEPT_ENCODING="br")
+        self.assertEqual(len([query for query in queries if "catalogversion" in query["sql"]]), 1)
+
+    def test_cookie_requests_not_compressed(self):
+        """
+        Ensure responses tied to cookies are not compressed, as BREACH could read their secrets
+        """
+        self.client.cookies["sessionid"] = "session"
+        response = self.client.get("/abilities", HTTP_ACCEPT_ENCODING="gzip, br")
+        self.assertFalse(response.has_header("Content-Encoding"))
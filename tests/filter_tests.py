@@ -0,0 +1,61 @@
+import json
+from rest_framework import status
+from rest_framework.test import APITestCase
+from kingdomdeathapi.models import Player, ExpansionType, FightingArt
+from rest_framework.authtoken.models import Token
+
+
+class FilterTests(APITestCase):
+
+    fixtures = ['users', 'tokens', 'players', 'expansion_types', 'monsters', 'resource_types', 'resources',
+                'weapon_proficiencies', 'fighting_arts', 'disorders', 'abilities']
+
+    def setUp(self):
+        # Try to retrieve the first existing Player object
+        self.player = Player.objects.first()
+        # Create a Token for the user if it doesn't exist
+        token, created = Token.objects.get_or_create(user=self.player.user)
+        # Set the client's credentials using the Token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+
+    def test_expansion_flags(self):
+        """
+        Ensure the per expansion flags keep their names and meaning
+        """
+        response = self.client.get("/fighting_arts?gamblers_chest_exp=true")
+        json_response = json.loads(response.content)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(json_response), 3)
+        for fighting_art in json_response:
+            self.assertEqual(fighting_art["expansion"]["id"], 12)
+
+        response = self.client.get("/fighting_arts?expansion=true&gamblers_chest_exp=false")
+        for fighting_art in json.loads(response.content):
+            self.assertNotIn(fighting_art["expansion"], [None, {"id": 12, "name": "Gambler's Chest"}])
+
+    def test_multiple_expansions(self):
+        """
+        Ensure ?expansion= accepts a list of expansion slugs and keeps cards from any of them
+        """
+        response = self.client.get("/disorders?expansion=lion_god,sunstalker")
+        json_response = json.loads(response.content)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual({disorder["expansion"]["id"] for disorder in json_response}, {5, 11})
+
+        response = self.client.get("/disorders?expansion=gorm,crimson_crocodile")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_new_expansion_is_filterable(self):
+        """
+        Ensure an expansion added to the database can be filtered on without a code change
+        """
+        expansion = ExpansionType.objects.create(name="Frogdog")
+        FightingArt.objects.create(name="Leap", effect="Leap", expansion=expansion)
+
+        response = self.client.get("/fighting_arts?frogdog_exp=true")
+        self.assertEqual([art["name"] for art in json.loads(response.content)], ["Leap"])
+
+        response = self.client.get("/fighting_arts?expansion=frogdog")
+        self.assertEqual([art["name"] for art in json.loads(response.content)], ["Leap"])
@@ -0,0 +1,52 @@
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+from django.test import override_settings
+from kingdomdeathapi.models import Player, Resource, Survivor, SettlementInventory
+from kingdomdeathapi.views.resource import ResourceSerializer, ResourceFlatSerializer
+from kingdomdeathapi.views.survivor import SurvivorSerializer, SurvivorFlatSerializer
+from kingdomdeathapi.views.settlement_inventory import SettlementInventorySerializer, SettlementInventoryFlatSerializer
+from rest_framework.authtoken.models import Token
+
+
+class FlatSerializerTests(APITestCase):
+
+    fixtures = ['users', 'tokens', 'players', 'expansion_types', 'monsters', 'settlements', 'resource_types', 'resources',
+                'weapon_proficiencies', 'fighting_arts', 'disorders', 'abilities', 'survivors', 'settlement_inventories']
+
+    def setUp(self):
+        # Try to retrieve the first existing Player object
+        self.player = Player.objects.first()
+        # Create a Token for the user if it doesn't exist
+        token, created = Token.objects.get_or_create(user=self.player.user)
+        # Set the client's credentials using the Token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+
+    def assertSameBytes(self, serializer, flat_serializer, queryset):
+        renderer = JSONRenderer()
+        expected = renderer.render(serializer(queryset.order_by('pk'), many=True).data)
+        self.assertEqual(renderer.render(flat_serializer(queryset).data), expected)
+
+    def test_flat_serializers_match_model_serializers(self):
+        """
+        Ensure the flat serializers render byte for byte what the model serializers do
+        """
+        self.assertSameBytes(ResourceSerializer, ResourceFlatSerializer, Resource.objects.all())
+        self.assertSameBytes(SurvivorSerializer, SurvivorFlatSerializer, Survivor.objects.all())
+        self.assertSameBytes(SettlementInventorySerializer, SettlementInventoryFlatSerializer, SettlementInventory.objects.all())
+
+    def test_flat_serializer_follows_filters(self):
+        """
+        Ensure filtered lists match on both paths
+        """
+        for url in ["/resources?bone=true&consumable=false", "/settlement_inventories?settlement=2", "/survivors"]:
+            with override_settings(FAST_SERIALIZATION=False):
+                expected = self.client.get(url).content
+            with override_settings(FAST_SERIALIZATION=True):
+                self.assertEqual(self.client.get(url).content, expected)
+
+    def test_flat_serializer_queries(self):
+        """
+        Ensure a flat list costs one query plus one per many to many relation
+        """
+        with self.assertNumQueries(5):
+            SurvivorFlatSerializer(Survivor.objects.all()).data
@@ -0,0 +1,52 @@
+import json
+from rest_framework import status
+from rest_framework.test import APITestCase
+from kingdomdeathapi.models import Player
+from rest_framework.authtoken.models import Token
+
+
+class IdsTests(APITestCase):
+
+    fixtures = ['users', 'tokens', 'players', 'expansion_types', 'abilities', 'settlements']
+
+    def setUp(self):
+        # Try to retrieve the first existing Player object
+        self.player = Player.objects.first()
+        # Create a Token for the user if it doesn't exist
+        token, created = Token.objects.get_or_create(user=self.player.user)
+        # Set the client's credentials using the Token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+
+    def test_list_abilities_by_ids(self):
+        """
+        Ensure we can get several abilities by id in request order with one query
+        """
+        # Token, catalog version, then abilities joined with their expansion
+        with self.assertNumQueries(3):
+            response = self.client.get("/abilities?ids=46,3,999,1,3")
+
+        json_response = json.loads(response.content)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([ability["id"] for ability in json_response["results"]], [46, 3, 1])
+        self.assertEqual(json_response["results"][0]["expansion"], {'id': 1, 'name': 'Dragon King'})
+        self.assertEqual(json_response["missing"], [999])
+
+    def test_list_settlements_by_ids(self):
+        """
+        Ensure ids work together with includes
+        """
+        response = self.client.get("/settlements?ids=2,1&include=in_session")
+        json_response = json.loads(response.content)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([settlement["id"] for settlement in json_response["results"]], [2, 1])
+        self.assertEqual(json_response["results"][0]["in_session"], [])
+        self.assertEqual(json_response["missing"], [])
+
+    def test_list_by_invalid_ids(self):
+        """
+        Ensure ids that are not integers are rejected
+        """
+        response = self.client.get("/abilities?ids=1,two")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
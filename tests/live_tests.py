@@ -0,0 +1,127 @@
+import asyncio
+import json
+import threading
+from asgiref.sync import sync_to_async
+from asgiref.testing import ApplicationCommunicator
+from rest_framework.test import APITestCase
+from kingdomdeathapi.models import Player, Settlement, Survivor
+from kingdomdeathapi.utils import RESYNC, Broker, broker
+from kingdomdeathapi.websocket import session_channel
+from rest_framework.authtoken.models import Token
+
+
+class LiveSessionTests(APITestCase):
+
+    fixtures = ['users', 'tokens', 'players', 'settlements', 'sessions', 'expansion_types', 'weapon_proficiencies',
+                'fighting_arts', 'disorders', 'abilities', 'survivors']
+
+    def setUp(self):
+        # Try to retrieve the first existing Player object
+        self.player = Player.objects.first()
+        # Create a Token for the user if it doesn't exist
+        token, created = Token.objects.get_or_create(user=self.player.user)
+        # Set the client's credentials using the Token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+        self.token = token.key
+
+    def connect(self, path, token, **scope):
+        return ApplicationCommunicator(session_channel, {
+            'type': 'websocket', 'path': path, 'query_string': b'', 'headers': [], 'subprotocols': ['token', token], **scope})
+
+    async def test_broker_delivers_across_threads(self):
+        """
+        Ensure messages published from another thread reach subscribers, and slow subscribers are told to resync
+        """
+        local_broker = Broker(max_queued=2)
+        subscription = local_broker.subscribe(['settlement:1'])
+
+        thread = threading.Thread(target=local_broker.publish, args=('settlement:1', {'id': 1}))
+        thread.start()
+        thread.join()
+        self.assertEqual(await subscription.get(), {'id': 1})
+
+        for pk in range(3):
+            local_broker.publish('settlement:1', {'id': pk})
+        # Let the event loop run the deliveries
+        await asyncio.sleep(0)
+        self.assertEqual(await subscription.get(), RESYNC)
+        local_broker.publish('settlement:1', {'id': 3})
+        self.assertEqual(await subscription.get(), {'id': 3})
+
+        local_broker.unsubscribe(subscription)
+        self.assertFalse(local_broker.has_subscribers('settlement:1'))
+
+    def test_changes_published_on_commit(self):
+        """
+        Ensure writes publish change events once committed, and cost nothing without subscribers
+        """
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.client.put("/settlements/1", {"name": "Lanternfall", "survival_limit": 3, "population": 9, "game_master": {"id": 1}}, format="json")
+        self.assertEqual(callbacks, [])
+
+        messages = []
+        broker.publish = lambda topic, message: messages.append((topic, message))
+        broker._topics['settlement:1'] = set()
+        try:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.client.put("/settlements/1", {"name": "Lanternfall", "survival_limit": 3, "population": 9, "game_master": {"id": 1}}, format="json")
+        finally:
+            del broker.publish
+            del broker._topics['settlement:1']
+
+        self.assertEqual(messages, [('settlement:1', {'model': 'settlement', 'id': 1, 'op': 'save'})])
+
+    async def test_live_session(self):
+        """
+        Ensure session participants receive changes to the settlement and to the participants' survivors
+        """
+        communicator = self.connect("/sessions/1/live", self.token)
+        await communicator.send_input({'type': 'websocket.connect'})
+        self.assertEqual(await communicator.receive_output(), {'type': 'websocket.accept', 'subprotocol': 'token'})
+
+        survivor = await Survivor.objects.filter(user_id=2).afirst()
+
+        def write():
+            with self.captureOnCommitCallbacks(execute=True):
+                Settlement.objects.get(pk=1).save()
+                survivor.save()
+        await sync_to_async(write)()
+
+        frame = await communicator.receive_output()
+        self.assertEqual(json.loads(frame['text']), {'model': 'settlement', 'id': 1, 'op': 'save'})
+        frame = await communicator.receive_output()
+        self.assertEqual(json.loads(frame['text']), {'model': 'survivor', 'id': survivor.pk, 'op': 'save'})
+
+        await communicator.send_input({'type': 'websocket.disconnect', 'code': 1000})
+        await communicator.wait()
+        self.assertFalse(broker.has_subscribers('settlement:1'))
+
+    async def test_live_session_rejected(self):
+        """
+        Ensure connections without a valid token, or from players outside the session, are closed
+        """
+        communicator = self.connect("/sessions/1/live", "invalid")
+        await communicator.send_input({'type': 'websocket.connect'})
+        self.assertEqual(await communicator.receive_output(), {'type': 'websocket.close', 'code': 4401})
+
+        token = await Token.objects.aget(user_id=2)
+        communicator = self.connect("/sessions/3/live", token.key)
+        await communicator.send_input({'type': 'websocket.connect'})
+        self.assertEqual(await communicator.receive_output(), {'type': 'websocket.close', 'code': 4403})
+
+        # Tokens in the URL end up in logs, so they are not accepted
+        communicator = self.connect("/sessions/1/live", None, subprotocols=[], query_string=f'token={self.token}'.encode())
+        await communicator.send_input({'type': 'websocket.connect'})
+        self.assertEqual(await communicator.receive_output(), {'type': 'websocket.close', 'code': 4401})
+
+    async def test_live_session_authorization_header(self):
+        """
+        Ensure clients that can set headers may send their token in an Authorization header
+        """
+        communicator = self.connect("/sessions/1/live", None, subprotocols=[],
+                                    headers=[(b'authorization', f'Token {self.token}'.encode())])
+        await communicator.send_input({'type': 'websocket.connect'})
+        self.assertEqual(await communicator.receive_output(), {'type': 'websocket.accept'})
+
+        await communicator.send_input({'type': 'websocket.disconnect', 'code': 1000})
+        await communicator.wait()
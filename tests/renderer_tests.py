@@ -0,0 +1,97 @@
+import datetime
+import json
+from decimal import Decimal
+from io import BytesIO
+from unittest import mock
+import msgpack
+from django.test import SimpleTestCase
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+from rest_framework.utils.serializer_helpers import ReturnList
+from kingdomdeathapi.models import Player
+from kingdomdeathapi.parsers import FastJSONParser, MessagePackParser
+from kingdomdeathapi.renderers import FastJSONRenderer, MessagePackRenderer
+
+
+class RendererTests(SimpleTestCase):
+
+    data = ReturnList([
+        {"id": 1, "name": "Lion Claw\u2028\u00e9", "type": [{"id": 2, "name": "Bone"}], "amount": Decimal("1.5"),
+         "created": datetime.datetime(2024, 3, 29, 6, 2, 1, 123456, tzinfo=datetime.timezone.utc), "expansion": None},
+        {"id": 2, "consumable": True, "effect": ("a", "b")},
+    ], serializer=None)
+
+    def test_render_matches_json_renderer(self):
+        """
+        Ensure the fast renderer produces the same bytes as DRF's renderer
+        """
+        self.assertEqual(FastJSONRenderer().render(self.data), JSONRenderer().render(self.data))
+
+    def test_render_falls_back(self):
+        """
+        Ensure data orjson cannot encode is rendered by DRF's renderer
+        """
+        data = {"id": 2 ** 70, "name": "Lion Claw"}
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_render_without_orjson(self):
+        """
+        Ensure the renderer and parser fall back to the standard library
+        """
+        with mock.patch('kingdomdeathapi.renderers.orjson', None), mock.patch('kingdomdeathapi.parsers.orjson', None):
+            rendered = FastJSONRenderer().render(self.data)
+            self.assertEqual(rendered, JSONRenderer().render(self.data))
+            self.assertEqual(FastJSONParser().parse(BytesIO(rendered)), JSONParser().parse(BytesIO(rendered)))
+
+    def test_parse(self):
+        """
+        Ensure the fast parser reads what the renderer writes and rejects malformed bodies
+        """
+        rendered = JSONRenderer().render(self.data)
+        self.assertEqual(FastJSONParser().parse(BytesIO(rendered)), JSONParser().parse(BytesIO(rendered)))
+
+        with self.assertRaises(ParseError):
+            FastJSONParser().parse(BytesIO(b'{"name": '))
+
+
+class MessagePackTests(APITestCase):
+
+    fixtures = ['users', 'tokens', 'players', 'settlements']
+
+    def setUp(self):
+        # Try to retrieve the first existing Player object
+        self.player = Player.objects.first()
+        # Create a Token for the user if it doesn't exist
+        token, created = Token.objects.get_or_create(user=self.player.user)
+        # Set the client's credentials using the Token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+
+    def test_round_trip(self):
+        """
+        Ensure MessagePack payloads have the same structure as JSON ones
+        """
+        packed = MessagePackRenderer().render(RendererTests.data)
+        self.assertEqual(MessagePackParser().parse(BytesIO(packed)), json.loads(JSONRenderer().render(RendererTests.data)))
+
+        with self.assertRaises(ParseError):
+            MessagePackParser().parse(BytesIO(packed[:-3]))
+
+    def test_negotiate_msgpack(self):
+        """
+        Ensure the Accept and Content-Type headers select MessagePack
+        """
+        expected = json.loads(self.client.get("/settlements").content)
+
+        response = self.client.get("/settlements", HTTP_ACCEPT="application/msgpack")
+        self.assertEqual(response["Content-Type"], "application/msgpack")
+        self.assertEqual(msgpack.unpackb(response.content), expected)
+
+        data = {"name": "Test", "survival_limit": 2, "population": 5, "game_master": self.player.id}
+        response = self.client.post("/settlements", msgpack.packb(data), content_type="application/msgpack",
+                                    HTTP_ACCEPT="application/msgpack")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(msgpack.unpackb(response.content)["name"], "Test")
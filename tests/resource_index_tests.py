@@ -0,0 +1,71 @@
+import json
+from django.db.models import F
+from rest_framework.test import APITestCase
+from kingdomdeathapi.models import CatalogVersion, Player, Resource
+from kingdomdeathapi.views.resource import ResourceSerializer, resource_filters, resource_index
+from kingdomdeathapi.utils import apply_filters
+from django.http import QueryDict
+from rest_framework.authtoken.models import Token
+
+
+class ResourceIndexTests(APITestCase):
+
+    fixtures = ['users', 'tokens', 'players', 'expansion_types', 'monsters', 'resource_types', 'resources']
+
+    def setUp(self):
+        # Try to retrieve the first existing Player object
+        self.player = Player.objects.first()
+        # Create a Token for the user if it doesn't exist
+        token, created = Token.objects.get_or_create(user=self.player.user)
+        # Set the client's credentials using the Token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+
+    def test_index_matches_database(self):
+        """
+        Ensure every filter combination selects the same resources as the equivalent query
+        """
+        for query in ["", "bone=true", "hide=false&organ=false", "bone=true&consumable=false", "strange=true",
+                      "monster=true&white_lion=false", "white_lion=true&hide=true", "gorm_exp=true",
+                      "expansion=true&sunstalker_exp=false", "expansion=false&indomitable=false",
+                      "expansion=gorm,sunstalker", "expansion=gorm&gorm_exp=false", "phoenix=true&white_lion=true"]:
+            filters = resource_filters(QueryDict(query))
+            expected = ResourceSerializer(apply_filters(Resource.objects.order_by('id'), filters), many=True).data
+            self.assertEqual(json.loads(json.dumps(resource_index().select(filters))), json.loads(json.dumps(expected)), query)
+
+    def test_list_from_index(self):
+        """
+        Ensure a resource list is served from the index without querying resources
+        """
+        self.client.get("/resources?bone=true")
+
+        # Token and catalog version only
+        with self.assertNumQueries(2):
+            response = self.client.get("/resources?bone=true&monster=true")
+
+        names = [resource["name"] for resource in json.loads(response.content)]
+        self.assertIn("Shank Bone", names)
+        self.assertNotIn("Monster Bone", names)
+
+    def test_index_rebuilds_on_catalog_change(self):
+        """
+        Ensure resources written after the index was built are listed
+        """
+        self.client.get("/resources")
+        Resource.objects.filter(pk=1).update(name="Renamed")
+        Resource.objects.get(pk=2).save()
+
+        response = self.client.get("/resources?hide=true")
+        self.assertEqual(json.loads(response.content)[0]["name"], "Renamed")
+
+    def test_index_rebuilds_on_other_process_change(self):
+        """
+        Ensure an index built by this process is rebuilt when another process writes the catalog
+        """
+        self.client.get("/resources")
+
+        # Another worker's write leaves this process's signals out and only moves the version in the database
+        Resource.objects.filter(pk=1).update(name="Renamed")
+        CatalogVersion.objects.update(version=F('version') + 1)
+
+        response = self.client.get("/resources")
+        self.assertEqual(json.loads(response.content)[0]["name"], "Renamed")
@@ -0,0 +1,91 @@
+import json
+from rest_framework import status
+from rest_framework.test import APITestCase
+from kingdomdeathapi.models import Player, Disorder, Impairment
+from rest_framework.authtoken.models import Token
+
+
+class SearchTests(APITestCase):
+
+    fixtures = ['users', 'tokens', 'players', 'expansion_types', 'monsters', 'resource_types', 'resources',
+                'weapon_proficiencies', 'fighting_arts', 'disorders', 'abilities', 'impairments']
+
+    def setUp(self):
+        # Try to retrieve the first existing Player object
+        self.player = Player.objects.first()
+        # Create a Token for the user if it doesn't exist
+        token, created = Token.objects.get_or_create(user=self.player.user)
+        # Set the client's credentials using the Token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+
+    def test_search(self):
+        """
+        Ensure loaded fixtures are searchable and matches are highlighted
+        """
+        response = self.client.get("/search?q=depart with scyth")
+        json_response = json.loads(response.content)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(json_response[0]["kind"], "disorder")
+        self.assertEqual(json_response[0]["name"], "Aichmophobia")
+        self.assertIn("<mark>scythes</mark>", json_response[0]["snippet"])
+
+    def test_search_ranks_names_first(self):
+        """
+        Ensure a match in the name ranks above matches in card text, and kinds can be filtered
+        """
+        response = self.client.get("/search?q=acid&kind=ability")
+        json_response = json.loads(response.content)
+
+        self.assertEqual(json_response[0]["name"], "Acid Palms")
+        self.assertEqual(json_response[0]["highlight"], "<mark>Acid</mark> Palms")
+        self.assertTrue(all(result["kind"] == "ability" for result in json_response))
+
+        response = self.client.get("/search?q=acid&kind=spell")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_search_follows_writes(self):
+        """
+        Ensure created, changed and deleted cards are reflected in the index
+        """
+        impairment = Impairment.objects.create(name="Frostbite", effect="Lose a finger to the cold.")
+        response = self.client.get("/search?q=frostbite")
+        self.assertEqual([result["id"] for result in json.loads(response.content)], [impairment.id])
+
+        disorder = Disorder.objects.get(name="Aichmophobia")
+        disorder.effect = "Pointy things."
+        disorder.save()
+        response = self.client.get("/search?q=scythes&kind=disorder")
+        self.assertEqual(json.loads(response.content), [])
+
+        impairment.delete()
+        response = self.client.get("/search?q=frostbite")
+        self.assertEqual(json.loads(response.content), [])
+
+    def test_search_escapes_card_text(self):
+        """
+        Ensure card text is escaped in highlights and snippets, so only the match marks are markup
+        """
+        Impairment.objects.create(name="<b>Frostbite</b>", effect="<script>alert('frostbite')</script>")
+        result = json.loads(self.client.get("/search?q=frostbite").content)[0]
+
+        self.assertEqual(result["name"], "<b>Frostbite</b>")
+        self.assertEqual(result["highlight"], "&lt;b&gt;<mark>Frostbite</mark>&lt;/b&gt;")
+        self.assertEqual(result["snippet"], "&lt;script&gt;alert(&#x27;<mark>frostbite</mark>&#x27;)&lt;/script&gt;")
+
+    def test_search_operators_are_literal(self):
+        """
+        Ensure FTS5 syntax in the query is treated as words
+        """
+        response = self.client.get('/search?q=" OR NEAR(')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_search_limit(self):
+        """
+        Ensure the limit is kept between 1 and 100
+        """
+        response = self.client.get("/search?q=the&limit=-1")
+        self.assertEqual(len(json.loads(response.content)), 1)
+
+        response = self.client.get("/search?q=the&limit=1000")
+        self.assertEqual(len(json.loads(response.content)), 100)
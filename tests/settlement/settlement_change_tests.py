@@ -0,0 +1,141 @@
+import json
+from io import StringIO
+from django.core.management import call_command
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.test import APITestCase
+from kingdomdeathapi.models import Player, Settlement, SettlementChange, SettlementInventory, Survivor
+from rest_framework.authtoken.models import Token
+
+
+class SettlementChangeTests(APITestCase):
+
+    fixtures = ['users', 'tokens', 'players', 'expansion_types', 'monsters', 'settlements', 'resource_types', 'resources',
+                'weapon_proficiencies', 'fighting_arts', 'disorders', 'abilities', 'survivors', 'settlement_inventories',
+                'sessions']
+
+    def setUp(self):
+        # Try to retrieve the first existing Player object
+        self.player = Player.objects.first()
+        # Create a Token for the user if it doesn't exist
+        token, created = Token.objects.get_or_create(user=self.player.user)
+        # Set the client's credentials using the Token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+
+    def test_writes_move_version_on(self):
+        """
+        Ensure every write to a settlement's data moves its version on and is listed once with its latest change
+        """
+        inventory = SettlementInventory.objects.get(pk=10)
+        inventory.amount = 4
+        inventory.save()
+        since = Settlement.objects.get(pk=2).version
+
+        inventory.amount = 5
+        inventory.save()
+        inventory.amount = 6
+        inventory.save()
+        self.client.put("/settlements/2", {"name": "Rocksville", "survival_limit": 3, "population": 9,
+                                            "game_master": {"id": 1}}, format="json")
+
+        response = self.client.get(f"/settlements/2/changes?since={since}")
+        json_response = json.loads(response.content)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(json_response["version"], since + 3)
+        self.assertEqual(json_response["changes"], [
+            {"model": "settlement_inventory", "id": 10, "op": "save", "version": since + 2},
+            {"model": "settlement", "id": 2, "op": "save", "version": since + 3},
+        ])
+
+        response = self.client.get(f"/settlements/2/changes?since={since + 3}")
+        self.assertEqual(json.loads(response.content)["changes"], [])
+
+    def test_created_settlement_version(self):
+        """
+        Ensure a created settlement is served with the version it has, and saving it again moves that on
+        """
+        response = self.client.post("/settlements", {"name": "Test", "survival_limit": 2, "population": 5,
+                                                     "game_master": self.player.id}, format="json")
+        json_response = json.loads(response.content)
+        settlement = Settlement.objects.get(pk=json_response["id"])
+
+        self.assertEqual(json_response["version"], settlement.version)
+
+        settlement.save()
+        self.assertEqual(settlement.version, Settlement.objects.get(pk=settlement.pk).version)
+        self.assertEqual(settlement.version, json_response["version"] + 1)
+
+    def test_stale_copies_keep_version(self):
+        """
+        Ensure saving copies of a settlement loaded before each other's saves never writes an old version back
+        """
+        first = Settlement.objects.get(pk=1)
+        second = Settlement.objects.get(pk=1)
+        version = first.version
+
+        second.save()
+        first.name = "Renamed"
+        first.save()
+
+        settlement = Settlement.objects.get(pk=1)
+        self.assertEqual(settlement.version, version + 2)
+        self.assertEqual(settlement.name, "Renamed")
+        self.assertEqual(list(SettlementChange.objects.filter(settlement_id=1, version__gt=version)
+                              .order_by('version').values_list('version', flat=True)), [version + 1, version + 2])
+
+    @override_settings(MAX_SETTLEMENT_CHANGES=150)
+    def test_changes_are_pruned(self):
+        """
+        Ensure only the latest changes are kept, and clients holding an older version are told to fetch again
+        """
+        settlement = Settlement.objects.get(pk=2)
+        for _ in range(250):
+            settlement.save()
+        version = Settlement.objects.get(pk=2).version
+
+        kept = SettlementChange.objects.filter(settlement_id=2)
+        self.assertLessEqual(kept.count(), 150 + 100)
+        self.assertGreater(min(kept.values_list('version', flat=True)), version - 250)
+        self.assertEqual(self.client.get(f"/settlements/2/changes?since={version - 200}").status_code, status.HTTP_410_GONE)
+        self.assertEqual(self.client.get(f"/settlements/2/changes?since={version - 100}").status_code, status.HTTP_200_OK)
+
+        call_command('prune_settlement_changes', stdout=StringIO())
+        self.assertEqual(kept.count(), 150)
+
+    def test_deletes_are_listed(self):
+        """
+        Ensure deleted objects are listed so clients can drop them
+        """
+        since = Settlement.objects.get(pk=2).version
+        SettlementInventory.objects.get(pk=10).delete()
+
+        response = self.client.get(f"/settlements/2/changes?since={since}")
+        self.assertEqual(json.loads(response.content)["changes"],
+                         [{"model": "settlement_inventory", "id": 10, "op": "delete", "version": since + 1}])
+
+    def test_survivor_changes(self):
+        """
+        Ensure a survivor's changes are recorded for every settlement its player has a session in
+        """
+        SettlementChange.objects.all().delete()
+        Survivor.objects.get(pk=7).save()
+
+        self.assertEqual(list(SettlementChange.objects.order_by("settlement_id").values_list("settlement_id", "model", "object_id")),
+                         [(2, "survivor", 7), (8, "survivor", 7)])
+
+    def test_deleted_settlement_drops_changes(self):
+        """
+        Ensure a deleted settlement's change log goes with it, including changes from its cascaded rows
+        """
+        SettlementInventory.objects.get(pk=10).save()
+        self.client.delete("/settlements/2")
+
+        self.assertFalse(SettlementChange.objects.filter(settlement_id=2).exists())
+
+    def test_changes_invalid(self):
+        """
+        Ensure a version that is not an integer or a missing settlement is rejected
+        """
+        self.assertEqual(self.client.get("/settlements/2/changes?since=x").status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get("/settlements/999/changes").status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,91 @@
+import json
+import math
+import random
+from collections import Counter
+from rest_framework import status
+from rest_framework.test import APITestCase
+from kingdomdeathapi.models import Player, Settlement, SettlementChange, SettlementEvent
+from kingdomdeathapi.utils import AliasTable
+from rest_framework.authtoken.models import Token
+
+
+class SettlementDrawTests(APITestCase):
+
+    fixtures = ['users', 'tokens', 'players', 'expansion_types', 'campaign', 'events', 'settlements', 'settlement_events']
+
+    def setUp(self):
+        # Try to retrieve the first existing Player object
+        self.player = Player.objects.first()
+        # Create a Token for the user if it doesn't exist
+        token, created = Token.objects.get_or_create(user=self.player.user)
+        # Set the client's credentials using the Token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+
+    def test_alias_table(self):
+        """
+        Ensure alias table draws follow the weights and unique draws never repeat
+        """
+        table = AliasTable(['a', 'b', 'c', 'd'], [1, 2, 7, 0])
+        counts = Counter(table.sample(20000, random.Random(1)))
+
+        self.assertNotIn('d', counts)
+        self.assertAlmostEqual(counts['a'] / 20000, 0.1, delta=0.02)
+        self.assertAlmostEqual(counts['c'] / 20000, 0.7, delta=0.02)
+        self.assertEqual(sorted(table.sample_unique(5, random.Random(2), {'a': 1, 'b': 2, 'c': 7})), ['a', 'b', 'c'])
+
+        # Huge weights are kept relative to each other, and weights that are not finite are refused
+        table = AliasTable(['a', 'b'], [1e308, 1e308])
+        self.assertAlmostEqual(Counter(table.sample(20000, random.Random(1)))['a'] / 20000, 0.5, delta=0.02)
+        for weight in (math.inf, math.nan):
+            with self.assertRaises(ValueError):
+                AliasTable(['a', 'b'], [1, weight])
+
+    def test_draw_events(self):
+        """
+        Ensure drawn events leave out the timeline, are saved in bulk and recorded in the change log
+        """
+        version = Settlement.objects.get(pk=1).version
+        response = self.client.post("/settlements/1/draw_events", {"count": 6, "seed": 4}, format="json")
+        json_response = json.loads(response.content)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        drawn = [entry['event']['id'] for entry in json_response['events']]
+        # Settlement 1 has drawn First Day and Glossolalia, which leaves 6 events
+        self.assertEqual(sorted(drawn), [1, 2, 3, 4, 5, 6])
+        self.assertTrue(all(entry['year'] == 11 for entry in json_response['events']))
+        self.assertEqual(json_response['version'], version + 6)
+        self.assertEqual(SettlementEvent.objects.filter(settlement=1).count(), 8)
+        self.assertEqual(SettlementChange.objects.filter(settlement=1, model='settlement_event', version__gt=version).count(), 6)
+
+        response = self.client.post("/settlements/1/draw_events", {"count": 2}, format="json")
+        self.assertEqual(json.loads(response.content)['events'], [])
+
+    def test_draw_events_weighted(self):
+        """
+        Ensure weights of 0 leave events out, and unsaved draws do not touch the timeline
+        """
+        weights = {str(event): 0 for event in range(1, 9) if event != 3}
+        response = self.client.post("/settlements/2/draw_events?story=false",
+                                    {"weights": weights, "save": False, "repeat": True}, format="json")
+        json_response = json.loads(response.content)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([entry['event']['name'] for entry in json_response['events']], ['Cracks In The Ground'])
+        self.assertIsNone(json_response['events'][0]['id'])
+        self.assertEqual(SettlementEvent.objects.filter(settlement=2).count(), 1)
+
+    def test_draw_events_invalid(self):
+        """
+        Ensure invalid draws and missing settlements are rejected
+        """
+        self.assertEqual(self.client.post("/settlements/1/draw_events", {"count": 50}, format="json").status_code,
+                         status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.post("/settlements/1/draw_events", {"weights": {"1": -1}}, format="json").status_code,
+                         status.HTTP_400_BAD_REQUEST)
+        for weight in ("inf", "-inf", "nan"):
+            self.assertEqual(self.client.post("/settlements/1/draw_events", {"weights": {"1": weight}}, format="json").status_code,
+                             status.HTTP_400_BAD_REQUEST, weight)
+        self.assertEqual(self.client.post("/settlements/1/draw_events?expansion=nowhere", {}, format="json").status_code,
+                         status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.post("/settlements/999/draw_events", {}, format="json").status_code,
+                         status.HTTP_404_NOT_FOUND)
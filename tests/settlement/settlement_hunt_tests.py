@@ -0,0 +1,68 @@
+import json
+from rest_framework import status
+from rest_framework.test import APITestCase
+from kingdomdeathapi.models import Player, Settlement, SettlementChange, SettlementInventory
+from rest_framework.authtoken.models import Token
+
+
+class SettlementHuntTests(APITestCase):
+
+    fixtures = ['users', 'tokens', 'players', 'expansion_types', 'monsters', 'settlements', 'resource_types', 'resources',
+                'settlement_inventories']
+
+    def setUp(self):
+        # Try to retrieve the first existing Player object
+        self.player = Player.objects.first()
+        # Create a Token for the user if it doesn't exist
+        token, created = Token.objects.get_or_create(user=self.player.user)
+        # Set the client's credentials using the Token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+
+    def test_hunt_rewards(self):
+        """
+        Ensure drops are merged and added to the rows the settlement holds, or to new rows, in one batch
+        """
+        SettlementInventory.objects.create(settlement_id=1, resource_id=31, amount=2)
+        version = Settlement.objects.get(pk=1).version
+        # Only Sinew and White Fur can drop
+        weights = {str(resource): 0 for resource in range(22, 30)}
+
+        response = self.client.post("/settlements/1/hunt_rewards", {"monster": 1, "count": 10, "weights": weights, "seed": 2},
+                                    format="json")
+        json_response = json.loads(response.content)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        drops = {drop['resource']['name']: drop['amount'] for drop in json_response['drops']}
+        self.assertEqual(set(drops), {'Sinew', 'White Fur'})
+        self.assertEqual(sum(drops.values()), 10)
+        self.assertEqual(SettlementInventory.objects.get(settlement=1, resource=31).amount, 2 + drops['White Fur'])
+        self.assertEqual(SettlementInventory.objects.get(settlement=1, resource=30).amount, drops['Sinew'])
+        self.assertEqual(json_response['version'], version + 2)
+        self.assertEqual(SettlementChange.objects.filter(settlement=1, version__gt=version).count(), 2)
+
+    def test_hunt_rewards_unsaved(self):
+        """
+        Ensure unsaved rewards leave the inventory alone
+        """
+        response = self.client.post("/settlements/2/hunt_rewards", {"monster": 1, "count": 3, "save": False}, format="json")
+        json_response = json.loads(response.content)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(sum(drop['amount'] for drop in json_response['drops']), 3)
+        self.assertEqual(json_response['inventory'], [])
+        self.assertEqual(SettlementInventory.objects.filter(settlement=2).count(), 1)
+
+    def test_hunt_rewards_invalid(self):
+        """
+        Ensure invalid rewards, missing settlements and missing monsters are rejected
+        """
+        self.assertEqual(self.client.post("/settlements/1/hunt_rewards", {"count": 3}, format="json").status_code,
+                         status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.post("/settlements/1/hunt_rewards", {"monster": 1, "count": 0}, format="json").status_code,
+                         status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.post("/settlements/1/hunt_rewards", {"monster": 1, "weights": {"22": "nan"}},
+                                          format="json").status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.post("/settlements/999/hunt_rewards", {"monster": 1}, format="json").status_code,
+                         status.HTTP_404_NOT_FOUND)
+        self.assertEqual(self.client.post("/settlements/1/hunt_rewards", {"monster": 999}, format="json").status_code,
+                         status.HTTP_404_NOT_FOUND)
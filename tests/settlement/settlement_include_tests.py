@@ -0,0 +1,64 @@
+import json
+from rest_framework import status
+from rest_framework.test import APITestCase
+from kingdomdeathapi.models import Player
+from rest_framework.authtoken.models import Token
+
+
+class SettlementIncludeTests(APITestCase):
+
+    fixtures = ['users', 'tokens', 'players', 'expansion_types', 'monsters', 'settlements', 'resource_types', 'resources',
+                'milestone_types', 'milestones', 'events', 'settlement_inventories', 'settlement_events']
+
+    def setUp(self):
+        # Try to retrieve the first existing Player object
+        self.player = Player.objects.first()
+        # Create a Token for the user if it doesn't exist
+        token, created = Token.objects.get_or_create(user=self.player.user)
+        # Set the client's credentials using the Token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+
+    def test_get_settlement_with_includes(self):
+        """
+        Ensure included relations are nested in the settlement and loaded without per-row queries
+        """
+        url = "/settlements/2?include=inventory.resource.type,achieved_milestone.milestone_type,event.event"
+
+        # Token, settlement with game master, then one query per prefetched relation
+        with self.assertNumQueries(6):
+            response = self.client.get(url)
+
+        json_response = json.loads(response.content)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(json_response["name"], "Rocksville")
+
+        inventory = json_response["inventory"][0]
+        self.assertEqual(inventory["settlement"], 2)
+        self.assertEqual(inventory["resource"]["id"], 13)
+        self.assertEqual(inventory["resource"]["type"][0].keys(), {"id", "name"})
+
+        milestone = json_response["achieved_milestone"][0]
+        self.assertEqual(milestone["milestone_type"], {"id": 1, "type": "First Child Born"})
+        self.assertEqual(json_response["event"][0]["event"]["name"], "Acid Storm")
+
+    def test_list_settlements_with_includes(self):
+        """
+        Ensure includes are applied to every settlement in a list
+        """
+        response = self.client.get("/settlements?include=event")
+        json_response = json.loads(response.content)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        for settlement in json_response:
+            self.assertIn("event", settlement)
+
+    def test_include_unknown_relation(self):
+        """
+        Ensure an include path that is not a relation is rejected
+        """
+        response = self.client.get("/settlements/2?include=inventory.amount")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get("/settlements/2?include=game_master.user")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,74 @@
+import json
+import random
+from itertools import combinations
+from rest_framework import status
+from rest_framework.test import APITestCase
+from kingdomdeathapi.models import Player
+from kingdomdeathapi.utils import best_parties
+from rest_framework.authtoken.models import Token
+
+
+class SettlementPartyTests(APITestCase):
+
+    fixtures = ['users', 'tokens', 'players', 'expansion_types', 'monsters', 'settlements', 'weapon_proficiencies',
+                'fighting_arts', 'disorders', 'abilities', 'survivors', 'sessions']
+
+    def setUp(self):
+        # Try to retrieve the first existing Player object
+        self.player = Player.objects.first()
+        # Create a Token for the user if it doesn't exist
+        token, created = Token.objects.get_or_create(user=self.player.user)
+        # Set the client's credentials using the Token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+
+    def test_best_parties_matches_exhaustive_search(self):
+        """
+        Ensure the pruned search finds the same top parties as scoring every party
+        """
+        rng = random.Random(7)
+        members = [{'id': i, 'score': rng.uniform(-1, 3), 'weapons': frozenset(rng.sample(range(6), rng.randint(0, 2)))}
+                   for i in range(18)]
+
+        found, scored = best_parties(members, 4, 5)
+
+        expected = sorted((sum(m['score'] for m in party) + 0.25 * len(frozenset().union(*(m['weapons'] for m in party)))
+                           for party in combinations(members, 4)), reverse=True)[:5]
+        self.assertEqual([round(score, 9) for score, _ in found], [round(score, 9) for score in expected])
+        self.assertLess(scored, len(list(combinations(members, 4))))
+
+    def test_best_party(self):
+        """
+        Ensure the best parties are picked from the survivors of the settlement's players
+        """
+        response = self.client.get("/settlements/2/best_party?k=2")
+        json_response = json.loads(response.content)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(json_response['candidates'], 6)
+        self.assertEqual(len(json_response['parties']), 2)
+        self.assertGreaterEqual(json_response['parties'][0]['score'], json_response['parties'][1]['score'])
+        for party in json_response['parties']:
+            self.assertEqual(len(party['survivors']), 4)
+            self.assertTrue({survivor['id'] for survivor in party['survivors']} <= {1, 2, 3, 5, 6, 7})
+
+    def test_best_party_simulated(self):
+        """
+        Ensure parties are ranked by win rate when simulated, excluding survivors staying home
+        """
+        response = self.client.get("/settlements/2/best_party?size=2&k=3&monster=1&runs=200&seed=3&exclude=1,2")
+        json_response = json.loads(response.content)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(json_response['monster']['name'], 'White Lion')
+        self.assertEqual(json_response['candidates'], 4)
+        rates = [party['win_rate'] for party in json_response['parties']]
+        self.assertEqual(rates, sorted(rates, reverse=True))
+
+    def test_best_party_invalid(self):
+        """
+        Ensure invalid parameters and missing settlements are rejected
+        """
+        self.assertEqual(self.client.get("/settlements/2/best_party?size=5").status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get("/settlements/2/best_party?k=x").status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get("/settlements/999/best_party").status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(self.client.get("/settlements/2/best_party?monster=999").status_code, status.HTTP_404_NOT_FOUND)
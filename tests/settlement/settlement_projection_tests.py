@@ -0,0 +1,113 @@
+import json
+import time
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.test import APITransactionTestCase
+from kingdomdeathapi.models import Player, Projection
+from kingdomdeathapi.utils import project_chunk
+from rest_framework.authtoken.models import Token
+
+
+class SettlementProjectionTests(APITransactionTestCase):
+    # Projections are recorded by a thread with its own connection, which only sees committed rows
+
+    fixtures = ['users', 'tokens', 'players', 'expansion_types', 'campaign', 'events', 'monsters', 'settlements',
+                'resource_types', 'resources', 'settlement_inventories', 'settlement_events', 'milestone_types', 'milestones']
+
+    def setUp(self):
+        # Try to retrieve the first existing Player object
+        self.player = Player.objects.first()
+        # Create a Token for the user if it doesn't exist
+        token, created = Token.objects.get_or_create(user=self.player.user)
+        # Set the client's credentials using the Token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+
+    def wait_for(self, url):
+        for _ in range(300):
+            response = self.client.get(url)
+            if response.status_code != status.HTTP_202_ACCEPTED:
+                return response
+            time.sleep(0.1)
+        self.fail("The projection did not finish")
+
+    def test_project_chunk(self):
+        """
+        Ensure a settlement that never hunts or has children keeps its population and spends its resources
+        """
+        strategy = {'hunts': 0, 'party_size': 4, 'death_rate': 0.1, 'win_rate': 0.7, 'drops': 4, 'intimacy': 0,
+                    'birth_rate': 0.5, 'spend': 1}
+        counts = project_chunk({'population': 6, 'survival_limit': 1, 'inventory': {1: 3}, 'milestones': []},
+                               strategy, 5, 20, 1)
+
+        self.assertEqual(counts['population'][4], {6: 20})
+        self.assertEqual([year[0] for year in counts['stockpiles']], [{2: 20}, {1: 20}, {0: 20}, {0: 20}, {0: 20}])
+        self.assertEqual(counts['limits'], [20] * 5)
+
+    def test_projection(self):
+        """
+        Ensure a projection is accepted straight away and its yearly distributions can be fetched once done
+        """
+        response = self.client.post("/settlements/1/projections",
+                                    {"years": 3, "runs": 200, "seed": 5, "strategy": {"intimacy": 2}}, format="json")
+        json_response = json.loads(response.content)
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+
+        response = self.wait_for(json_response['url'])
+        json_response = json.loads(response.content)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(json_response['status'], 'done')
+        self.assertEqual(json_response['runs'], 200)
+        self.assertEqual(len(json_response['years']), 3)
+        year = json_response['years'][0]
+        self.assertLessEqual(year['population']['p10'], year['population']['p50'])
+        self.assertLessEqual(year['population']['p50'], year['population']['p90'])
+        self.assertGreaterEqual(year['extinct'], 0)
+
+    @override_settings(PROJECTION_CHUNK_SIZE=50)
+    def test_projection_polled_again(self):
+        """
+        Ensure a finished projection split into several chunks reports the same results every time it is fetched
+        """
+        response = self.client.post("/settlements/1/projections", {"years": 2, "runs": 200, "seed": 3}, format="json")
+        url = json.loads(response.content)['url']
+
+        first = json.loads(self.wait_for(url).content)
+        second = json.loads(self.client.get(url).content)
+
+        self.assertEqual(first['runs'], 200)
+        self.assertEqual(second, first)
+
+    def test_projection_invalid(self):
+        """
+        Ensure invalid projections are rejected and other players cannot fetch a projection
+        """
+        self.assertEqual(self.client.post("/settlements/1/projections", {"strategy": {"luck": 1}}, format="json").status_code,
+                         status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.post("/settlements/1/projections", {"strategy": {"death_rate": 2}}, format="json").status_code,
+                         status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.post("/settlements/1/projections", {"years": 0}, format="json").status_code,
+                         status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.post("/settlements/1/projections", [], format="json").status_code,
+                         status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.post("/settlements/999/projections", {}, format="json").status_code,
+                         status.HTTP_404_NOT_FOUND)
+        self.assertEqual(self.client.get("/projections/unknown").status_code, status.HTTP_404_NOT_FOUND)
+
+        response = self.client.post("/settlements/1/projections", {"years": 1, "runs": 10}, format="json")
+        url = json.loads(response.content)['url']
+        other = Token.objects.get_or_create(user=Player.objects.get(pk=2).user)[0]
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {other.key}")
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_projection_shared(self):
+        """
+        Ensure a projection is kept in the database, where any process can report on it
+        """
+        response = self.client.post("/settlements/1/projections", {"years": 2, "runs": 50, "seed": 3}, format="json")
+        job_id = json.loads(response.content)['id']
+        self.wait_for(f"/projections/{job_id}")
+
+        projection = Projection.objects.get(pk=job_id)
+        self.assertEqual(projection.status, 'done')
+        self.assertEqual(projection.result['runs'], 50)
@@ -0,0 +1,95 @@
+import json
+from io import StringIO
+from django.core.management import CommandError, call_command
+from rest_framework import status
+from rest_framework.test import APITestCase
+from kingdomdeathapi.models import Player, Resource, Settlement, SettlementInventory, SettlementResourceTotal
+from kingdomdeathapi.utils import add_to_inventory, check_resource_totals, expected_resource_totals
+from rest_framework.authtoken.models import Token
+
+
+class SettlementResourceTotalTests(APITestCase):
+
+    fixtures = ['users', 'tokens', 'players', 'expansion_types', 'monsters', 'settlements', 'resource_types', 'resources',
+                'settlement_inventories']
+
+    def setUp(self):
+        # Try to retrieve the first existing Player object
+        self.player = Player.objects.first()
+        # Create a Token for the user if it doesn't exist
+        token, created = Token.objects.get_or_create(user=self.player.user)
+        # Set the client's credentials using the Token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+
+    def test_totals_follow_inventory(self):
+        """
+        Ensure resource type totals stay in step through saves, bulk writes, deletes and retyping
+        """
+        # Fixture loads go through the save signals too
+        self.assertTrue(SettlementResourceTotal.objects.filter(settlement=1).exists())
+        self.assertEqual(check_resource_totals(), [])
+
+        inventory = SettlementInventory.objects.get(pk=23)
+        inventory.amount = 4
+        inventory.save()
+        inventory.resource_id = 30
+        inventory.save()
+        self.assertEqual(check_resource_totals(), [])
+
+        add_to_inventory(1, {26: 3, 30: -1})
+        SettlementInventory.objects.create(settlement_id=8, resource_id=31, amount=2)
+        SettlementInventory.objects.get(pk=24).delete()
+        self.assertEqual(check_resource_totals(), [])
+
+        Resource.objects.get(pk=30).type.clear()
+        self.assertEqual(check_resource_totals(), [])
+
+        Settlement.objects.get(pk=8).delete()
+        self.assertFalse(SettlementResourceTotal.objects.filter(settlement=8).exists())
+        self.assertEqual(check_resource_totals(), [])
+
+    def test_totals_follow_deleted_resource(self):
+        """
+        Ensure deleting a resource takes it off the totals of every settlement that held it
+        """
+        response = self.client.delete("/resources/1")
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(check_resource_totals(), [])
+
+    def test_missing_total_taken_from(self):
+        """
+        Ensure taking from a total that has gone missing rebuilds the settlement's totals rather than skipping it
+        """
+        SettlementResourceTotal.objects.filter(settlement=11).delete()
+
+        add_to_inventory(11, {1: -2})
+
+        self.assertEqual(check_resource_totals(), [])
+
+    def test_resource_totals(self):
+        """
+        Ensure a settlement's totals are served per resource type
+        """
+        response = self.client.get("/settlements/11/resource_totals")
+        json_response = json.loads(response.content)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(json_response)
+        expected = {resource_type: total for (settlement, resource_type), total in expected_resource_totals([11]).items()}
+        self.assertEqual({row['type']['id']: row['total'] for row in json_response}, expected)
+        self.assertEqual(self.client.get("/settlements/999/resource_totals").status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_commands(self):
+        """
+        Ensure the checker reports totals out of step and the rebuild puts them right
+        """
+        SettlementResourceTotal.objects.filter(settlement=11).update(total=99)
+
+        with self.assertRaises(CommandError):
+            call_command('check_resource_totals', stdout=StringIO())
+        call_command('rebuild_resource_totals', '--settlement', '11', stdout=StringIO())
+        out = StringIO()
+        call_command('check_resource_totals', stdout=out)
+
+        self.assertIn('in step', out.getvalue())
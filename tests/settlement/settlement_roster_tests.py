@@ -0,0 +1,58 @@
+import json
+from rest_framework import status
+from rest_framework.test import APITestCase
+from kingdomdeathapi.models import Player, Survivor
+from rest_framework.authtoken.models import Token
+
+
+class SettlementRosterTests(APITestCase):
+
+    fixtures = ['users', 'tokens', 'players', 'expansion_types', 'settlements', 'weapon_proficiencies', 'fighting_arts',
+                'disorders', 'abilities', 'survivors', 'sessions']
+
+    def setUp(self):
+        # Try to retrieve the first existing Player object
+        self.player = Player.objects.first()
+        # Create a Token for the user if it doesn't exist
+        token, created = Token.objects.get_or_create(user=self.player.user)
+        # Set the client's credentials using the Token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+
+    def test_roster(self):
+        """
+        Ensure the roster's derived stats are returned a column at a time
+        """
+        Survivor.objects.filter(pk=2).update(insanity=4, body_heavy_wound=True, arm_light_wound=True, leg_light_wound=True)
+
+        with self.assertNumQueries(3):
+            response = self.client.get("/settlements/1/roster")
+        json_response = json.loads(response.content)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        columns = json_response['columns']
+        self.assertEqual(json_response['count'], 3)
+        self.assertEqual(columns['id'], [1, 2, 4])
+        self.assertTrue(all(len(column) == 3 for column in columns.values()))
+
+        for index, pk in enumerate(columns['id']):
+            survivor = Survivor.objects.get(pk=pk)
+            self.assertEqual(columns['total_armor'][index], survivor.head_armor + survivor.arm_armor + survivor.body_armor
+                             + survivor.waist_armor + survivor.leg_armor)
+            self.assertEqual(columns['disorders'][index], survivor.disorder.count())
+            self.assertEqual(columns['fighting_arts'][index], survivor.fighting_art.count())
+
+        self.assertEqual(columns['light_wounds'][1], 2)
+        self.assertEqual(columns['heavy_wounds'][1], 1)
+        self.assertFalse(columns['can_hunt'][1])
+        self.assertTrue(columns['insane'][1])
+
+    def test_roster_empty(self):
+        """
+        Ensure a settlement without survivors has empty columns, and a missing settlement is not found
+        """
+        Survivor.objects.all().delete()
+        response = self.client.get("/settlements/1/roster")
+
+        self.assertEqual(json.loads(response.content)['count'], 0)
+        self.assertEqual(json.loads(response.content)['columns']['can_hunt'], [])
+        self.assertEqual(self.client.get("/settlements/999/roster").status_code, status.HTTP_404_NOT_FOUND)
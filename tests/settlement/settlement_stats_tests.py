@@ -0,0 +1,53 @@
+import json
+from rest_framework import status
+from rest_framework.test import APITestCase
+from kingdomdeathapi.models import Player, Survivor
+from rest_framework.authtoken.models import Token
+
+
+class SettlementStatsTests(APITestCase):
+
+    fixtures = ['users', 'tokens', 'players', 'expansion_types', 'events', 'monsters', 'settlements', 'resource_types',
+                'resources', 'settlement_inventories', 'settlement_events', 'milestone_types', 'milestones',
+                'weapon_proficiencies', 'fighting_arts', 'disorders', 'abilities', 'survivors', 'sessions']
+
+    def setUp(self):
+        # Try to retrieve the first existing Player object
+        self.player = Player.objects.first()
+        # Create a Token for the user if it doesn't exist
+        token, created = Token.objects.get_or_create(user=self.player.user)
+        # Set the client's credentials using the Token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+
+    def test_stats(self):
+        """
+        Ensure a settlement's figures are aggregated with a query per group
+        """
+        # The token and settlement, then survivors, inventory, inventory by type, milestones and events
+        with self.assertNumQueries(7):
+            response = self.client.get("/settlements/2/stats")
+        json_response = json.loads(response.content)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        survivors = Survivor.objects.filter(pk__in=[1, 2, 3, 5, 6, 7])
+        self.assertEqual(json_response['survivors']['count'], 6)
+        self.assertEqual(json_response['survivors']['attributes']['strength']['max'], max(s.strength for s in survivors))
+        self.assertAlmostEqual(json_response['survivors']['attributes']['luck']['mean'], sum(s.luck for s in survivors) / 6)
+        self.assertEqual(json_response['inventory']['total'], 2)
+        self.assertEqual(json_response['inventory']['resources'], 1)
+        self.assertTrue(all(row['total'] == 2 for row in json_response['inventory']['types']))
+        # Population Reaches 15 is recorded twice, but only counts once
+        self.assertEqual(json_response['milestones'], {'achieved': 2, 'total': 4, 'ratio': 0.5})
+        self.assertEqual(json_response['events_per_year'], [{'year': 1, 'events': 1}])
+
+    def test_stats_empty(self):
+        """
+        Ensure a settlement without any data has zero figures, and a missing settlement is not found
+        """
+        response = self.client.get("/settlements/3/stats")
+        json_response = json.loads(response.content)
+
+        self.assertEqual(json_response['inventory']['total'], 0)
+        self.assertEqual(json_response['milestones']['ratio'], 0.0)
+        self.assertEqual(json_response['events_per_year'], [])
+        self.assertEqual(self.client.get("/settlements/999/stats").status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,116 @@
+import json
+from rest_framework import status
+from rest_framework.test import APITestCase
+from kingdomdeathapi.models import Milestone, Player, Settlement, SettlementEvent, SettlementInventory, Survivor
+from kingdomdeathapi.utils import InventoryError, TurnError, add_to_inventory, apply_turn, validate_turn
+from rest_framework.authtoken.models import Token
+
+
+class SettlementTurnTests(APITestCase):
+
+    fixtures = ['users', 'tokens', 'players', 'expansion_types', 'campaign', 'events', 'monsters', 'settlements',
+                'resource_types', 'resources', 'settlement_inventories', 'settlement_events', 'milestone_types',
+                'milestones', 'weapon_proficiencies', 'fighting_arts', 'disorders', 'abilities', 'survivors', 'sessions']
+
+    def setUp(self):
+        # Try to retrieve the first existing Player object
+        self.player = Player.objects.first()
+        # Create a Token for the user if it doesn't exist
+        token, created = Token.objects.get_or_create(user=self.player.user)
+        # Set the client's credentials using the Token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+
+    def test_turn(self):
+        """
+        Ensure a whole turn is applied at once and moves the settlement's version on
+        """
+        version = Settlement.objects.get(pk=1).version
+        turn = {
+            "population": 14,
+            "survival_limit": 5,
+            "inventory": {"2": -5, "31": 2},
+            "milestones": [3, 4],
+            "events": [{"event": 3, "year": 11}, {"event": 4, "year": 11}],
+            "survivors": [{"id": 1, "hunt_experience": 4, "arm_light_wound": True}, {"id": 2, "insanity": 3}],
+        }
+        response = self.client.post("/settlements/1/turn", turn, format="json")
+        json_response = json.loads(response.content)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertGreater(json_response['settlement']['version'], version)
+        self.assertEqual(json_response['settlement']['population'], 14)
+        settlement = Settlement.objects.get(pk=1)
+        self.assertEqual((settlement.population, settlement.survival_limit), (14, 5))
+        self.assertEqual(SettlementInventory.objects.get(settlement=1, resource=2).amount, 10)
+        self.assertEqual(SettlementInventory.objects.get(settlement=1, resource=31).amount, 2)
+        self.assertTrue(Milestone.objects.get(settlement=1, milestone_type=4).achieved)
+        self.assertEqual(SettlementEvent.objects.filter(settlement=1, year=11).count(), 2)
+        survivor = Survivor.objects.get(pk=1)
+        self.assertEqual((survivor.hunt_experience, survivor.arm_light_wound), (4, True))
+        self.assertEqual(Survivor.objects.get(pk=2).insanity, 3)
+
+    def test_turn_takes_across_rows(self):
+        """
+        Ensure resources held in several rows are taken from each in turn, so no row goes below 0
+        """
+        extra = SettlementInventory.objects.create(settlement_id=1, resource_id=3, amount=1)
+
+        response = self.client.post("/settlements/1/turn", {"inventory": {"3": -4}}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(SettlementInventory.objects.get(pk=24).amount, 0)
+        self.assertEqual(SettlementInventory.objects.get(pk=extra.pk).amount, 0)
+
+    def test_turn_inventory_taken_meanwhile(self):
+        """
+        Ensure a turn whose resources are taken after it is validated is refused as a whole
+        """
+        settlement = Settlement.objects.get(pk=1)
+        turn = validate_turn(1, {"population": 20, "inventory": {"3": -3}})
+        SettlementInventory.objects.filter(settlement=1, resource=3).update(amount=1)
+
+        with self.assertRaises(TurnError) as raised:
+            apply_turn(settlement, turn)
+
+        self.assertIn('inventory', raised.exception.errors)
+        self.assertEqual(Settlement.objects.get(pk=1).population, 3)
+        self.assertEqual(SettlementInventory.objects.get(settlement=1, resource=3).amount, 1)
+
+    def test_inventory_shortfall(self):
+        """
+        Ensure taking more than a settlement holds is refused and writes nothing, rather than leaving a row below 0
+        """
+        held = {row.pk: row.amount for row in SettlementInventory.objects.filter(settlement=1)}
+
+        with self.assertRaises(InventoryError) as raised:
+            add_to_inventory(1, {3: -4, 2: 1, 999: -2})
+
+        self.assertEqual(raised.exception.short, {3: 1, 999: 2})
+        self.assertEqual({row.pk: row.amount for row in SettlementInventory.objects.filter(settlement=1)}, held)
+
+    def test_turn_invalid(self):
+        """
+        Ensure nothing of an invalid turn is applied and every problem is reported
+        """
+        turn = {
+            "population": 20,
+            "inventory": {"2": -50},
+            "milestones": [99],
+            "events": [{"event": 3, "year": 11}],
+            "survivors": [{"id": 7, "insanity": 3}],
+        }
+        response = self.client.post("/settlements/1/turn", turn, format="json")
+        json_response = json.loads(response.content)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(set(json_response['errors']), {'inventory', 'milestones', 'survivors'})
+        self.assertEqual(Settlement.objects.get(pk=1).population, 3)
+        self.assertEqual(SettlementEvent.objects.filter(settlement=1, year=11).count(), 0)
+
+        response = self.client.post("/settlements/1/turn", {"survivors": [{"id": 1, "luck": "lots"}], "weather": 1},
+                                    format="json")
+        self.assertEqual(set(json.loads(response.content)['errors']), {'turn', 'survivors'})
+        response = self.client.post("/settlements/1/turn", {"events": [{"event": "3", "year": 11.5}], "milestones": [True]},
+                                    format="json")
+        self.assertEqual(set(json.loads(response.content)['errors']), {'events', 'milestones'})
+        self.assertEqual(self.client.post("/settlements/999/turn", {}, format="json").status_code, status.HTTP_404_NOT_FOUND)
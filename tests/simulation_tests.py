@@ -0,0 +1,83 @@
+import json
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.test import APITestCase
+from kingdomdeathapi.models import Player
+from kingdomdeathapi.utils.showdown import _worker_pool
+from rest_framework.authtoken.models import Token
+
+
+class SimulationTests(APITestCase):
+
+    fixtures = ['users', 'tokens', 'players', 'expansion_types', 'monsters', 'weapon_proficiencies', 'fighting_arts',
+                'disorders', 'abilities', 'survivors']
+
+    def setUp(self):
+        # Try to retrieve the first existing Player object
+        self.player = Player.objects.first()
+        # Create a Token for the user if it doesn't exist
+        token, created = Token.objects.get_or_create(user=self.player.user)
+        # Set the client's credentials using the Token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+
+    def simulate(self, **data):
+        return self.client.post("/simulations/showdown", {"survivors": [1, 2, 3, 4], "monster": 1, **data}, format="json")
+
+    def test_simulate_showdown(self):
+        """
+        Ensure a simulation reports win and death rates for the party, reproducibly for a seed
+        """
+        response = self.simulate(runs=500, seed=7)
+        json_response = json.loads(response.content)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(json_response["monster"]["name"], "White Lion")
+        self.assertEqual(json_response["runs"], 500)
+        self.assertTrue(0 <= json_response["win_rate"] <= 1)
+        self.assertAlmostEqual(sum(json_response["deaths"].values()), 1)
+        self.assertEqual([survivor["id"] for survivor in json_response["survivors"]], [1, 2, 3, 4])
+        self.assertEqual(json_response["survivors"][0]["injuries"].keys(), {"head", "arm", "body", "waist", "leg"})
+
+        self.assertEqual(json.loads(self.simulate(runs=500, seed=7).content), json_response)
+
+    def test_harder_monsters(self):
+        """
+        Ensure higher levels and nemeses are harder to beat
+        """
+        easy = json.loads(self.simulate(runs=1000, seed=1).content)["win_rate"]
+        hard = json.loads(self.simulate(runs=1000, seed=1, level=3).content)["win_rate"]
+        self.assertGreater(easy, hard)
+
+    @override_settings(SIMULATION_WORKERS=2, SIMULATION_CHUNK_SIZE=100)
+    def test_simulate_in_workers(self):
+        """
+        Ensure large simulations are split across worker processes and merged
+        """
+        json_response = json.loads(self.simulate(runs=400, seed=3).content)
+        self.assertEqual(json_response["runs"], 400)
+        self.assertEqual(json.loads(self.simulate(runs=400, seed=3).content), json_response)
+
+    @override_settings(SIMULATION_WORKERS=2, SIMULATION_CHUNK_SIZE=100)
+    def test_simulate_after_worker_dies(self):
+        """
+        Ensure a pool broken by a worker dying is replaced rather than failing every later simulation
+        """
+        json_response = json.loads(self.simulate(runs=400, seed=3).content)
+        pool = _worker_pool(2)
+        for process in list(pool._processes.values()):  # pylint: disable=protected-access
+            process.kill()
+            process.join()
+
+        response = self.simulate(runs=400, seed=3)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(json.loads(response.content), json_response)
+        self.assertIsNot(_worker_pool(2), pool)
+
+    def test_simulate_invalid(self):
+        """
+        Ensure invalid parties and unknown survivors or monsters are rejected
+        """
+        self.assertEqual(self.client.post("/simulations/showdown", {"survivors": [1, 2, 3, 4, 5], "monster": 1},
+                                          format="json").status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.simulate(level=4).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.simulate(monster=999).status_code, status.HTTP_404_NOT_FOUND)
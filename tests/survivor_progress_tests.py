@@ -0,0 +1,75 @@
+import json
+from rest_framework import status
+from rest_framework.test import APITestCase
+from kingdomdeathapi.models import Player, ProficiencyLevel, Survivor
+from rest_framework.authtoken.models import Token
+
+
+class SurvivorProgressTests(APITestCase):
+
+    fixtures = ['users', 'tokens', 'players', 'expansion_types', 'weapon_proficiencies', 'fighting_arts', 'disorders',
+                'abilities', 'survivors', 'proficiency_levels']
+
+    def setUp(self):
+        # Try to retrieve the first existing Player object
+        self.player = Player.objects.first()
+        # Create a Token for the user if it doesn't exist
+        token, created = Token.objects.get_or_create(user=self.player.user)
+        # Set the client's credentials using the Token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+
+    def test_progress(self):
+        """
+        Ensure a showdown's progression is applied to every survivor and their proficiency levels at once
+        """
+        experience = {survivor.pk: survivor.hunt_experience for survivor in Survivor.objects.filter(pk__in=[1, 2])}
+        progress = {"survivors": [
+            {"id": 1, "hunt_experience": 1, "proficiency": {"1": 2, "3": 1}, "clear_wounds": True},
+            {"id": 2, "hunt_experience": 2, "wounds": {"leg_heavy_wound": True}},
+        ]}
+
+        # The token, survivors and weapons, then one write per kind of row and a change log lookup per survivor
+        with self.assertNumQueries(11):
+            response = self.client.post("/survivors/progress", progress, format="json")
+        json_response = json.loads(response.content)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(Survivor.objects.get(pk=1).hunt_experience, experience[1] + 1)
+        self.assertFalse(Survivor.objects.get(pk=1).arm_light_wound)
+        self.assertTrue(Survivor.objects.get(pk=2).leg_heavy_wound)
+        self.assertEqual(ProficiencyLevel.objects.get(survivor=1, weapon_type=1).level, 3)
+        self.assertEqual(ProficiencyLevel.objects.get(survivor=1, weapon_type=3).level, 1)
+        self.assertEqual(len(json_response['proficiency_levels']), 2)
+
+    def test_progress_invalid(self):
+        """
+        Ensure nothing of an invalid progression is applied
+        """
+        progress = {"survivors": [{"id": 1, "hunt_experience": 1}, {"id": 999}, {"id": 2, "proficiency": {"99": 1}}]}
+        response = self.client.post("/survivors/progress", progress, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(set(json.loads(response.content)['errors']), {'999', 'proficiency'})
+        self.assertEqual(self.client.post("/survivors/progress", {"survivors": [{"id": 1, "wounds": {"luck": True}}]},
+                                          format="json").status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.post("/survivors/progress", [{"id": 1}], format="json").status_code,
+                         status.HTTP_400_BAD_REQUEST)
+        response = self.client.post("/survivors/progress", {"survivors": [{"id": 1, "clear_wounds": "false"}]}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(json.loads(response.content)['errors'], {'1': 'clear_wounds must be true or false'})
+
+    def test_proficiency_levels(self):
+        """
+        Ensure proficiency levels can be listed by survivor and retrieved
+        """
+        response = self.client.get("/proficiency_levels?survivor=1")
+        json_response = json.loads(response.content)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(json_response), 1)
+        self.assertEqual(json_response[0]['weapon_type']['id'], 1)
+        self.assertEqual(json_response[0]['level'], 1)
+
+        response = self.client.get("/proficiency_levels/1")
+        self.assertEqual(json.loads(response.content)['survivor'], 1)
+        self.assertEqual(self.client.get("/proficiency_levels/999").status_code, status.HTTP_404_NOT_FOUND)